@@ -0,0 +1,320 @@
+const CONFIG={projectsPath:'data/projetos.json',certsPath:'data/certificados.json',diplomasPath:'data/diplomas.json',relacionadosPath:'data/relacionados.json',facetasPath:'data/facetas.json',cacheTime:60000,maxRetries:3};function debounce(func,wait){let timeout;return function executedFunction(...args){const later=()=>{clearTimeout(timeout);func(...args);};clearTimeout(timeout);timeout=setTimeout(later,wait);};}
+function escapeHTML(str){const div=document.createElement('div');div.textContent=str;return div.innerHTML;}
+function setYear(){const yearElement=document.getElementById('year');if(yearElement){yearElement.textContent=new Date().getFullYear();}}
+function getCurrentPage(){const path=location.pathname.split('/').pop()||'index.html';return path.toLowerCase();}
+function setTopbar(){const topbarElement=document.getElementById('topbar');if(!topbarElement)return;const currentPage=getCurrentPage();const menuHTML=(currentPage==='index.html')?`
+      <div class="menu">
+        <a href="index.html#inicio" aria-label="Ir para o início">Início</a>
+
+        <a href="index.html#sobre" aria-label="Ir para seção sobre">
+          Sobre
+        </a>
+
+        <a href="index.html#projetos" aria-label="Ir para seção de projetos">
+          Projetos
+        </a>
+
+        <a href="index.html#diplomas" aria-label="Ir para seção de diplomas">
+          Diplomas
+        </a>
+
+        <a href="index.html#certificados" aria-label="Ir para seção de certificados">
+          Certificados
+        </a>
+      </div>
+    `:`
+      <div class="menu">
+        <a href="index.html"
+           class="active back-home"
+           aria-label="Voltar para a página inicial">
+          ← Voltar ao início
+        </a>
+      </div>
+    `;const navHTML=`
+    <nav class="nav" role="navigation" aria-label="Navegação principal">
+      <div class="brand">
+        <img
+          src="assets/img/avatares/avatar.jpeg"
+          alt="Foto de perfil de Guilherme Corrêa"
+          class="avatar"
+          loading="lazy"
+        />
+
+        <span>
+          Guilherme <b>Corrêa</b>
+
+          <a class="btn small primary"
+             href="https://www.linkedin.com/in/guilherme-corr%C3%AAa-893781169/"
+             target="_blank"
+             rel="noopener">
+            LinkedIn
+          </a>
+
+          <a class="btn small ghost"
+             href="https://github.com/guicorrea93"
+             target="_blank"
+             rel="noopener">
+            GitHub
+          </a>
+
+          <a class="btn small ghost"
+             href="mailto:guilherme93_correa@hotmail.com">
+            Email
+          </a>
+        </span>
+      </div>
+
+      ${menuHTML}
+    </nav>
+  `;topbarElement.innerHTML=navHTML;}
+function initSmoothScroll(){if(!('scrollBehavior'in document.documentElement.style)){document.querySelectorAll('a[href^="#"]').forEach(anchor=>{anchor.addEventListener('click',function(e){const targetId=this.getAttribute('href').substring(1);const targetElement=document.getElementById(targetId);if(targetElement){e.preventDefault();targetElement.scrollIntoView({behavior:'smooth',block:'start'});}});});}}
+function initScrollSpy(){if(getCurrentPage()!=='index.html')return;const links=Array.from(document.querySelectorAll('.menu a[href*="#"]'));if(!links.length)return;const ids=links.map(a=>(a.hash||'').replace('#','')).filter(Boolean);const sections=ids.map(id=>document.getElementById(id)).filter(Boolean);if(!sections.length)return;const setActive=(id)=>{links.forEach(a=>{const isThis=a.hash===`#${id}`;a.classList.toggle('active',isThis);if(isThis)a.setAttribute('aria-current','page');else a.removeAttribute('aria-current');});};setActive((location.hash||'#inicio').replace('#',''));let ticking=false;const onScroll=()=>{if(ticking)return;ticking=true;requestAnimationFrame(()=>{ticking=false;const refY=window.scrollY+140;let currentId=sections[0].id;for(const sec of sections){if(sec.offsetTop<=refY)currentId=sec.id;}
+setActive(currentId);});};window.addEventListener('scroll',onScroll,{passive:true});window.addEventListener('resize',onScroll);window.addEventListener('hashchange',()=>{setActive((location.hash||'#inicio').replace('#',''));});onScroll();}
+function showLoading(element,message='Carregando...'){if(!element||isPrerendered(element))return;element.innerHTML=`
+    <div class="card" style="text-align: center; padding: 2rem;">
+      <div class="card-title" style="color: var(--text-2);">
+        ${escapeHTML(message)}
+      </div>
+      <div style="margin-top: 1rem;">
+        <div style="display: inline-block; width: 2rem; height: 2rem; border: 3px solid var(--border); border-top-color: var(--accent); border-radius: 50%; animation: spin 0.8s linear infinite;"></div>
+      </div>
+    </div>
+  `;if(!document.getElementById('spin-animation')){const style=document.createElement('style');style.id='spin-animation';style.textContent=`
+      @keyframes spin {
+        to { transform: rotate(360deg); }
+      }
+    `;document.head.appendChild(style);}}
+function showError(element,errorMessage,details=''){if(!element||isPrerendered(element))return;element.innerHTML=`
+    <div class="card" style="border-color: rgba(239, 68, 68, 0.3);">
+      <div class="card-title" style="color: #EF4444;">
+        ⚠️ ${escapeHTML(errorMessage)}
+      </div>
+      <div class="card-sub muted">
+        ${escapeHTML(details)}
+      </div>
+      <div style="margin-top: 1rem;">
+        <button class="btn small primary" onclick="location.reload()">
+          Tentar novamente
+        </button>
+      </div>
+    </div>
+  `;}
+function isPrerendered(element){return element?.dataset.prerendered==='true';}
+function hydratePrerendered(container,items,idAttr,onOpen){if(!isPrerendered(container))return false;const cards=container.querySelectorAll(`[${idAttr}]`);const byId=new Map(items.map(item=>[String(item.id),item]));delete container.dataset.prerendered;if(cards.length!==items.length||![...cards].every(card=>byId.has(card.getAttribute(idAttr)))){return false;}
+cards.forEach(card=>{const item=byId.get(card.getAttribute(idAttr));card.addEventListener('click',()=>onOpen(item));});return true;}
+const cache=new Map();async function fetchWithRetry(url,options={},retries=CONFIG.maxRetries){const cacheKey=url;const cached=cache.get(cacheKey);if(cached&&(Date.now()-cached.timestamp<CONFIG.cacheTime)){return cached.data;}
+for(let i=0;i<retries;i++){try{const response=await fetch(url,{...options,cache:'no-store',headers:{'Content-Type':'application/json',...options.headers}});if(!response.ok){throw new Error(`HTTP ${response.status}: ${response.statusText}`);}
+const data=await response.json();cache.set(cacheKey,{data,timestamp:Date.now()});return data;}catch(error){console.warn(`Tentativa ${i + 1}/${retries} falhou:`,error.message);if(i===retries-1){throw error;}
+await new Promise(resolve=>setTimeout(resolve,1000*(i+1)));}}}
+function announceToScreenReader(message){const announcement=document.createElement('div');announcement.setAttribute('role','status');announcement.setAttribute('aria-live','polite');announcement.className='sr-only';announcement.textContent=message;document.body.appendChild(announcement);setTimeout(()=>{document.body.removeChild(announcement);},1000);}
+function manageFocus(){const hash=window.location.hash;if(hash){const target=document.querySelector(hash);if(target){target.setAttribute('tabindex','-1');target.focus();target.removeAttribute('tabindex');}}}
+function initLazyLoading(){if('loading'in HTMLImageElement.prototype){const images=document.querySelectorAll('img[loading="lazy"]');images.forEach(img=>{img.src=img.dataset.src||img.src;});}else{const images=document.querySelectorAll('img[loading="lazy"]');const imageObserver=new IntersectionObserver((entries,observer)=>{entries.forEach(entry=>{if(entry.isIntersecting){const img=entry.target;img.src=img.dataset.src||img.src;img.classList.remove('lazy');imageObserver.unobserve(img);}});});images.forEach(img=>imageObserver.observe(img));}}
+function updateHeroScale(){const hero=document.querySelector('.hero');if(!hero)return;const canvas=hero.querySelector('.hero-canvas');if(!canvas)return;if(window.innerWidth<=900){hero.style.removeProperty('--hero-scale');return;}
+const w=hero.clientWidth;const h=hero.clientHeight;const scale=Math.min(w/1536,h/730);hero.style.setProperty('--hero-scale',scale);}function initProjects(){}
+let allCertificates=[];let currentCertificate=null;let certFacets=null;let encerrarZoom=null;async function loadFeaturedCertificates(){const grid=document.getElementById('featuredCertsGrid');if(!grid)return;showLoading(grid,'Carregando certificados em destaque...');try{const certificates=await fetchWithRetry(CONFIG.certsPath);if(!Array.isArray(certificates)){throw new Error('Formato de dados inválido');}
+allCertificates=certificates;const featured=certificates.filter(c=>c.destaque===true);const toShow=featured.length?featured:certificates.slice(0,3);if(!hydratePrerendered(grid,toShow,'data-cert-id',openCertificateModal)){renderFeaturedCertificates(toShow,grid);}}catch(error){console.error('Erro ao carregar certificados em destaque:',error);showError(grid,'Erro ao carregar certificados',`Detalhes: ${error.message}`);}}
+function renderFeaturedCertificates(certificates,container){const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');certificates.forEach(cert=>{tempDiv.innerHTML=createFeaturedCertCard(cert);const card=tempDiv.firstElementChild;card.addEventListener('click',()=>openCertificateModal(cert));fragment.appendChild(card);});container.innerHTML='';container.appendChild(fragment);animateCertCards(container);}
+function createFeaturedCertCard(cert){const{id,titulo,instituicao,ano,categoria,tipo,descricao,thumbnail,mosaico,duracao,destaque,certificados=[]}=cert;const cardClass=tipo==='diploma'?'featured-cert-card cert-card-diploma':tipo==='repositório'?'featured-cert-card cert-card-repo':'featured-cert-card';const badge=destaque?'<span class="cert-badge">★ Destaque</span>':'';const certCount=(tipo==='Formação'&&certificados.length>0)?`<span class="cert-count-badge">${certificados.length} certificados</span>`:'';return`
+    <article class="${cardClass}" data-cert-id="${id}">
+      ${badge}
+      ${certCount}
+      <img 
+        src="${
+          mosaico || (tipo === 'Formação'
+            ? (certificados?.find(c => c.isFormacao)?.preview || thumbnail)
+            : thumbnail
+          ) || 'assets/img/certificados/placeholder-cert.png'
+        }"
+        alt="Preview de ${escapeHTML(titulo)}" 
+        class="featured-cert-thumb"
+        loading="lazy"
+      />
+      <div class="featured-cert-body">
+        <div class="featured-cert-header">
+          <h3 class="featured-cert-title">${escapeHTML(titulo)}</h3>
+          <div class="cert-meta">
+            <span class="cert-meta-item">
+              <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+                <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+              </svg>
+              ${escapeHTML(instituicao)}
+            </span>
+            ${duracao ? `
+              <span class="cert-meta-item">
+                <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                  <path d="M8 14C11.3137 14 14 11.3137 14 8C14 4.68629 11.3137 2 8 2C4.68629 2 2 4.68629 2 8C2 11.3137 4.68629 14 8 14Z" stroke="currentColor" stroke-width="1.5"/>
+                  <path d="M8 5V8L10 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                </svg>
+                ${escapeHTML(duracao)}
+              </span>
+            ` : ''}
+            ${ano ? `
+              <span class="cert-meta-item">
+                <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                  <path d="M8 2V8L11 11" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                  <circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.5"/>
+                </svg>
+                ${escapeHTML(ano)}
+              </span>
+            ` : ''}
+          </div>
+        </div>
+        <p class="featured-cert-desc">${escapeHTML(descricao)}</p>
+        <div class="featured-cert-footer">
+          <span class="featured-cert-category">${escapeHTML(categoria)}</span>
+          <span class="featured-cert-link">
+            Ver detalhes
+            <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+              <path d="M6 3L11 8L6 13" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+          </span>
+        </div>
+      </div>
+    </article>
+  `;}
+function createCertificateCard(cert){const{id,titulo,instituicao,ano,categoria,tipo,descricao,thumbnail,mosaico,destaque,certificados=[]}=cert;const cardClass=tipo==='diploma'?'cert-card-with-thumb cert-card-diploma':tipo==='repositório'?'cert-card-with-thumb cert-card-repo':'cert-card-with-thumb';const destaqueBadge=destaque?'<span class="tag" style="background: rgba(27, 127, 92, 0.2); border-color: rgba(27, 127, 92, 0.4); color: var(--success);">★ Destaque</span>':'';const certCount=(tipo==='Formação'&&certificados.length>0)?`<span class="tag" style="background: rgba(59, 130, 246, 0.2); border-color: rgba(59, 130, 246, 0.4); color: #3B82F6;">${certificados.length} certificados</span>`:'';return`
+    <article class="${cardClass}" data-cert-id="${id}">
+      <img 
+        src="${
+          mosaico || (tipo === 'Formação'
+            ? (certificados?.find(c => c.isFormacao)?.preview || thumbnail)
+            : thumbnail
+          ) || 'assets/img/certificados/placeholder-cert.png'
+        }"
+        alt="Preview de ${escapeHTML(titulo)}" 
+        class="cert-thumb"
+        loading="lazy"
+      />
+      <div class="cert-card-body">
+        <div class="p-top">
+          <h3 class="p-title">${escapeHTML(titulo)}</h3>
+          <span class="p-type">${escapeHTML(categoria)}</span>
+        </div>
+        <div class="cert-meta" style="margin: 0.5rem 0;">
+          <span class="cert-meta-item">
+            <svg width="14" height="14" viewBox="0 0 16 16" fill="none">
+              <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5"/>
+              <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+            ${escapeHTML(instituicao)}
+          </span>
+          ${ano ? `
+            <span class="cert-meta-item">
+              <svg width="14" height="14" viewBox="0 0 16 16" fill="none">
+                <path d="M8 2V8L11 11" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                <circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.5"/>
+              </svg>
+              ${escapeHTML(ano)}
+            </span>
+          ` : ''}
+        </div>
+        <p class="p-desc">${escapeHTML(descricao)}</p>
+        <div class="tags">
+          ${destaqueBadge}
+          ${certCount}
+          <span class="tag">${escapeHTML(tipo)}</span>
+        </div>
+      </div>
+    </article>
+  `;}
+function animateCertCards(container){setTimeout(()=>{container.querySelectorAll('.featured-cert-card, .cert-card-with-thumb').forEach((card,index)=>{card.style.opacity='0';card.style.transform='translateY(20px)';setTimeout(()=>{card.style.transition='all 0.4s cubic-bezier(0.16, 1, 0.3, 1)';card.style.opacity='1';card.style.transform='translateY(0)';},index*60);});},10);}
+function generateDynamicFilters(certificates,facetas=null){const filtersSection=document.querySelector('.filters');if(!filtersSection)return;let categoryCounts=facetas?facetas.categorias:null;if(!categoryCounts){categoryCounts={};certificates.forEach(cert=>{const categoria=cert.categoria||'Sem Categoria';categoryCounts[categoria]=(categoryCounts[categoria]||0)+1;});}
+const sortedCategories=Object.keys(categoryCounts).sort();const totalCount=facetas?facetas.total:certificates.length;const chipsHTML=[`<button class="chip active" data-filter="all" aria-label="Mostrar todos os certificados">
+      Todos <span style="opacity: 0.7; font-size: 0.75em; margin-left: 4px;">(${totalCount})</span>
+    </button>`,...sortedCategories.map(categoria=>{const count=categoryCounts[categoria];const slug=categoria.toLowerCase().replace(/\s+/g,'-');return`<button class="chip" data-filter="${categoria}" aria-label="Filtrar ${categoria}">
+        ${categoria} <span style="opacity: 0.7; font-size: 0.75em; margin-left: 4px;">(${count})</span>
+      </button>`;})].join('');filtersSection.innerHTML=chipsHTML;bindCertFilters(certificates);}
+function renderAllCertificates(certificates,filter='all',searchTerm=''){const grid=document.getElementById('certsGrid');if(!grid)return;let filtered=certificates;if(filter!=='all'&&certFacets&&certificates===allCertificates){filtered=certificatesByCategory(certificates,filter);}else if(filter!=='all'){filtered=filtered.filter(cert=>{const categoria=(cert.categoria||'').toLowerCase();const filterLower=filter.toLowerCase();return categoria===filterLower||categoria.includes(filterLower);});}
+if(searchTerm){const searchLower=searchTerm.toLowerCase();filtered=filtered.filter(cert=>{const titulo=(cert.titulo||'').toLowerCase();const instituicao=(cert.instituicao||'').toLowerCase();const descricao=(cert.descricao||'').toLowerCase();const competencias=(cert.competencias||[]).join(' ').toLowerCase();const tipo=(cert.tipo||'').toLowerCase();const ano=(cert.ano||'').toString();return titulo.includes(searchLower)||instituicao.includes(searchLower)||descricao.includes(searchLower)||competencias.includes(searchLower)||tipo.includes(searchLower)||ano.includes(searchLower);});}
+if(!filtered.length){const message=searchTerm?`Nenhum certificado encontrado para "${escapeHTML(searchTerm)}"`:'Nenhum certificado encontrado';const suggestion=searchTerm?'Tente outro termo de busca ou limpe o filtro.':'Tente outro filtro.';grid.innerHTML=`
+      <div class="card">
+        <div class="card-title">${message}</div>
+        <div class="card-sub muted">${suggestion}</div>
+        ${searchTerm ? `
+          <button class="btn small primary" onclick="document.getElementById('certSearch').value = ''; document.getElementById('certSearch').dispatchEvent(new Event('input'));" style="margin-top: 1rem;">
+            Limpar busca
+          </button>
+        ` : ''}
+      </div>
+    `;return;}
+const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');filtered.forEach(cert=>{tempDiv.innerHTML=createCertificateCard(cert);const card=tempDiv.firstElementChild;card.addEventListener('click',()=>openCertificateModal(cert));fragment.appendChild(card);});grid.innerHTML='';grid.appendChild(fragment);animateCertCards(grid);announceToScreenReader(`${filtered.length} certificado${filtered.length !== 1 ? 's' : ''} encontrado${filtered.length !== 1 ? 's' : ''}`);}
+function certificatesByCategory(certificates,filter){const filterLower=filter.toLowerCase();const lists=Object.entries(certFacets.ordens.categorias).filter(([categoria])=>{const lower=categoria.toLowerCase();return lower===filterLower||lower.includes(filterLower);}).map(([,ids])=>ids);const position=new Map(certificates.map((cert,idx)=>[cert.id,idx]));const indexes=lists.flat().map(id=>position.get(id)).filter(idx=>idx!==undefined);if(lists.length>1)indexes.sort((a,b)=>a-b);return indexes.map(idx=>certificates[idx]);}
+function bindCertFilters(certificates){const chips=document.querySelectorAll('.chip');const searchInput=document.getElementById('certSearch');if(!chips.length)return;chips.forEach(chip=>{chip.addEventListener('click',function(){chips.forEach(c=>c.classList.remove('active'));this.classList.add('active');const filter=this.getAttribute('data-filter')||'all';const searchTerm=searchInput?searchInput.value.trim():'';renderAllCertificates(certificates,filter,searchTerm);});chip.setAttribute('role','button');chip.setAttribute('tabindex','0');chip.addEventListener('keydown',function(e){if(e.key==='Enter'||e.key===' '){e.preventDefault();this.click();}});});}
+function initCertSearch(certificates){const searchInput=document.getElementById('certSearch');if(!searchInput)return;const handleSearch=debounce((searchTerm)=>{const activeChip=document.querySelector('.chip.active');const currentFilter=activeChip?activeChip.getAttribute('data-filter'):'all';renderAllCertificates(certificates,currentFilter,searchTerm);},300);searchInput.addEventListener('input',(e)=>{handleSearch(e.target.value.trim());});searchInput.addEventListener('keydown',(e)=>{if(e.key==='Escape'){searchInput.value='';handleSearch('');searchInput.blur();}});}
+async function loadAllCertificates(){const grid=document.getElementById('certsGrid');if(!grid)return;showLoading(grid,'Carregando certificados...');try{const[certificates,facetas]=await Promise.all([fetchWithRetry(CONFIG.certsPath),fetchWithRetry(CONFIG.facetasPath,{},1).catch(()=>null)]);if(!Array.isArray(certificates)){throw new Error('Formato de dados inválido');}
+allCertificates=certificates;certFacets=facetas&&facetas.total===certificates.length?facetas:null;generateDynamicFilters(certificates,certFacets);initCertSearch(certificates);if(!hydratePrerendered(grid,certificates,'data-cert-id',openCertificateModal)){renderAllCertificates(certificates,'all','');}
+initCertModalHandlers();console.log('✅ Certificados carregados:',certificates.length);}catch(error){console.error('Erro ao carregar certificados:',error);showError(grid,'Erro ao carregar certificados',`Detalhes: ${error.message}`);}}
+function initCertificates(){if(document.getElementById('featuredCertsGrid')){loadFeaturedCertificates();}
+if(document.getElementById('certsGrid')&&!document.getElementById('featuredCertsGrid')){loadAllCertificates();}
+if(document.getElementById('certModal')){initCertModalHandlers();}}
+function openCertificateModal(cert){currentCertificate=cert;const modal=document.getElementById('certModal');if(!modal)return;populateCertModal(cert);modal.classList.add('active');modal.setAttribute('aria-hidden','false');document.body.classList.add('modal-open');setTimeout(()=>{const closeBtn=modal.querySelector('.modal-close');if(closeBtn)closeBtn.focus();},100);}
+function closeCertificateModal(){const modal=document.getElementById('certModal');if(!modal)return;modal.classList.remove('active');modal.setAttribute('aria-hidden','true');document.body.classList.remove('modal-open');currentCertificate=null;encerrarZoomAtual();}
+function populateCertModal(cert){encerrarZoomAtual();const{titulo,instituicao,ano,categoria,tipo,descricao,descricaoCompleta,preview,duracao,competencias=[],certificados=[],githubFolder,status='Concluído'}=cert;document.getElementById('certModalCategoria').textContent=categoria;document.getElementById('certModalStatus').textContent=status;document.getElementById('certModalTitle').textContent=titulo;document.getElementById('certModalDesc').textContent=descricao;if(duracao)document.getElementById('certModalDuracao').textContent=duracao;if(ano)document.getElementById('certModalAno').textContent=ano;document.getElementById('certModalInstituicao').textContent=instituicao;const previewContainer=document.getElementById('certModalPreview');if(certificados&&certificados.length>0){previewContainer.innerHTML=`
+      <div class="cert-gallery-header">
+        <h3>Certificados da categoria (${certificados.length})</h3>
+        <p class="cert-gallery-desc">Clique em um certificado para visualizar</p>
+      </div>
+      <div class="cert-gallery">
+        ${certificados.map((c, idx) => `
+          <div class="cert-gallery-item" data-cert-index="${idx}">
+            <div class="cert-gallery-thumb">
+              <img 
+                src="${c.preview || 'assets/img/certificados/placeholder-cert.png'}" 
+                alt="${escapeHTML(c.nome)}"
+                loading="lazy"
+              />
+              <div class="cert-gallery-overlay">
+                <svg width="32" height="32" viewBox="0 0 24 24" fill="none">
+                  <path d="M15 3h6v6M9 21H3v-6M21 3l-7 7M3 21l7-7" stroke="white" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+                </svg>
+              </div>
+            </div>
+            <div class="cert-gallery-name">${escapeHTML(c.nome)}</div>
+          </div>
+        `).join('')}
+      </div>
+    `;previewContainer.style.display='block';previewContainer.querySelectorAll('.cert-gallery-item').forEach((item,idx)=>{item.addEventListener('click',()=>{window.open(certificados[idx].url,'_blank','noopener,noreferrer');});});}else if(preview){previewContainer.innerHTML=`
+      <img 
+        src="${preview}" 
+        alt="Preview do certificado ${escapeHTML(titulo)}" 
+        loading="lazy"
+      />
+    `;previewContainer.style.display='block';}else{previewContainer.style.display='none';}
+renderCertZoom(cert,previewContainer);document.getElementById('certModalDescCompleta').textContent=descricaoCompleta||descricao;const compContainer=document.getElementById('certModalCompetencias');if(competencias.length>0){compContainer.innerHTML=competencias.map(comp=>`<span class="tag">${escapeHTML(comp)}</span>`).join('');}else{compContainer.innerHTML='<p style="color: var(--muted); font-size: 0.875rem;">Nenhuma competência listada</p>';}
+renderRelatedCertificates(cert);const verBtn=document.getElementById('certModalVerBtn');const repoBtn=document.getElementById('certModalRepoBtn');if(githubFolder){repoBtn.href=githubFolder;repoBtn.textContent=tipo==='categoria'?'Ver pasta no GitHub':'Ver no GitHub';repoBtn.style.display='inline-flex';}else{repoBtn.style.display='none';}
+verBtn.style.display='none';}
+function encerrarZoomAtual(){if(encerrarZoom)encerrarZoom();encerrarZoom=null;}
+async function renderCertZoom(cert,container){if(!cert.zoom||!container)return;let descritor;try{descritor=await fetchWithRetry(cert.zoom,{},1);}catch(error){console.warn('Zoom indisponível:',error.message);return;}
+if(currentCertificate!==cert||!descritor.paginas?.length)return;const viewer=document.createElement('div');viewer.className='zoom-viewer';viewer.innerHTML=`
+    <div class="zoom-area" tabindex="0" aria-label="Certificado ampliável: use a roda do mouse, arraste, dê dois cliques ou use + e -"></div>
+    <div class="zoom-controles">
+      <button type="button" class="zoom-btn" data-zoom="out" aria-label="Diminuir zoom">−</button>
+      <button type="button" class="zoom-btn" data-zoom="fit" aria-label="Ajustar ao tamanho">⤢</button>
+      <button type="button" class="zoom-btn" data-zoom="in" aria-label="Aumentar zoom">+</button>
+      ${descritor.paginas.length > 1 ? `
+        <select class="zoom-pagina" aria-label="Página">
+          ${descritor.paginas.map((p, idx) => `<option value="${idx}">Página ${p.pagina + 1}</option>`).join('')}
+        </select>
+      ` : ''}
+    </div>
+  `;container.querySelector(':scope > img')?.remove();container.prepend(viewer);container.style.display='block';initZoomViewer(viewer,descritor,cert.zoom.slice(0,cert.zoom.lastIndexOf('/')+1));}
+function initZoomViewer(viewer,descritor,base){const area=viewer.querySelector('.zoom-area');const fundo=document.createElement('img');const camada=document.createElement('div');fundo.className='zoom-fundo';fundo.alt='';camada.className='zoom-camada';area.append(fundo,camada);const state={pagina:descritor.paginas[0],escala:1,minimo:1,x:0,y:0,nivel:-1,tiles:new Set(),frame:0};const topo=()=>state.pagina.niveis[state.pagina.niveis.length-1];const tileUrl=(n,col,lin)=>`${base}p${state.pagina.pagina}/${n}/${col}_${lin}.${descritor.formato}`;function posicionar(el,nivel){const escala=state.escala*topo().largura/nivel.largura;el.style.width=`${nivel.largura}px`;el.style.height=`${nivel.altura}px`;el.style.transform=`translate(${state.x}px, ${state.y}px) scale(${escala})`;}
+function limitar(){const{largura,altura}=topo();state.escala=Math.min(Math.max(state.escala,state.minimo),1);state.x=Math.min(0,Math.max(area.clientWidth-largura*state.escala,state.x));state.y=Math.min(0,Math.max(area.clientHeight-altura*state.escala,state.y));area.classList.toggle('ampliado',state.escala>state.minimo*1.001);}
+function desenhar(){state.frame=0;const niveis=state.pagina.niveis;const dpr=window.devicePixelRatio||1;let n=niveis.findIndex(nv=>nv.largura>=topo().largura*state.escala*dpr);if(n<0)n=niveis.length-1;const nivel=niveis[n];posicionar(fundo,niveis[0]);if(n!==state.nivel){state.nivel=n;state.tiles.clear();camada.innerHTML='';}
+posicionar(camada,nivel);if(n===0)return;const t=descritor.tile;const escala=state.escala*topo().largura/nivel.largura;const colunas=Math.ceil(nivel.largura/t);const linhas=Math.ceil(nivel.altura/t);const c0=Math.max(0,Math.floor(-state.x/escala/t));const c1=Math.min(colunas-1,Math.floor((area.clientWidth-state.x)/escala/t));const l0=Math.max(0,Math.floor(-state.y/escala/t));const l1=Math.min(linhas-1,Math.floor((area.clientHeight-state.y)/escala/t));for(let lin=l0;lin<=l1;lin++){for(let col=c0;col<=c1;col++){const chave=`${col}_${lin}`;if(state.tiles.has(chave))continue;state.tiles.add(chave);const img=document.createElement('img');img.alt='';img.decoding='async';img.style.left=`${col * t}px`;img.style.top=`${lin * t}px`;img.style.width=`${Math.min(t, nivel.largura - col * t)}px`;img.style.height=`${Math.min(t, nivel.altura - lin * t)}px`;img.src=tileUrl(n,col,lin);camada.appendChild(img);}}}
+function agendar(){if(!state.frame)state.frame=requestAnimationFrame(desenhar);}
+function ajustar(){const{largura,altura}=topo();area.style.aspectRatio=`${largura} / ${altura}`;fundo.src=tileUrl(0,0,0);if(!area.clientWidth)return;state.minimo=Math.min(1,area.clientWidth/largura);state.escala=state.minimo;state.x=state.y=0;limitar();agendar();}
+function zoomEm(fator,cx=area.clientWidth/2,cy=area.clientHeight/2){const anterior=state.escala;if(!anterior)return;const nova=Math.min(Math.max(anterior*fator,state.minimo),1);state.x=cx-(cx-state.x)*nova/anterior;state.y=cy-(cy-state.y)*nova/anterior;state.escala=nova;limitar();agendar();}
+function pontoNaArea(event){const rect=area.getBoundingClientRect();return[event.clientX-rect.left,event.clientY-rect.top];}
+area.addEventListener('wheel',(e)=>{if((e.deltaY<0&&state.escala>=1)||(e.deltaY>0&&state.escala<=state.minimo))return;e.preventDefault();zoomEm(Math.exp(-e.deltaY*0.002),...pontoNaArea(e));},{passive:false});area.addEventListener('dblclick',(e)=>zoomEm(2,...pontoNaArea(e)));let arrasto=null;area.addEventListener('pointerdown',(e)=>{if(!area.classList.contains('ampliado'))return;arrasto={x:e.clientX,y:e.clientY};area.setPointerCapture(e.pointerId);});area.addEventListener('pointermove',(e)=>{if(!arrasto)return;state.x+=e.clientX-arrasto.x;state.y+=e.clientY-arrasto.y;arrasto={x:e.clientX,y:e.clientY};limitar();agendar();});['pointerup','pointercancel'].forEach(tipo=>area.addEventListener(tipo,()=>{arrasto=null;}));area.addEventListener('keydown',(e)=>{if(e.key==='+'||e.key==='=')zoomEm(1.5);else if(e.key==='-')zoomEm(1/1.5);else if(e.key==='0')ajustar();});viewer.querySelectorAll('[data-zoom]').forEach(btn=>{btn.addEventListener('click',()=>{if(btn.dataset.zoom==='in')zoomEm(1.5);else if(btn.dataset.zoom==='out')zoomEm(1/1.5);else ajustar();});});viewer.querySelector('.zoom-pagina')?.addEventListener('change',(e)=>{state.pagina=descritor.paginas[Number(e.target.value)];state.nivel=-1;ajustar();});let largura=0;const observador=new ResizeObserver(()=>{if(area.clientWidth&&area.clientWidth!==largura){largura=area.clientWidth;ajustar();}});observador.observe(area);encerrarZoomAtual();encerrarZoom=()=>{observador.disconnect();if(state.frame)cancelAnimationFrame(state.frame);state.frame=0;};ajustar();}
+async function renderRelatedCertificates(cert){const section=document.getElementById('certModalRelacionadosSection');const container=document.getElementById('certModalRelacionados');if(!section||!container)return;section.hidden=true;container.innerHTML='';let relacionados;try{relacionados=await fetchWithRetry(CONFIG.relacionadosPath);}catch(error){console.warn('Relacionados indisponíveis:',error.message);return;}
+if(currentCertificate!==cert)return;const byId=new Map(allCertificates.map(c=>[c.id,c]));const related=(relacionados[cert.id]||[]).map(id=>byId.get(id)).filter(Boolean);if(related.length===0)return;container.innerHTML=related.map(c=>`<button type="button" class="tag" data-cert-id="${escapeHTML(c.id)}">${escapeHTML(c.titulo)}</button>`).join('');container.querySelectorAll('[data-cert-id]').forEach(btn=>{btn.addEventListener('click',()=>openCertificateModal(byId.get(btn.dataset.certId)));});section.hidden=false;}
+function initCertModalHandlers(){const modal=document.getElementById('certModal');if(!modal)return;modal.querySelectorAll('[data-close-cert-modal]').forEach(el=>{el.addEventListener('click',closeCertificateModal);});document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active')){closeCertificateModal();}});const modalContent=modal.querySelector('.modal-content');if(modalContent){modalContent.addEventListener('click',(e)=>{e.stopPropagation();});}}
+window.portfolioApp={...window.portfolioApp,loadFeaturedCertificates,loadAllCertificates,openCertificateModal,closeCertificateModal};function initDiplomas(){}
+function initTimelineToggle(){const timeline=document.getElementById('timelineContent');const toggleBtn=document.getElementById('toggleTimeline');if(!timeline||!toggleBtn)return;const toggleText=toggleBtn.querySelector('.toggle-text');toggleBtn.addEventListener('click',function(){const isExpanded=this.getAttribute('aria-expanded')==='true';if(isExpanded){timeline.classList.remove('expanded');this.setAttribute('aria-expanded','false');toggleText.textContent='Ver mais';setTimeout(()=>{timeline.scrollIntoView({behavior:'smooth',block:'start'});},100);}else{timeline.classList.add('expanded');this.setAttribute('aria-expanded','true');toggleText.textContent='Ver menos';}
+announceToScreenReader(isExpanded?'Seção recolhida':'Seção expandida');});toggleBtn.addEventListener('keydown',function(e){if(e.key==='Enter'||e.key===' '){e.preventDefault();this.click();}});}
+function registerServiceWorker(){if(!('serviceWorker'in navigator)||location.protocol==='file:')return;navigator.serviceWorker.register('sw.js').catch(error=>{console.warn('Service worker não registrado:',error.message);});}
+function init(){try{setTopbar();setYear();initSmoothScroll();initScrollSpy();initLazyLoading();manageFocus();initTimelineToggle();initProjects();initDiplomas();initCertificates();window.addEventListener('hashchange',manageFocus);registerServiceWorker();console.log('✅ Portfólio inicializado com sucesso!');}catch(error){console.error('❌ Erro na inicialização:',error);}
+updateHeroScale();window.addEventListener('resize',debounce(updateHeroScale,80));}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',init);}else{init();}
@@ -0,0 +1,285 @@
+const CONFIG={projectsPath:'data/projetos.json',certsPath:'data/certificados.json',diplomasPath:'data/diplomas.json',relacionadosPath:'data/relacionados.json',facetasPath:'data/facetas.json',cacheTime:60000,maxRetries:3};function debounce(func,wait){let timeout;return function executedFunction(...args){const later=()=>{clearTimeout(timeout);func(...args);};clearTimeout(timeout);timeout=setTimeout(later,wait);};}
+function escapeHTML(str){const div=document.createElement('div');div.textContent=str;return div.innerHTML;}
+function setYear(){const yearElement=document.getElementById('year');if(yearElement){yearElement.textContent=new Date().getFullYear();}}
+function getCurrentPage(){const path=location.pathname.split('/').pop()||'index.html';return path.toLowerCase();}
+function setTopbar(){const topbarElement=document.getElementById('topbar');if(!topbarElement)return;const currentPage=getCurrentPage();const menuHTML=(currentPage==='index.html')?`
+      <div class="menu">
+        <a href="index.html#inicio" aria-label="Ir para o início">Início</a>
+
+        <a href="index.html#sobre" aria-label="Ir para seção sobre">
+          Sobre
+        </a>
+
+        <a href="index.html#projetos" aria-label="Ir para seção de projetos">
+          Projetos
+        </a>
+
+        <a href="index.html#diplomas" aria-label="Ir para seção de diplomas">
+          Diplomas
+        </a>
+
+        <a href="index.html#certificados" aria-label="Ir para seção de certificados">
+          Certificados
+        </a>
+      </div>
+    `:`
+      <div class="menu">
+        <a href="index.html"
+           class="active back-home"
+           aria-label="Voltar para a página inicial">
+          ← Voltar ao início
+        </a>
+      </div>
+    `;const navHTML=`
+    <nav class="nav" role="navigation" aria-label="Navegação principal">
+      <div class="brand">
+        <img
+          src="assets/img/avatares/avatar.jpeg"
+          alt="Foto de perfil de Guilherme Corrêa"
+          class="avatar"
+          loading="lazy"
+        />
+
+        <span>
+          Guilherme <b>Corrêa</b>
+
+          <a class="btn small primary"
+             href="https://www.linkedin.com/in/guilherme-corr%C3%AAa-893781169/"
+             target="_blank"
+             rel="noopener">
+            LinkedIn
+          </a>
+
+          <a class="btn small ghost"
+             href="https://github.com/guicorrea93"
+             target="_blank"
+             rel="noopener">
+            GitHub
+          </a>
+
+          <a class="btn small ghost"
+             href="mailto:guilherme93_correa@hotmail.com">
+            Email
+          </a>
+        </span>
+      </div>
+
+      ${menuHTML}
+    </nav>
+  `;topbarElement.innerHTML=navHTML;}
+function initSmoothScroll(){if(!('scrollBehavior'in document.documentElement.style)){document.querySelectorAll('a[href^="#"]').forEach(anchor=>{anchor.addEventListener('click',function(e){const targetId=this.getAttribute('href').substring(1);const targetElement=document.getElementById(targetId);if(targetElement){e.preventDefault();targetElement.scrollIntoView({behavior:'smooth',block:'start'});}});});}}
+function initScrollSpy(){if(getCurrentPage()!=='index.html')return;const links=Array.from(document.querySelectorAll('.menu a[href*="#"]'));if(!links.length)return;const ids=links.map(a=>(a.hash||'').replace('#','')).filter(Boolean);const sections=ids.map(id=>document.getElementById(id)).filter(Boolean);if(!sections.length)return;const setActive=(id)=>{links.forEach(a=>{const isThis=a.hash===`#${id}`;a.classList.toggle('active',isThis);if(isThis)a.setAttribute('aria-current','page');else a.removeAttribute('aria-current');});};setActive((location.hash||'#inicio').replace('#',''));let ticking=false;const onScroll=()=>{if(ticking)return;ticking=true;requestAnimationFrame(()=>{ticking=false;const refY=window.scrollY+140;let currentId=sections[0].id;for(const sec of sections){if(sec.offsetTop<=refY)currentId=sec.id;}
+setActive(currentId);});};window.addEventListener('scroll',onScroll,{passive:true});window.addEventListener('resize',onScroll);window.addEventListener('hashchange',()=>{setActive((location.hash||'#inicio').replace('#',''));});onScroll();}
+function showLoading(element,message='Carregando...'){if(!element||isPrerendered(element))return;element.innerHTML=`
+    <div class="card" style="text-align: center; padding: 2rem;">
+      <div class="card-title" style="color: var(--text-2);">
+        ${escapeHTML(message)}
+      </div>
+      <div style="margin-top: 1rem;">
+        <div style="display: inline-block; width: 2rem; height: 2rem; border: 3px solid var(--border); border-top-color: var(--accent); border-radius: 50%; animation: spin 0.8s linear infinite;"></div>
+      </div>
+    </div>
+  `;if(!document.getElementById('spin-animation')){const style=document.createElement('style');style.id='spin-animation';style.textContent=`
+      @keyframes spin {
+        to { transform: rotate(360deg); }
+      }
+    `;document.head.appendChild(style);}}
+function showError(element,errorMessage,details=''){if(!element||isPrerendered(element))return;element.innerHTML=`
+    <div class="card" style="border-color: rgba(239, 68, 68, 0.3);">
+      <div class="card-title" style="color: #EF4444;">
+        ⚠️ ${escapeHTML(errorMessage)}
+      </div>
+      <div class="card-sub muted">
+        ${escapeHTML(details)}
+      </div>
+      <div style="margin-top: 1rem;">
+        <button class="btn small primary" onclick="location.reload()">
+          Tentar novamente
+        </button>
+      </div>
+    </div>
+  `;}
+function isPrerendered(element){return element?.dataset.prerendered==='true';}
+function hydratePrerendered(container,items,idAttr,onOpen){if(!isPrerendered(container))return false;const cards=container.querySelectorAll(`[${idAttr}]`);const byId=new Map(items.map(item=>[String(item.id),item]));delete container.dataset.prerendered;if(cards.length!==items.length||![...cards].every(card=>byId.has(card.getAttribute(idAttr)))){return false;}
+cards.forEach(card=>{const item=byId.get(card.getAttribute(idAttr));card.addEventListener('click',()=>onOpen(item));});return true;}
+const cache=new Map();async function fetchWithRetry(url,options={},retries=CONFIG.maxRetries){const cacheKey=url;const cached=cache.get(cacheKey);if(cached&&(Date.now()-cached.timestamp<CONFIG.cacheTime)){return cached.data;}
+for(let i=0;i<retries;i++){try{const response=await fetch(url,{...options,cache:'no-store',headers:{'Content-Type':'application/json',...options.headers}});if(!response.ok){throw new Error(`HTTP ${response.status}: ${response.statusText}`);}
+const data=await response.json();cache.set(cacheKey,{data,timestamp:Date.now()});return data;}catch(error){console.warn(`Tentativa ${i + 1}/${retries} falhou:`,error.message);if(i===retries-1){throw error;}
+await new Promise(resolve=>setTimeout(resolve,1000*(i+1)));}}}
+function announceToScreenReader(message){const announcement=document.createElement('div');announcement.setAttribute('role','status');announcement.setAttribute('aria-live','polite');announcement.className='sr-only';announcement.textContent=message;document.body.appendChild(announcement);setTimeout(()=>{document.body.removeChild(announcement);},1000);}
+function manageFocus(){const hash=window.location.hash;if(hash){const target=document.querySelector(hash);if(target){target.setAttribute('tabindex','-1');target.focus();target.removeAttribute('tabindex');}}}
+function initLazyLoading(){if('loading'in HTMLImageElement.prototype){const images=document.querySelectorAll('img[loading="lazy"]');images.forEach(img=>{img.src=img.dataset.src||img.src;});}else{const images=document.querySelectorAll('img[loading="lazy"]');const imageObserver=new IntersectionObserver((entries,observer)=>{entries.forEach(entry=>{if(entry.isIntersecting){const img=entry.target;img.src=img.dataset.src||img.src;img.classList.remove('lazy');imageObserver.unobserve(img);}});});images.forEach(img=>imageObserver.observe(img));}}
+function updateHeroScale(){const hero=document.querySelector('.hero');if(!hero)return;const canvas=hero.querySelector('.hero-canvas');if(!canvas)return;if(window.innerWidth<=900){hero.style.removeProperty('--hero-scale');return;}
+const w=hero.clientWidth;const h=hero.clientHeight;const scale=Math.min(w/1536,h/730);hero.style.setProperty('--hero-scale',scale);}function initProjects(){}
+function initCertificates(){}
+let allDiplomas=[];let currentDiploma=null;async function loadFeaturedDiplomas(){const grid=document.getElementById('featuredDiplomasGrid');if(!grid)return;showLoading(grid,'Carregando diplomas em destaque...');try{const diplomas=await fetchWithRetry(CONFIG.diplomasPath);if(!Array.isArray(diplomas)){throw new Error('Formato de dados inválido');}
+allDiplomas=diplomas;const featured=diplomas.filter(d=>d.destaque===true);if(!featured.length){grid.innerHTML=`
+        <div class="card">
+          <div class="card-title">Nenhum diploma cadastrado</div>
+          <div class="card-sub muted">
+            Adicione diplomas no arquivo data/diplomas.json
+          </div>
+        </div>
+      `;return;}
+if(!hydratePrerendered(grid,featured,'data-diploma-id',openDiplomaModal)){renderFeaturedDiplomas(featured,grid);}}catch(error){console.error('Erro ao carregar diplomas:',error);showError(grid,'Erro ao carregar diplomas',`Detalhes: ${error.message}`);}}
+function renderFeaturedDiplomas(diplomas,container){const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');diplomas.forEach(diploma=>{tempDiv.innerHTML=createFeaturedDiplomaCard(diploma);const card=tempDiv.firstElementChild;card.addEventListener('click',()=>openDiplomaModal(diploma));fragment.appendChild(card);});container.innerHTML='';container.appendChild(fragment);animateDiplomaCards(container);}
+function createFeaturedDiplomaCard(diploma){const{id,titulo,instituicao,tipo,nivel,ano,descricao,thumbnail,duracao}=diploma;const typeColors={'MBA':'diploma-mba','Especialização':'diploma-especializacao','Graduação':'diploma-graduacao'};const cardClass=`featured-diploma-card ${typeColors[tipo] || ''}`;return`
+    <article class="${cardClass}" data-diploma-id="${id}">
+      <div class="diploma-seal">
+        <svg width="32" height="32" viewBox="0 0 24 24" fill="none">
+          <path d="M12 2L15.09 8.26L22 9.27L17 14.14L18.18 21.02L12 17.77L5.82 21.02L7 14.14L2 9.27L8.91 8.26L12 2Z" 
+                fill="currentColor" stroke="currentColor" stroke-width="1.5"/>
+        </svg>
+      </div>
+      
+      <img 
+        src="${thumbnail || 'assets/img/diplomas/placeholder-diploma.png'}"
+        alt="Preview de ${escapeHTML(titulo)}" 
+        class="featured-diploma-thumb"
+        loading="lazy"
+      />
+      
+      <div class="featured-diploma-body">
+        <div class="featured-diploma-header">
+          <h3 class="featured-diploma-title">${escapeHTML(titulo)}</h3>
+          <span class="featured-diploma-type">${escapeHTML(tipo)}</span>
+        </div>
+        
+        <div class="diploma-meta">
+          <span class="diploma-meta-item">
+            <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+              <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5"/>
+              <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+            ${escapeHTML(instituicao)}
+          </span>
+          
+          ${duracao ? `
+            <span class="diploma-meta-item">
+              <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                <path d="M8 14C11.3137 14 14 11.3137 14 8C14 4.68629 11.3137 2 8 2C4.68629 2 2 4.68629 2 8C2 11.3137 4.68629 14 8 14Z" stroke="currentColor" stroke-width="1.5"/>
+                <path d="M8 5V8L10 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+              </svg>
+              ${escapeHTML(duracao)}
+            </span>
+          ` : ''}
+          
+          ${ano ? `
+            <span class="diploma-meta-item">
+              <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                <path d="M8 2V8L11 11" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                <circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.5"/>
+              </svg>
+              ${escapeHTML(ano)}
+            </span>
+          ` : ''}
+        </div>
+        
+        <p class="featured-diploma-desc">${escapeHTML(descricao)}</p>
+        
+        <div class="featured-diploma-footer">
+          <span class="featured-diploma-nivel">${escapeHTML(nivel)}</span>
+          <span class="featured-diploma-link">
+            Ver detalhes
+            <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+              <path d="M6 3L11 8L6 13" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+          </span>
+        </div>
+      </div>
+    </article>
+  `;}
+async function loadAllDiplomas(){const grid=document.getElementById('diplomasGrid');const timeline=document.getElementById('diplomaTimeline');if(!grid)return;showLoading(grid,'Carregando diplomas...');try{const diplomas=await fetchWithRetry(CONFIG.diplomasPath);if(!Array.isArray(diplomas)){throw new Error('Formato de dados inválido');}
+allDiplomas=diplomas;if(!hydratePrerendered(grid,diplomas,'data-diploma-id',openDiplomaModal)){renderAllDiplomasGrid(diplomas,grid);}
+if(timeline){renderDiplomaTimeline(diplomas,timeline);}
+initDiplomaModalHandlers();}catch(error){console.error('Erro ao carregar diplomas:',error);showError(grid,'Erro ao carregar diplomas',`Detalhes: ${error.message}`);}}
+function renderAllDiplomasGrid(diplomas,container){const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');diplomas.forEach(diploma=>{tempDiv.innerHTML=createDiplomaCard(diploma);const card=tempDiv.firstElementChild;card.addEventListener('click',()=>openDiplomaModal(diploma));fragment.appendChild(card);});container.innerHTML='';container.appendChild(fragment);animateDiplomaCards(container);}
+function createDiplomaCard(diploma){const{id,titulo,instituicao,tipo,nivel,ano,descricao,thumbnail}=diploma;const typeColors={'MBA':'diploma-card-mba','Especialização':'diploma-card-especializacao','Graduação':'diploma-card-graduacao'};const cardClass=`diploma-card-with-thumb ${typeColors[tipo] || ''}`;return`
+    <article class="${cardClass}" data-diploma-id="${id}">
+      <div class="diploma-badge">${escapeHTML(tipo)}</div>
+      
+      <img 
+        src="${thumbnail || 'assets/img/diplomas/placeholder-diploma.png'}"
+        alt="Preview de ${escapeHTML(titulo)}" 
+        class="diploma-thumb"
+        loading="lazy"
+      />
+      
+      <div class="diploma-card-body">
+        <div class="p-top">
+          <h3 class="p-title">${escapeHTML(titulo)}</h3>
+          <span class="p-type">${escapeHTML(nivel)}</span>
+        </div>
+        
+        <div class="diploma-meta" style="margin: 0.5rem 0;">
+          <span class="diploma-meta-item">
+            <svg width="14" height="14" viewBox="0 0 16 16" fill="none">
+              <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5"/>
+              <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+            ${escapeHTML(instituicao)}
+          </span>
+          
+          ${ano ? `
+            <span class="diploma-meta-item">
+              <svg width="14" height="14" viewBox="0 0 16 16" fill="none">
+                <path d="M8 2V8L11 11" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                <circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.5"/>
+              </svg>
+              ${escapeHTML(ano)}
+            </span>
+          ` : ''}
+        </div>
+        
+        <p class="p-desc">${escapeHTML(descricao)}</p>
+      </div>
+    </article>
+  `;}
+function renderDiplomaTimeline(diplomas,container){const sorted=[...diplomas].sort((a,b)=>{const yearA=parseInt(a.ano.split('-').pop());const yearB=parseInt(b.ano.split('-').pop());return yearB-yearA;});const timelineHTML=sorted.map((diploma,index)=>{const side=index%2===0?'left':'right';return`
+      <div class="diploma-timeline-item ${side}">
+        <div class="timeline-dot"></div>
+        <div class="timeline-card" onclick="window.portfolioApp.openDiplomaModal(allDiplomas.find(d => d.id === '${diploma.id}'))">
+          <div class="timeline-year">${escapeHTML(diploma.ano)}</div>
+          <h3 class="timeline-title">${escapeHTML(diploma.titulo)}</h3>
+          <p class="timeline-institution">${escapeHTML(diploma.instituicao)}</p>
+          <span class="timeline-type">${escapeHTML(diploma.tipo)}</span>
+        </div>
+      </div>
+    `;}).join('');container.innerHTML=timelineHTML;}
+function animateDiplomaCards(container){setTimeout(()=>{container.querySelectorAll('.featured-diploma-card, .diploma-card-with-thumb').forEach((card,index)=>{card.style.opacity='0';card.style.transform='translateY(20px)';setTimeout(()=>{card.style.transition='all 0.4s cubic-bezier(0.16, 1, 0.3, 1)';card.style.opacity='1';card.style.transform='translateY(0)';},index*60);});},10);}
+function openDiplomaModal(diploma){currentDiploma=diploma;const modal=document.getElementById('diplomaModal');if(!modal)return;populateDiplomaModal(diploma);modal.classList.add('active');modal.setAttribute('aria-hidden','false');document.body.classList.add('modal-open');setTimeout(()=>{const closeBtn=modal.querySelector('.modal-close');if(closeBtn)closeBtn.focus();},100);}
+function closeDiplomaModal(){const modal=document.getElementById('diplomaModal');if(!modal)return;modal.classList.remove('active');modal.setAttribute('aria-hidden','true');document.body.classList.remove('modal-open');currentDiploma=null;}
+function populateDiplomaModal(diploma){const{titulo,instituicao,tipo,nivel,ano,duracao,descricao,descricaoCompleta,preview,competencias=[],destaques=[],link,status='Concluído'}=diploma;document.getElementById('diplomaModalTipo').textContent=tipo;document.getElementById('diplomaModalStatus').textContent=status;document.getElementById('diplomaModalTitle').textContent=titulo;document.getElementById('diplomaModalDesc').textContent=descricao;document.getElementById('diplomaModalInstituicao').textContent=instituicao;if(duracao)document.getElementById('diplomaModalDuracao').textContent=duracao;if(ano)document.getElementById('diplomaModalAno').textContent=ano;document.getElementById('diplomaModalNivel').textContent=nivel;const previewContainer=document.getElementById('diplomaModalPreview');if(preview){const isPdf=preview.toLowerCase().endsWith('.pdf');if(isPdf){previewContainer.innerHTML=`
+        <div class="diploma-pdf-preview">
+          <svg width="64" height="64" viewBox="0 0 24 24" fill="none">
+            <path d="M14 2H6C5.46957 2 4.96086 2.21071 4.58579 2.58579C4.21071 2.96086 4 3.46957 4 4V20C4 20.5304 4.21071 21.0391 4.58579 21.4142C4.96086 21.7893 5.46957 22 6 22H18C18.5304 22 19.0391 21.7893 19.4142 21.4142C19.7893 21.0391 20 20.5304 20 20V8L14 2Z" 
+                  stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            <path d="M14 2V8H20" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            <path d="M8 13H16M8 17H16" stroke="currentColor" stroke-width="2" stroke-linecap="round"/>
+          </svg>
+          <p>Documento PDF disponível</p>
+          <a href="${preview}" target="_blank" rel="noopener noreferrer" class="btn small primary">
+            Abrir PDF
+          </a>
+        </div>
+      `;}else{previewContainer.innerHTML=`
+        <img 
+          src="${preview}" 
+          alt="Preview do diploma ${escapeHTML(titulo)}" 
+          loading="lazy"
+        />
+      `;}
+previewContainer.style.display='block';}else{previewContainer.style.display='none';}
+document.getElementById('diplomaModalDescCompleta').textContent=descricaoCompleta||descricao;const destaquesSection=document.getElementById('diplomaModalDestaquesSection');const destaquesList=document.getElementById('diplomaModalDestaques');if(destaques.length>0){destaquesList.innerHTML=destaques.map(d=>`<li>${escapeHTML(d)}</li>`).join('');destaquesSection.style.display='block';}else{destaquesSection.style.display='none';}
+const compContainer=document.getElementById('diplomaModalCompetencias');if(competencias.length>0){compContainer.innerHTML=competencias.map(comp=>`<span class="tag">${escapeHTML(comp)}</span>`).join('');}
+const verBtn=document.getElementById('diplomaModalVerBtn');if(link){verBtn.href=link;verBtn.style.display='inline-flex';}else{verBtn.style.display='none';}}
+function initDiplomaModalHandlers(){const modal=document.getElementById('diplomaModal');if(!modal)return;modal.querySelectorAll('[data-close-diploma-modal]').forEach(el=>{el.addEventListener('click',closeDiplomaModal);});document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active')){closeDiplomaModal();}});const modalContent=modal.querySelector('.modal-content');if(modalContent){modalContent.addEventListener('click',(e)=>{e.stopPropagation();});}}
+function initDiplomas(){if(document.getElementById('featuredDiplomasGrid')){loadFeaturedDiplomas();}
+if(document.getElementById('diplomasGrid')){loadAllDiplomas();}
+if(document.getElementById('diplomaModal')){initDiplomaModalHandlers();}}
+window.portfolioApp={...window.portfolioApp,loadFeaturedDiplomas,loadAllDiplomas,openDiplomaModal,closeDiplomaModal};function initTimelineToggle(){const timeline=document.getElementById('timelineContent');const toggleBtn=document.getElementById('toggleTimeline');if(!timeline||!toggleBtn)return;const toggleText=toggleBtn.querySelector('.toggle-text');toggleBtn.addEventListener('click',function(){const isExpanded=this.getAttribute('aria-expanded')==='true';if(isExpanded){timeline.classList.remove('expanded');this.setAttribute('aria-expanded','false');toggleText.textContent='Ver mais';setTimeout(()=>{timeline.scrollIntoView({behavior:'smooth',block:'start'});},100);}else{timeline.classList.add('expanded');this.setAttribute('aria-expanded','true');toggleText.textContent='Ver menos';}
+announceToScreenReader(isExpanded?'Seção recolhida':'Seção expandida');});toggleBtn.addEventListener('keydown',function(e){if(e.key==='Enter'||e.key===' '){e.preventDefault();this.click();}});}
+function registerServiceWorker(){if(!('serviceWorker'in navigator)||location.protocol==='file:')return;navigator.serviceWorker.register('sw.js').catch(error=>{console.warn('Service worker não registrado:',error.message);});}
+function init(){try{setTopbar();setYear();initSmoothScroll();initScrollSpy();initLazyLoading();manageFocus();initTimelineToggle();initProjects();initDiplomas();initCertificates();window.addEventListener('hashchange',manageFocus);registerServiceWorker();console.log('✅ Portfólio inicializado com sucesso!');}catch(error){console.error('❌ Erro na inicialização:',error);}
+updateHeroScale();window.addEventListener('resize',debounce(updateHeroScale,80));}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',init);}else{init();}
@@ -0,0 +1,252 @@
+const CONFIG={projectsPath:'data/projetos.json',certsPath:'data/certificados.json',diplomasPath:'data/diplomas.json',relacionadosPath:'data/relacionados.json',facetasPath:'data/facetas.json',cacheTime:60000,maxRetries:3};function debounce(func,wait){let timeout;return function executedFunction(...args){const later=()=>{clearTimeout(timeout);func(...args);};clearTimeout(timeout);timeout=setTimeout(later,wait);};}
+function escapeHTML(str){const div=document.createElement('div');div.textContent=str;return div.innerHTML;}
+function setYear(){const yearElement=document.getElementById('year');if(yearElement){yearElement.textContent=new Date().getFullYear();}}
+function getCurrentPage(){const path=location.pathname.split('/').pop()||'index.html';return path.toLowerCase();}
+function setTopbar(){const topbarElement=document.getElementById('topbar');if(!topbarElement)return;const currentPage=getCurrentPage();const menuHTML=(currentPage==='index.html')?`
+      <div class="menu">
+        <a href="index.html#inicio" aria-label="Ir para o início">Início</a>
+
+        <a href="index.html#sobre" aria-label="Ir para seção sobre">
+          Sobre
+        </a>
+
+        <a href="index.html#projetos" aria-label="Ir para seção de projetos">
+          Projetos
+        </a>
+
+        <a href="index.html#diplomas" aria-label="Ir para seção de diplomas">
+          Diplomas
+        </a>
+
+        <a href="index.html#certificados" aria-label="Ir para seção de certificados">
+          Certificados
+        </a>
+      </div>
+    `:`
+      <div class="menu">
+        <a href="index.html"
+           class="active back-home"
+           aria-label="Voltar para a página inicial">
+          ← Voltar ao início
+        </a>
+      </div>
+    `;const navHTML=`
+    <nav class="nav" role="navigation" aria-label="Navegação principal">
+      <div class="brand">
+        <img
+          src="assets/img/avatares/avatar.jpeg"
+          alt="Foto de perfil de Guilherme Corrêa"
+          class="avatar"
+          loading="lazy"
+        />
+
+        <span>
+          Guilherme <b>Corrêa</b>
+
+          <a class="btn small primary"
+             href="https://www.linkedin.com/in/guilherme-corr%C3%AAa-893781169/"
+             target="_blank"
+             rel="noopener">
+            LinkedIn
+          </a>
+
+          <a class="btn small ghost"
+             href="https://github.com/guicorrea93"
+             target="_blank"
+             rel="noopener">
+            GitHub
+          </a>
+
+          <a class="btn small ghost"
+             href="mailto:guilherme93_correa@hotmail.com">
+            Email
+          </a>
+        </span>
+      </div>
+
+      ${menuHTML}
+    </nav>
+  `;topbarElement.innerHTML=navHTML;}
+function initSmoothScroll(){if(!('scrollBehavior'in document.documentElement.style)){document.querySelectorAll('a[href^="#"]').forEach(anchor=>{anchor.addEventListener('click',function(e){const targetId=this.getAttribute('href').substring(1);const targetElement=document.getElementById(targetId);if(targetElement){e.preventDefault();targetElement.scrollIntoView({behavior:'smooth',block:'start'});}});});}}
+function initScrollSpy(){if(getCurrentPage()!=='index.html')return;const links=Array.from(document.querySelectorAll('.menu a[href*="#"]'));if(!links.length)return;const ids=links.map(a=>(a.hash||'').replace('#','')).filter(Boolean);const sections=ids.map(id=>document.getElementById(id)).filter(Boolean);if(!sections.length)return;const setActive=(id)=>{links.forEach(a=>{const isThis=a.hash===`#${id}`;a.classList.toggle('active',isThis);if(isThis)a.setAttribute('aria-current','page');else a.removeAttribute('aria-current');});};setActive((location.hash||'#inicio').replace('#',''));let ticking=false;const onScroll=()=>{if(ticking)return;ticking=true;requestAnimationFrame(()=>{ticking=false;const refY=window.scrollY+140;let currentId=sections[0].id;for(const sec of sections){if(sec.offsetTop<=refY)currentId=sec.id;}
+setActive(currentId);});};window.addEventListener('scroll',onScroll,{passive:true});window.addEventListener('resize',onScroll);window.addEventListener('hashchange',()=>{setActive((location.hash||'#inicio').replace('#',''));});onScroll();}
+function showLoading(element,message='Carregando...'){if(!element||isPrerendered(element))return;element.innerHTML=`
+    <div class="card" style="text-align: center; padding: 2rem;">
+      <div class="card-title" style="color: var(--text-2);">
+        ${escapeHTML(message)}
+      </div>
+      <div style="margin-top: 1rem;">
+        <div style="display: inline-block; width: 2rem; height: 2rem; border: 3px solid var(--border); border-top-color: var(--accent); border-radius: 50%; animation: spin 0.8s linear infinite;"></div>
+      </div>
+    </div>
+  `;if(!document.getElementById('spin-animation')){const style=document.createElement('style');style.id='spin-animation';style.textContent=`
+      @keyframes spin {
+        to { transform: rotate(360deg); }
+      }
+    `;document.head.appendChild(style);}}
+function showError(element,errorMessage,details=''){if(!element||isPrerendered(element))return;element.innerHTML=`
+    <div class="card" style="border-color: rgba(239, 68, 68, 0.3);">
+      <div class="card-title" style="color: #EF4444;">
+        ⚠️ ${escapeHTML(errorMessage)}
+      </div>
+      <div class="card-sub muted">
+        ${escapeHTML(details)}
+      </div>
+      <div style="margin-top: 1rem;">
+        <button class="btn small primary" onclick="location.reload()">
+          Tentar novamente
+        </button>
+      </div>
+    </div>
+  `;}
+function isPrerendered(element){return element?.dataset.prerendered==='true';}
+function hydratePrerendered(container,items,idAttr,onOpen){if(!isPrerendered(container))return false;const cards=container.querySelectorAll(`[${idAttr}]`);const byId=new Map(items.map(item=>[String(item.id),item]));delete container.dataset.prerendered;if(cards.length!==items.length||![...cards].every(card=>byId.has(card.getAttribute(idAttr)))){return false;}
+cards.forEach(card=>{const item=byId.get(card.getAttribute(idAttr));card.addEventListener('click',()=>onOpen(item));});return true;}
+const cache=new Map();async function fetchWithRetry(url,options={},retries=CONFIG.maxRetries){const cacheKey=url;const cached=cache.get(cacheKey);if(cached&&(Date.now()-cached.timestamp<CONFIG.cacheTime)){return cached.data;}
+for(let i=0;i<retries;i++){try{const response=await fetch(url,{...options,cache:'no-store',headers:{'Content-Type':'application/json',...options.headers}});if(!response.ok){throw new Error(`HTTP ${response.status}: ${response.statusText}`);}
+const data=await response.json();cache.set(cacheKey,{data,timestamp:Date.now()});return data;}catch(error){console.warn(`Tentativa ${i + 1}/${retries} falhou:`,error.message);if(i===retries-1){throw error;}
+await new Promise(resolve=>setTimeout(resolve,1000*(i+1)));}}}
+async function loadProjects(){const grid=document.getElementById('projectsGrid');if(!grid)return;showLoading(grid,'Carregando projetos...');try{const projects=await fetchWithRetry(CONFIG.projectsPath);if(!Array.isArray(projects)){throw new Error('Formato de dados inválido');}
+renderProjects(projects,'all');bindFilters(projects);}catch(error){console.error('Erro ao carregar projetos:',error);showError(grid,'Erro ao carregar projetos',`Verifique se o arquivo ${CONFIG.projectsPath} existe e está com JSON válido. Detalhes: ${error.message}`);}}
+function bindFilters(projects){const chips=document.querySelectorAll('.chip');if(!chips.length)return;chips.forEach(chip=>{chip.addEventListener('click',function(){chips.forEach(c=>c.classList.remove('active'));this.classList.add('active');const filter=this.getAttribute('data-filter')||'all';renderProjects(projects,filter);announceToScreenReader(`Filtro aplicado: ${this.textContent}`);});chip.setAttribute('role','button');chip.setAttribute('tabindex','0');chip.addEventListener('keydown',function(e){if(e.key==='Enter'||e.key===' '){e.preventDefault();this.click();}});});}
+async function loadCerts(){const grid=document.getElementById('certsGrid');if(!grid)return;showLoading(grid,'Carregando certificados...');try{const certs=await fetchWithRetry(CONFIG.certsPath);if(!Array.isArray(certs)){throw new Error('Formato de dados inválido');}
+renderCerts(certs);}catch(error){console.error('Erro ao carregar certificados:',error);showError(grid,'Erro ao carregar certificados',`Verifique se o arquivo ${CONFIG.certsPath} existe e está com JSON válido. Detalhes: ${error.message}`);}}
+function renderCerts(certs){const grid=document.getElementById('certsGrid');if(!grid)return;if(!certs.length){grid.innerHTML=`
+      <div class="card">
+        <div class="card-title">Nenhum certificado cadastrado</div>
+        <div class="card-sub muted">
+          Adicione certificados no arquivo <code>data/certificados.json</code>.
+        </div>
+      </div>
+    `;return;}
+const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');certs.forEach(cert=>{tempDiv.innerHTML=createCertCard(cert);fragment.appendChild(tempDiv.firstElementChild);});grid.innerHTML='';grid.appendChild(fragment);setTimeout(()=>{grid.querySelectorAll('.pcard').forEach((card,index)=>{card.style.opacity='0';card.style.transform='translateY(20px)';setTimeout(()=>{card.style.transition='all 0.4s ease';card.style.opacity='1';card.style.transform='translateY(0)';},index*50);});},10);}
+function createCertCard(cert){const{titulo='Certificado sem título',tipo='certificado',descricao='',instituicao='',ano='',link='#'}=cert;const instTag=instituicao?`<span class="tag">${escapeHTML(instituicao)}</span>`:'';const anoTag=ano?`<span class="tag">${escapeHTML(ano)}</span>`:'';return`
+    <article class="pcard">
+      <div class="p-top">
+        <h3 class="p-title">${escapeHTML(titulo)}</h3>
+        <span class="p-type">${escapeHTML(tipo)}</span>
+      </div>
+
+      <p class="p-desc">${escapeHTML(descricao)}</p>
+
+      <div class="tags">
+        ${instTag}
+        ${anoTag}
+      </div>
+
+      <div class="p-actions">
+        <a class="btn small primary" 
+           href="${link}" 
+           target="_blank" 
+           rel="noopener noreferrer"
+           aria-label="Abrir certificado ${escapeHTML(titulo)}">
+          Abrir certificado
+        </a>
+      </div>
+    </article>
+  `;}
+function announceToScreenReader(message){const announcement=document.createElement('div');announcement.setAttribute('role','status');announcement.setAttribute('aria-live','polite');announcement.className='sr-only';announcement.textContent=message;document.body.appendChild(announcement);setTimeout(()=>{document.body.removeChild(announcement);},1000);}
+function manageFocus(){const hash=window.location.hash;if(hash){const target=document.querySelector(hash);if(target){target.setAttribute('tabindex','-1');target.focus();target.removeAttribute('tabindex');}}}
+function initLazyLoading(){if('loading'in HTMLImageElement.prototype){const images=document.querySelectorAll('img[loading="lazy"]');images.forEach(img=>{img.src=img.dataset.src||img.src;});}else{const images=document.querySelectorAll('img[loading="lazy"]');const imageObserver=new IntersectionObserver((entries,observer)=>{entries.forEach(entry=>{if(entry.isIntersecting){const img=entry.target;img.src=img.dataset.src||img.src;img.classList.remove('lazy');imageObserver.unobserve(img);}});});images.forEach(img=>imageObserver.observe(img));}}
+function updateHeroScale(){const hero=document.querySelector('.hero');if(!hero)return;const canvas=hero.querySelector('.hero-canvas');if(!canvas)return;if(window.innerWidth<=900){hero.style.removeProperty('--hero-scale');return;}
+const w=hero.clientWidth;const h=hero.clientHeight;const scale=Math.min(w/1536,h/730);hero.style.setProperty('--hero-scale',scale);}
+let allProjects=[];let currentProject=null;async function loadFeaturedProjects(){const grid=document.getElementById('featuredProjectsGrid');if(!grid)return;showLoading(grid,'Carregando projetos em destaque...');try{const projects=await fetchWithRetry(CONFIG.projectsPath);if(!Array.isArray(projects)){throw new Error('Formato de dados inválido');}
+allProjects=projects;const featured=projects.filter(p=>p.destaque===true);if(!featured.length){grid.innerHTML=`
+        <div class="card">
+          <div class="card-title">Nenhum projeto em destaque</div>
+          <div class="card-sub muted">
+            Configure projetos com "destaque": true no arquivo JSON.
+          </div>
+        </div>
+      `;return;}
+if(!hydratePrerendered(grid,featured,'data-project-id',openProjectModal)){renderFeaturedProjects(featured,grid);}}catch(error){console.error('Erro ao carregar projetos em destaque:',error);showError(grid,'Erro ao carregar projetos',`Detalhes: ${error.message}`);}}
+function renderFeaturedProjects(projects,container){const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');projects.forEach(project=>{tempDiv.innerHTML=createFeaturedCard(project);const card=tempDiv.firstElementChild;card.addEventListener('click',()=>openProjectModal(project));fragment.appendChild(card);});container.innerHTML='';container.appendChild(fragment);animateCards(container);}
+function createFeaturedCard(project){const{id,titulo,tipo,descricao,tags=[],thumbnail}=project;const tagsList=tags.slice(0,3).map(tag=>`<span class="tag">${escapeHTML(tag)}</span>`).join('');return`
+    <article class="featured-card" data-project-id="${id}">
+      <img 
+        src="${thumbnail || 'assets/img/projetos/placeholder.png'}" 
+        alt="Preview de ${escapeHTML(titulo)}" 
+        class="featured-thumb"
+        loading="lazy"
+      />
+      <div class="featured-body">
+        <div class="featured-header">
+          <h3 class="featured-title">${escapeHTML(titulo)}</h3>
+          <span class="featured-type">${escapeHTML(tipo)}</span>
+        </div>
+        <p class="featured-desc">${escapeHTML(descricao)}</p>
+        <div class="featured-footer">
+          <div class="featured-tags">
+            ${tagsList}
+          </div>
+          <span class="featured-link">
+            Ver detalhes
+            <svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+              <path d="M6 3L11 8L6 13" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+          </span>
+        </div>
+      </div>
+    </article>
+  `;}
+async function loadAllProjects(){const grid=document.getElementById('projectsGrid');if(!grid)return;showLoading(grid,'Carregando projetos...');try{const projects=await fetchWithRetry(CONFIG.projectsPath);if(!Array.isArray(projects)){throw new Error('Formato de dados inválido');}
+allProjects=projects;if(!hydratePrerendered(grid,projects,'data-project-id',openProjectModal)){renderProjects(projects,'all');}
+bindFilters(projects);initModalHandlers();}catch(error){console.error('Erro ao carregar projetos:',error);showError(grid,'Erro ao carregar projetos',`Detalhes: ${error.message}`);}}
+function renderProjects(projects,filter){const grid=document.getElementById('projectsGrid');if(!grid)return;const filtered=(filter==='all')?projects:projects.filter(p=>(p.tipo||'').toLowerCase()===filter.toLowerCase());if(!filtered.length){grid.innerHTML=`
+      <div class="card">
+        <div class="card-title">Nenhum projeto encontrado</div>
+        <div class="card-sub muted">
+          Tente outro filtro ou adicione projetos no arquivo JSON.
+        </div>
+      </div>
+    `;return;}
+const fragment=document.createDocumentFragment();const tempDiv=document.createElement('div');filtered.forEach(project=>{tempDiv.innerHTML=createProjectCard(project);const card=tempDiv.firstElementChild;card.addEventListener('click',()=>openProjectModal(project));fragment.appendChild(card);});grid.innerHTML='';grid.appendChild(fragment);animateCards(grid);}
+function createProjectCard(project){const{id,titulo,tipo,descricao,tags=[],thumbnail,destaque}=project;const tagsList=tags.slice(0,4).map(tag=>`<span class="tag">${escapeHTML(tag)}</span>`).join('');const destaqueBadge=destaque?'<span class="tag" style="background: rgba(242, 140, 40, 0.2); border-color: rgba(242, 140, 40, 0.4); color: var(--accent);">★ Destaque</span>':'';return`
+    <article class="pcard-with-thumb" data-project-id="${id}">
+      <img 
+        src="${thumbnail || 'assets/img/projetos/placeholder.png'}" 
+        alt="Preview de ${escapeHTML(titulo)}" 
+        class="pcard-thumb"
+        loading="lazy"
+      />
+      <div class="pcard-body">
+        <div class="p-top">
+          <h3 class="p-title">${escapeHTML(titulo)}</h3>
+          <span class="p-type">${escapeHTML(tipo)}</span>
+        </div>
+        <p class="p-desc">${escapeHTML(descricao)}</p>
+        <div class="tags">
+          ${destaqueBadge}
+          ${tagsList}
+        </div>
+      </div>
+    </article>
+  `;}
+function animateCards(container){setTimeout(()=>{container.querySelectorAll('.featured-card, .pcard-with-thumb').forEach((card,index)=>{card.style.opacity='0';card.style.transform='translateY(20px)';setTimeout(()=>{card.style.transition='all 0.4s cubic-bezier(0.16, 1, 0.3, 1)';card.style.opacity='1';card.style.transform='translateY(0)';},index*60);});},10);}
+function openProjectModal(project){currentProject=project;const modal=document.getElementById('projectModal');if(!modal)return;populateModal(project);modal.classList.add('active');modal.setAttribute('aria-hidden','false');document.body.classList.add('modal-open');setTimeout(()=>{const closeBtn=modal.querySelector('.modal-close');if(closeBtn)closeBtn.focus();},100);}
+function closeProjectModal(){const modal=document.getElementById('projectModal');if(!modal)return;modal.classList.remove('active');modal.setAttribute('aria-hidden','true');document.body.classList.remove('modal-open');currentProject=null;}
+function populateModal(project){const{titulo,tipo,descricao,descricaoCompleta,status='Concluído',screenshots=[],tecnologias=[],desafios=[],resultados=[],links={}}=project;document.getElementById('modalType').textContent=tipo;document.getElementById('modalStatus').textContent=status;document.getElementById('modalTitle').textContent=titulo;document.getElementById('modalDesc').textContent=descricao;const screenshotsContainer=document.getElementById('modalScreenshots');if(screenshots.length>0){screenshotsContainer.innerHTML=screenshots.map(url=>`
+        <img 
+          src="${url}" 
+          alt="Screenshot do projeto ${escapeHTML(titulo)}" 
+          class="modal-screenshot"
+          loading="lazy"
+        />
+      `).join('');screenshotsContainer.style.display='grid';}else{screenshotsContainer.style.display='none';}
+document.getElementById('modalDescCompleta').textContent=descricaoCompleta||descricao;const tecContainer=document.getElementById('modalTecnologias');if(tecnologias.length>0){tecContainer.innerHTML=tecnologias.map(tec=>`<span class="tag">${escapeHTML(tec)}</span>`).join('');}
+const desafiosSection=document.getElementById('modalDesafiosSection');const desafiosList=document.getElementById('modalDesafios');if(desafios.length>0){desafiosList.innerHTML=desafios.map(d=>`<li>${escapeHTML(d)}</li>`).join('');desafiosSection.style.display='block';}else{desafiosSection.style.display='none';}
+const resultadosSection=document.getElementById('modalResultadosSection');const resultadosList=document.getElementById('modalResultados');if(resultados.length>0){resultadosList.innerHTML=resultados.map(r=>`<li>${escapeHTML(r)}</li>`).join('');resultadosSection.style.display='block';}else{resultadosSection.style.display='none';}
+const verBtn=document.getElementById('modalVerBtn');const repoBtn=document.getElementById('modalRepoBtn');if(links.ver&&links.ver!=='#'){verBtn.href=links.ver;verBtn.style.display='inline-flex';}else{verBtn.style.display='none';}
+if(links.repo&&links.repo!=='#'){repoBtn.href=links.repo;repoBtn.style.display='inline-flex';}else{repoBtn.style.display='none';}}
+function initModalHandlers(){const modal=document.getElementById('projectModal');if(!modal)return;modal.querySelectorAll('[data-close-modal]').forEach(el=>{el.addEventListener('click',closeProjectModal);});document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active')){closeProjectModal();}});const modalContent=modal.querySelector('.modal-content');if(modalContent){modalContent.addEventListener('click',(e)=>{e.stopPropagation();});}}
+function initProjects(){if(document.getElementById('projectModal')){initModalHandlers();}
+if(document.getElementById('featuredProjectsGrid')){loadFeaturedProjects();}
+if(document.getElementById('projectsGrid')&&!document.getElementById('featuredProjectsGrid')){loadAllProjects();}}
+window.portfolioApp={...window.portfolioApp,loadFeaturedProjects,loadAllProjects,openProjectModal,closeProjectModal};window.portfolioApp={loadProjects,loadCerts,renderProjects,renderCerts};function initCertificates(){}
+function initDiplomas(){}
+function initTimelineToggle(){const timeline=document.getElementById('timelineContent');const toggleBtn=document.getElementById('toggleTimeline');if(!timeline||!toggleBtn)return;const toggleText=toggleBtn.querySelector('.toggle-text');toggleBtn.addEventListener('click',function(){const isExpanded=this.getAttribute('aria-expanded')==='true';if(isExpanded){timeline.classList.remove('expanded');this.setAttribute('aria-expanded','false');toggleText.textContent='Ver mais';setTimeout(()=>{timeline.scrollIntoView({behavior:'smooth',block:'start'});},100);}else{timeline.classList.add('expanded');this.setAttribute('aria-expanded','true');toggleText.textContent='Ver menos';}
+announceToScreenReader(isExpanded?'Seção recolhida':'Seção expandida');});toggleBtn.addEventListener('keydown',function(e){if(e.key==='Enter'||e.key===' '){e.preventDefault();this.click();}});}
+function registerServiceWorker(){if(!('serviceWorker'in navigator)||location.protocol==='file:')return;navigator.serviceWorker.register('sw.js').catch(error=>{console.warn('Service worker não registrado:',error.message);});}
+function init(){try{setTopbar();setYear();initSmoothScroll();initScrollSpy();initLazyLoading();manageFocus();initTimelineToggle();initProjects();initDiplomas();initCertificates();window.addEventListener('hashchange',manageFocus);registerServiceWorker();console.log('✅ Portfólio inicializado com sucesso!');}catch(error){console.error('❌ Erro na inicialização:',error);}
+updateHeroScale();window.addEventListener('resize',debounce(updateHeroScale,80));}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',init);}else{init();}
@@ -6,6 +6,8 @@ const CONFIG = {
   projectsPath: 'data/projetos.json',
   certsPath: 'data/certificados.json',
   diplomasPath: 'data/diplomas.json',
+  relacionadosPath: 'data/relacionados.json',
+  facetasPath: 'data/facetas.json',
   cacheTime: 60000, // 1 minuto
   maxRetries: 3
 };
@@ -228,7 +230,7 @@ function initScrollSpy() {
 // ===============================
 
 function showLoading(element, message = 'Carregando...') {
-  if (!element) return;
+  if (!element || isPrerendered(element)) return;
   
   element.innerHTML = `
     <div class="card" style="text-align: center; padding: 2rem;">
@@ -255,7 +257,8 @@ function showLoading(element, message = 'Carregando...') {
 }
 
 function showError(element, errorMessage, details = '') {
-  if (!element) return;
+  // Cards pré-renderizados continuam válidos mesmo se o JSON falhar
+  if (!element || isPrerendered(element)) return;
   
   element.innerHTML = `
     <div class="card" style="border-color: rgba(239, 68, 68, 0.3);">
@@ -274,6 +277,35 @@ function showError(element, errorMessage, details = '') {
   `;
 }
 
+// ===============================
+// CARDS PRÉ-RENDERIZADOS (data/prerender.py)
+// ===============================
+
+function isPrerendered(element) {
+  return element?.dataset.prerendered === 'true';
+}
+
+// Liga os cliques nos cards que já vieram no HTML em vez de recriá-los.
+// Retorna false se o HTML não bate com o JSON (aí o chamador renderiza).
+function hydratePrerendered(container, items, idAttr, onOpen) {
+  if (!isPrerendered(container)) return false;
+
+  const cards = container.querySelectorAll(`[${idAttr}]`);
+  const byId = new Map(items.map(item => [String(item.id), item]));
+
+  delete container.dataset.prerendered;
+  if (cards.length !== items.length ||
+      ![...cards].every(card => byId.has(card.getAttribute(idAttr)))) {
+    return false;
+  }
+
+  cards.forEach(card => {
+    const item = byId.get(card.getAttribute(idAttr));
+    card.addEventListener('click', () => onOpen(item));
+  });
+  return true;
+}
+
 // ===============================
 // FETCH COM RETRY E CACHE
 // ===============================
@@ -718,7 +750,9 @@ async function loadFeaturedProjects() {
       return;
     }
 
-    renderFeaturedProjects(featured, grid);
+    if (!hydratePrerendered(grid, featured, 'data-project-id', openProjectModal)) {
+      renderFeaturedProjects(featured, grid);
+    }
 
   } catch (error) {
     console.error('Erro ao carregar projetos em destaque:', error);
@@ -812,7 +846,9 @@ async function loadAllProjects() {
     }
 
     allProjects = projects;
-    renderProjects(projects, 'all');
+    if (!hydratePrerendered(grid, projects, 'data-project-id', openProjectModal)) {
+      renderProjects(projects, 'all');
+    }
     bindFilters(projects);
     initModalHandlers();
 
@@ -1132,6 +1168,8 @@ window.portfolioApp = {
 
 let allCertificates = [];
 let currentCertificate = null;
+let certFacets = null; // data/facetas.json (contagens e ordenações pré-calculadas)
+let encerrarZoom = null; // desliga o viewer de zoom aberto no modal (ResizeObserver, frame pendente)
 
 // Carrega certificados em destaque (index.html)
 async function loadFeaturedCertificates() {
@@ -1150,14 +1188,11 @@ async function loadFeaturedCertificates() {
     allCertificates = certificates;
     const featured = certificates.filter(c => c.destaque === true);
 
-    if (!featured.length) {
-      const fallback = certificates.slice(0, 3);
-      renderFeaturedCertificates(fallback, grid);
-      return;
+    const toShow = featured.length ? featured : certificates.slice(0, 3);
+    if (!hydratePrerendered(grid, toShow, 'data-cert-id', openCertificateModal)) {
+      renderFeaturedCertificates(toShow, grid);
     }
 
-    renderFeaturedCertificates(featured, grid);
-
   } catch (error) {
     console.error('Erro ao carregar certificados em destaque:', error);
     showError(grid, 'Erro ao carregar certificados', `Detalhes: ${error.message}`);
@@ -1192,6 +1227,7 @@ function createFeaturedCertCard(cert) {
     tipo,
     descricao,
     thumbnail,
+    mosaico,
     duracao,
     destaque,
     certificados = []
@@ -1217,7 +1253,7 @@ function createFeaturedCertCard(cert) {
       ${certCount}
       <img 
         src="${
-          (tipo === 'Formação'
+          mosaico || (tipo === 'Formação'
             ? (certificados?.find(c => c.isFormacao)?.preview || thumbnail)
             : thumbnail
           ) || 'assets/img/certificados/placeholder-cert.png'
@@ -1283,6 +1319,7 @@ function createCertificateCard(cert) {
     tipo,
     descricao,
     thumbnail,
+    mosaico,
     destaque,
     certificados = []
   } = cert;
@@ -1305,7 +1342,7 @@ function createCertificateCard(cert) {
     <article class="${cardClass}" data-cert-id="${id}">
       <img 
         src="${
-          (tipo === 'Formação'
+          mosaico || (tipo === 'Formação'
             ? (certificados?.find(c => c.isFormacao)?.preview || thumbnail)
             : thumbnail
           ) || 'assets/img/certificados/placeholder-cert.png'
@@ -1372,23 +1409,26 @@ function animateCertCards(container) {
 // 1. GERAÇÃO DINÂMICA DE FILTROS
 // ===============================
 
-function generateDynamicFilters(certificates) {
+function generateDynamicFilters(certificates, facetas = null) {
   const filtersSection = document.querySelector('.filters');
   if (!filtersSection) return;
 
-  // Coleta categorias únicas e conta certificados
-  const categoryCounts = {};
-  
-  certificates.forEach(cert => {
-    const categoria = cert.categoria || 'Sem Categoria';
-    categoryCounts[categoria] = (categoryCounts[categoria] || 0) + 1;
-  });
+  // Contagem por categoria: pré-calculada no build ou, sem facetas, contada aqui
+  let categoryCounts = facetas ? facetas.categorias : null;
+
+  if (!categoryCounts) {
+    categoryCounts = {};
+    certificates.forEach(cert => {
+      const categoria = cert.categoria || 'Sem Categoria';
+      categoryCounts[categoria] = (categoryCounts[categoria] || 0) + 1;
+    });
+  }
 
   // Ordena categorias alfabeticamente
   const sortedCategories = Object.keys(categoryCounts).sort();
 
   // Conta total
-  const totalCount = certificates.length;
+  const totalCount = facetas ? facetas.total : certificates.length;
 
   // Gera HTML dos chips
   const chipsHTML = [
@@ -1425,7 +1465,9 @@ function renderAllCertificates(certificates, filter = 'all', searchTerm = '') {
   let filtered = certificates;
 
   // Aplica filtro de categoria
-  if (filter !== 'all') {
+  if (filter !== 'all' && certFacets && certificates === allCertificates) {
+    filtered = certificatesByCategory(certificates, filter);
+  } else if (filter !== 'all') {
     filtered = filtered.filter(cert => {
       const categoria = (cert.categoria || '').toLowerCase();
       const filterLower = filter.toLowerCase();
@@ -1499,6 +1541,25 @@ function renderAllCertificates(certificates, filter = 'all', searchTerm = '') {
   announceToScreenReader(`${filtered.length} certificado${filtered.length !== 1 ? 's' : ''} encontrado${filtered.length !== 1 ? 's' : ''}`);
 }
 
+// Mesmo critério do filtro acima (exato ou parcial), mas pelas ordenações
+// pré-calculadas: percorre só as categorias, não os certificados
+function certificatesByCategory(certificates, filter) {
+  const filterLower = filter.toLowerCase();
+  const lists = Object.entries(certFacets.ordens.categorias)
+    .filter(([categoria]) => {
+      const lower = categoria.toLowerCase();
+      return lower === filterLower || lower.includes(filterLower);
+    })
+    .map(([, ids]) => ids);
+
+  const position = new Map(certificates.map((cert, idx) => [cert.id, idx]));
+  const indexes = lists.flat().map(id => position.get(id)).filter(idx => idx !== undefined);
+
+  // Várias categorias: volta para a ordem do catálogo
+  if (lists.length > 1) indexes.sort((a, b) => a - b);
+  return indexes.map(idx => certificates[idx]);
+}
+
 // ===============================
 // 3. BIND DE FILTROS
 // ===============================
@@ -1579,22 +1640,29 @@ async function loadAllCertificates() {
   showLoading(grid, 'Carregando certificados...');
 
   try {
-    const certificates = await fetchWithRetry(CONFIG.certsPath);
+    const [certificates, facetas] = await Promise.all([
+      fetchWithRetry(CONFIG.certsPath),
+      // Sem facetas a página continua funcionando, só volta a contar no navegador
+      fetchWithRetry(CONFIG.facetasPath, {}, 1).catch(() => null)
+    ]);
 
     if (!Array.isArray(certificates)) {
       throw new Error('Formato de dados inválido');
     }
 
     allCertificates = certificates;
+    certFacets = facetas && facetas.total === certificates.length ? facetas : null;
     
     // 1. Gera filtros dinâmicos com contagem
-    generateDynamicFilters(certificates);
+    generateDynamicFilters(certificates, certFacets);
     
     // 2. Inicializa busca
     initCertSearch(certificates);
     
-    // 3. Renderiza todos inicialmente
-    renderAllCertificates(certificates, 'all', '');
+    // 3. Renderiza todos inicialmente (ou só hidrata o HTML pré-renderizado)
+    if (!hydratePrerendered(grid, certificates, 'data-cert-id', openCertificateModal)) {
+      renderAllCertificates(certificates, 'all', '');
+    }
     
     // 4. Inicializa handlers do modal
     initCertModalHandlers();
@@ -1665,14 +1733,15 @@ function initCertificates() {
 // 9. ESTATÍSTICAS (BONUS)
 // ===============================
 
-function showCertStatistics(certificates) {
+function showCertStatistics(certificates, facetas = certFacets) {
   const statsContainer = document.querySelector('.cert-stats');
   if (!statsContainer) return;
 
-  const total = certificates.length;
-  const emDestaque = certificates.filter(c => c.destaque).length;
-  const categorias = new Set(certificates.map(c => c.categoria)).size;
-  const instituicoes = new Set(certificates.map(c => c.instituicao)).size;
+  // Com facetas (data/facetas.json) não precisa varrer o catálogo
+  const total = facetas ? facetas.total : certificates.length;
+  const emDestaque = facetas ? facetas.destaques : certificates.filter(c => c.destaque).length;
+  const categorias = facetas ? Object.keys(facetas.categorias).length : new Set(certificates.map(c => c.categoria)).size;
+  const instituicoes = facetas ? Object.keys(facetas.instituicoes).length : new Set(certificates.map(c => c.instituicao)).size;
 
   statsContainer.innerHTML = `
     <div class="stats-grid">
@@ -1697,7 +1766,7 @@ function showCertStatistics(certificates) {
 }
 
 // Para usar: chame após carregar os certificados
-// showCertStatistics(certificates);
+// showCertStatistics(certificates);  // usa certFacets quando disponível
 
 // ✅ INICIALIZAÇÃO UNIFICADA
 function initCertificates() {
@@ -1748,9 +1817,11 @@ function closeCertificateModal() {
   modal.setAttribute('aria-hidden', 'true');
   document.body.classList.remove('modal-open');
   currentCertificate = null;
+  encerrarZoomAtual();
 }
 
 function populateCertModal(cert) {
+  encerrarZoomAtual();  // o viewer do certificado anterior sai com o preview
   const {
     titulo,
     instituicao,
@@ -1828,6 +1899,9 @@ function populateCertModal(cert) {
     previewContainer.style.display = 'none';
   }
 
+  // Zoom profundo (só quando o build gerou a pirâmide de tiles)
+  renderCertZoom(cert, previewContainer);
+
   // Descrição completa
   document.getElementById('certModalDescCompleta').textContent = 
     descricaoCompleta || descricao;
@@ -1842,6 +1916,9 @@ function populateCertModal(cert) {
     compContainer.innerHTML = '<p style="color: var(--muted); font-size: 0.875rem;">Nenhuma competência listada</p>';
   }
 
+  // Relacionados (pré-calculados no build)
+  renderRelatedCertificates(cert);
+
   // Links
   const verBtn = document.getElementById('certModalVerBtn');
   const repoBtn = document.getElementById('certModalRepoBtn');
@@ -1857,6 +1934,256 @@ function populateCertModal(cert) {
   verBtn.style.display = 'none';
 }
 
+// ===============================
+// ZOOM PROFUNDO (tiles gerados por data/piramides.py)
+// ===============================
+
+function encerrarZoomAtual() {
+  if (encerrarZoom) encerrarZoom();
+  encerrarZoom = null;
+}
+
+async function renderCertZoom(cert, container) {
+  if (!cert.zoom || !container) return;
+
+  let descritor;
+  try {
+    descritor = await fetchWithRetry(cert.zoom, {}, 1);
+  } catch (error) {
+    console.warn('Zoom indisponível:', error.message);
+    return;
+  }
+  // O modal pode ter trocado de certificado enquanto carregava
+  if (currentCertificate !== cert || !descritor.paginas?.length) return;
+
+  const viewer = document.createElement('div');
+  viewer.className = 'zoom-viewer';
+  viewer.innerHTML = `
+    <div class="zoom-area" tabindex="0" aria-label="Certificado ampliável: use a roda do mouse, arraste, dê dois cliques ou use + e -"></div>
+    <div class="zoom-controles">
+      <button type="button" class="zoom-btn" data-zoom="out" aria-label="Diminuir zoom">−</button>
+      <button type="button" class="zoom-btn" data-zoom="fit" aria-label="Ajustar ao tamanho">⤢</button>
+      <button type="button" class="zoom-btn" data-zoom="in" aria-label="Aumentar zoom">+</button>
+      ${descritor.paginas.length > 1 ? `
+        <select class="zoom-pagina" aria-label="Página">
+          ${descritor.paginas.map((p, idx) => `<option value="${idx}">Página ${p.pagina + 1}</option>`).join('')}
+        </select>
+      ` : ''}
+    </div>
+  `;
+  // O viewer substitui o preview único (a galeria, se houver, continua abaixo)
+  container.querySelector(':scope > img')?.remove();
+  container.prepend(viewer);
+  container.style.display = 'block';
+
+  initZoomViewer(viewer, descritor, cert.zoom.slice(0, cert.zoom.lastIndexOf('/') + 1));
+}
+
+function initZoomViewer(viewer, descritor, base) {
+  const area = viewer.querySelector('.zoom-area');
+  const fundo = document.createElement('img');
+  const camada = document.createElement('div');
+  fundo.className = 'zoom-fundo';
+  fundo.alt = '';
+  camada.className = 'zoom-camada';
+  area.append(fundo, camada);
+
+  // escala = px de tela por px do nível mais alto (1 = resolução máxima)
+  const state = { pagina: descritor.paginas[0], escala: 1, minimo: 1, x: 0, y: 0, nivel: -1, tiles: new Set(), frame: 0 };
+  const topo = () => state.pagina.niveis[state.pagina.niveis.length - 1];
+  const tileUrl = (n, col, lin) => `${base}p${state.pagina.pagina}/${n}/${col}_${lin}.${descritor.formato}`;
+
+  function posicionar(el, nivel) {
+    const escala = state.escala * topo().largura / nivel.largura;
+    el.style.width = `${nivel.largura}px`;
+    el.style.height = `${nivel.altura}px`;
+    el.style.transform = `translate(${state.x}px, ${state.y}px) scale(${escala})`;
+  }
+
+  function limitar() {
+    const { largura, altura } = topo();
+    state.escala = Math.min(Math.max(state.escala, state.minimo), 1);
+    state.x = Math.min(0, Math.max(area.clientWidth - largura * state.escala, state.x));
+    state.y = Math.min(0, Math.max(area.clientHeight - altura * state.escala, state.y));
+    area.classList.toggle('ampliado', state.escala > state.minimo * 1.001);
+  }
+
+  function desenhar() {
+    state.frame = 0;
+    const niveis = state.pagina.niveis;
+    const dpr = window.devicePixelRatio || 1;
+
+    // Menor nível com resolução suficiente para a escala atual
+    let n = niveis.findIndex(nv => nv.largura >= topo().largura * state.escala * dpr);
+    if (n < 0) n = niveis.length - 1;
+    const nivel = niveis[n];
+
+    // Fundo: o nível 0 (um tile só) cobre a página enquanto os tiles chegam
+    posicionar(fundo, niveis[0]);
+    if (n !== state.nivel) {
+      state.nivel = n;
+      state.tiles.clear();
+      camada.innerHTML = '';
+    }
+    posicionar(camada, nivel);
+    if (n === 0) return;
+
+    // Só os tiles visíveis são pedidos
+    const t = descritor.tile;
+    const escala = state.escala * topo().largura / nivel.largura;
+    const colunas = Math.ceil(nivel.largura / t);
+    const linhas = Math.ceil(nivel.altura / t);
+    const c0 = Math.max(0, Math.floor(-state.x / escala / t));
+    const c1 = Math.min(colunas - 1, Math.floor((area.clientWidth - state.x) / escala / t));
+    const l0 = Math.max(0, Math.floor(-state.y / escala / t));
+    const l1 = Math.min(linhas - 1, Math.floor((area.clientHeight - state.y) / escala / t));
+
+    for (let lin = l0; lin <= l1; lin++) {
+      for (let col = c0; col <= c1; col++) {
+        const chave = `${col}_${lin}`;
+        if (state.tiles.has(chave)) continue;
+        state.tiles.add(chave);
+        const img = document.createElement('img');
+        img.alt = '';
+        img.decoding = 'async';
+        img.style.left = `${col * t}px`;
+        img.style.top = `${lin * t}px`;
+        img.style.width = `${Math.min(t, nivel.largura - col * t)}px`;
+        img.style.height = `${Math.min(t, nivel.altura - lin * t)}px`;
+        img.src = tileUrl(n, col, lin);
+        camada.appendChild(img);
+      }
+    }
+  }
+
+  function agendar() {
+    if (!state.frame) state.frame = requestAnimationFrame(desenhar);
+  }
+
+  function ajustar() {
+    const { largura, altura } = topo();
+    area.style.aspectRatio = `${largura} / ${altura}`;
+    fundo.src = tileUrl(0, 0, 0);
+    if (!area.clientWidth) return;  // ainda fora da tela: o ResizeObserver chama de novo
+    state.minimo = Math.min(1, area.clientWidth / largura);
+    state.escala = state.minimo;
+    state.x = state.y = 0;
+    limitar();
+    agendar();
+  }
+
+  function zoomEm(fator, cx = area.clientWidth / 2, cy = area.clientHeight / 2) {
+    const anterior = state.escala;
+    if (!anterior) return;
+    const nova = Math.min(Math.max(anterior * fator, state.minimo), 1);
+    state.x = cx - (cx - state.x) * nova / anterior;
+    state.y = cy - (cy - state.y) * nova / anterior;
+    state.escala = nova;
+    limitar();
+    agendar();
+  }
+
+  function pontoNaArea(event) {
+    const rect = area.getBoundingClientRect();
+    return [event.clientX - rect.left, event.clientY - rect.top];
+  }
+
+  area.addEventListener('wheel', (e) => {
+    // Sem ter para onde ir, a roda volta a rolar o modal
+    if ((e.deltaY < 0 && state.escala >= 1) || (e.deltaY > 0 && state.escala <= state.minimo)) return;
+    e.preventDefault();
+    zoomEm(Math.exp(-e.deltaY * 0.002), ...pontoNaArea(e));
+  }, { passive: false });
+
+  area.addEventListener('dblclick', (e) => zoomEm(2, ...pontoNaArea(e)));
+
+  let arrasto = null;
+  area.addEventListener('pointerdown', (e) => {
+    if (!area.classList.contains('ampliado')) return;
+    arrasto = { x: e.clientX, y: e.clientY };
+    area.setPointerCapture(e.pointerId);
+  });
+  area.addEventListener('pointermove', (e) => {
+    if (!arrasto) return;
+    state.x += e.clientX - arrasto.x;
+    state.y += e.clientY - arrasto.y;
+    arrasto = { x: e.clientX, y: e.clientY };
+    limitar();
+    agendar();
+  });
+  ['pointerup', 'pointercancel'].forEach(tipo => area.addEventListener(tipo, () => { arrasto = null; }));
+
+  area.addEventListener('keydown', (e) => {
+    if (e.key === '+' || e.key === '=') zoomEm(1.5);
+    else if (e.key === '-') zoomEm(1 / 1.5);
+    else if (e.key === '0') ajustar();
+  });
+
+  viewer.querySelectorAll('[data-zoom]').forEach(btn => {
+    btn.addEventListener('click', () => {
+      if (btn.dataset.zoom === 'in') zoomEm(1.5);
+      else if (btn.dataset.zoom === 'out') zoomEm(1 / 1.5);
+      else ajustar();
+    });
+  });
+
+  viewer.querySelector('.zoom-pagina')?.addEventListener('change', (e) => {
+    state.pagina = descritor.paginas[Number(e.target.value)];
+    state.nivel = -1;
+    ajustar();
+  });
+
+  // O modal pode abrir depois (largura 0 agora) ou mudar de tamanho
+  let largura = 0;
+  const observador = new ResizeObserver(() => {
+    if (area.clientWidth && area.clientWidth !== largura) {
+      largura = area.clientWidth;
+      ajustar();
+    }
+  });
+  observador.observe(area);
+
+  // Desligado quando o modal fecha ou recebe outro certificado
+  encerrarZoomAtual();
+  encerrarZoom = () => {
+    observador.disconnect();
+    if (state.frame) cancelAnimationFrame(state.frame);
+    state.frame = 0;
+  };
+  ajustar();
+}
+
+async function renderRelatedCertificates(cert) {
+  const section = document.getElementById('certModalRelacionadosSection');
+  const container = document.getElementById('certModalRelacionados');
+  if (!section || !container) return;
+
+  section.hidden = true;
+  container.innerHTML = '';
+
+  let relacionados;
+  try {
+    relacionados = await fetchWithRetry(CONFIG.relacionadosPath);
+  } catch (error) {
+    console.warn('Relacionados indisponíveis:', error.message);
+    return;
+  }
+  // O modal pode ter trocado de certificado enquanto carregava
+  if (currentCertificate !== cert) return;
+
+  const byId = new Map(allCertificates.map(c => [c.id, c]));
+  const related = (relacionados[cert.id] || []).map(id => byId.get(id)).filter(Boolean);
+  if (related.length === 0) return;
+
+  container.innerHTML = related
+    .map(c => `<button type="button" class="tag" data-cert-id="${escapeHTML(c.id)}">${escapeHTML(c.titulo)}</button>`)
+    .join('');
+  container.querySelectorAll('[data-cert-id]').forEach(btn => {
+    btn.addEventListener('click', () => openCertificateModal(byId.get(btn.dataset.certId)));
+  });
+  section.hidden = false;
+}
+
 function initCertModalHandlers() {
   const modal = document.getElementById('certModal');
   if (!modal) return;
@@ -1930,7 +2257,9 @@ async function loadFeaturedDiplomas() {
       return;
     }
 
-    renderFeaturedDiplomas(featured, grid);
+    if (!hydratePrerendered(grid, featured, 'data-diploma-id', openDiplomaModal)) {
+      renderFeaturedDiplomas(featured, grid);
+    }
 
   } catch (error) {
     console.error('Erro ao carregar diplomas:', error);
@@ -2072,8 +2401,10 @@ async function loadAllDiplomas() {
 
     allDiplomas = diplomas;
     
-    // Renderiza grid
-    renderAllDiplomasGrid(diplomas, grid);
+    // Renderiza grid (ou só hidrata o HTML pré-renderizado)
+    if (!hydratePrerendered(grid, diplomas, 'data-diploma-id', openDiplomaModal)) {
+      renderAllDiplomasGrid(diplomas, grid);
+    }
     
     // Renderiza timeline se existir
     if (timeline) {
@@ -2484,6 +2815,20 @@ function initTimelineToggle() {
   });
 }
 
+// ===============================
+// SERVICE WORKER
+// ===============================
+
+// O sw.js serve catálogos e imagens pela versão do data/manifesto.json:
+// o que não mudou vem do cache, só o que mudou é baixado de novo
+function registerServiceWorker() {
+  if (!('serviceWorker' in navigator) || location.protocol === 'file:') return;
+
+  navigator.serviceWorker.register('sw.js').catch(error => {
+    console.warn('Service worker não registrado:', error.message);
+  });
+}
+
 // ===============================
 // INICIALIZAÇÃO PRINCIPAL
 // ===============================
@@ -2508,6 +2853,9 @@ function init() {
     initCertificates();
     
     window.addEventListener('hashchange', manageFocus);
+
+    // ✅ Cache por hash de conteúdo (sw.js + data/manifesto.json)
+    registerServiceWorker();
     
     console.log('✅ Portfólio inicializado com sucesso!');
     
@@ -0,0 +1,293 @@
+"""
+Micro-benchmarks dos helpers do extrator
+========================================
+
+Mede ops/s e memória alocada pelo Python (pico por chamada, via tracemalloc;
+buffers internos do MuPDF não entram) dos helpers puros de
+extrator_certificados.py, com fixtures de tamanho realista e de pior caso
+geradas de forma determinística (PDFs via PyMuPDF, READMEs sintéticos).
+
+Compara com um baseline salvo e acusa regressão além do limite (padrão 20%
+a menos de ops/s ou 20% a mais de memória). Como tempo depende da máquina, o
+baseline fica em data/.cache/ (por máquina, fora do git).
+
+Uso:
+    python data/benchmark.py                    # roda e compara com o baseline
+    python data/benchmark.py --salvar-baseline  # roda e grava o baseline
+    python data/benchmark.py --filtro slugify --limite 0.1
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import timeit
+import argparse
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime
+
+import fitz  # pymupdf
+
+import extrator_certificados as ext
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(SCRIPT_DIR, ".cache", "bench_baseline.json")
+
+LIMITE_PADRAO = 0.20
+TEMPO_MIN = 0.2      # segundos por rodada de medição
+REPETICOES = 5
+ZOOMS = (1.0, 2.0, 3.0)
+
+SEED = 42
+
+
+# =========================
+# FIXTURES
+# =========================
+def make_pdf(paginas: int, linhas: int, seed: int = SEED) -> bytes:
+    """PDF de certificado: texto típico na 1ª página e `linhas` de texto por página."""
+    rnd = random.Random(seed)
+    palavras = ["curso", "certificamos", "que", "concluiu", "com", "aproveitamento", "carga",
+                "horária", "Data", "Science", "Academy", "Power", "BI", "Python", "módulo",
+                "avançado", "análise", "dados", "estatística", "competências", "projeto"]
+    doc = fitz.open()
+    for p in range(paginas):
+        page = doc.new_page(width=842, height=595)  # A4 paisagem
+        if p == 0:
+            page.insert_text((60, 90), "CERTIFICADO DE CONCLUSÃO", fontsize=28)
+            page.insert_text((60, 140), "Certificamos que Fulano de Tal concluiu o curso", fontsize=14)
+            page.insert_text((60, 165), "Dominando o Power BI - Data Science Academy", fontsize=14)
+            page.insert_text((60, 190), "Carga horária: 72 horas - Concluído em 2024", fontsize=12)
+            for i in range(40):
+                page.draw_rect(fitz.Rect(40 + i * 19, 520, 52 + i * 19, 560), color=(0.1, 0.3, 0.6), fill=(0.8, 0.9, 1))
+        y = 220 if p == 0 else 40
+        for _ in range(linhas):
+            if y > 580:
+                break
+            page.insert_text((40, y), " ".join(rnd.choice(palavras) for _ in range(16)), fontsize=7)
+            y += 9
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def make_readme(secoes: int, paragrafos: int, competencias: int) -> str:
+    """README com frontmatter YAML e seções `##` (inclui as duas que o extrator usa)."""
+    comp = "\n".join(f"  - Competência {i}" for i in range(competencias))
+    frontmatter = (
+        "---\n"
+        "titulo: Dominando o Power BI\n"
+        "tipo: Formação\n"
+        "instituicao: Data Science Academy\n"
+        "ano: 2024\n"
+        "duracao: 72 horas\n"
+        "destaque: true\n"
+        "thumbnail: assets/img/certificados/powerbi-thumb.jpg\n"
+        f"competencias:\n{comp}\n"
+        "---\n\n"
+    )
+    texto = "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor. " * 4
+    corpo = [
+        "# Dominando o Power BI\n",
+        "## 📌 Descrição curta\n" + texto + "\n",
+        "## 📖 Descrição completa\n" + "\n\n".join([texto] * paragrafos) + "\n",
+    ]
+    corpo += [f"## Seção {i}\n" + "\n\n".join([texto] * paragrafos) + "\n" for i in range(secoes)]
+    return frontmatter + "\n".join(corpo)
+
+
+def make_item(n_certs: int) -> dict:
+    return {
+        "id": "dominando-o-power-bi",
+        "titulo": "Dominando o Power BI",
+        "tipo": "Formação",
+        "instituicao": "Data Science Academy",
+        "categoria": "Power BI",
+        "ano": "2024",
+        "destaque": True,
+        "descricao": "Formação completa em Power BI.",
+        "competencias": [f"Competência {i}" for i in range(12)],
+        "certificados": [
+            {"nome": f"Modulo {i:03d} - Dominando o Power BI.pdf",
+             "preview": f"assets/img/certificados/_conteudo/{i:040x}.png",
+             "url": f"https://github.com/x/y/blob/main/Pasta/Modulo%20{i:03d}.pdf"}
+            for i in range(n_certs)
+        ],
+    }
+
+
+NOMES = {
+    "realista": "Módulo 03 - Análise Estatística com Python (Prática).pdf",
+    "pior": ("Formação Avançada em Ciência de Dados, Inteligência Artificial & Machine Learning — "
+             "Módulo Prático Nº 12: Análise Exploratória ÃÉÍÓÚ ç !!! ### " * 6 + ".PDF"),
+}
+PASTAS = {
+    "realista": "Dominando o Power BI",
+    "pior": " ".join(["Formação", "Avançada", "em", "Gestão", "Ágil", "de", "Projetos", "com", "Scrum",
+                      "Kanban", "Lean", "e", "Business", "Intelligence", "no", "Excel"] * 8),
+}
+
+
+def build_cases(tmpdir: str) -> list:
+    """Lista de (nome, callable) — cada callable é uma chamada do helper."""
+    pdfs = {"realista": make_pdf(1, 12), "pior": make_pdf(40, 60)}
+    readmes = {"realista": make_readme(3, 2, 8), "pior": make_readme(300, 6, 500)}
+    textos = {k: ext.extract_pdf_text(v) for k, v in pdfs.items()}
+    existentes = {"realista": make_item(5), "pior": make_item(500)}
+    novos = {k: {**v, "titulo": "Novo título", "certificados": v["certificados"][::2]} for k, v in existentes.items()}
+
+    casos = []
+    for tam in ("realista", "pior"):
+        nome, pasta = NOMES[tam], PASTAS[tam]
+        readme, pdf, texto = readmes[tam], pdfs[tam], textos[tam]
+        existente, novo = existentes[tam], novos[tam]
+        casos += [
+            (f"slugify[{tam}]", lambda nome=nome: ext.slugify(nome)),
+            (f"parse_readme_frontmatter[{tam}]", lambda r=readme: ext.parse_readme_frontmatter(r)),
+            (f"extract_section[{tam}]", lambda r=readme: ext.extract_section(r, "📖 Descrição completa")),
+            (f"extract_info_from_pdf_text[{tam}]", lambda p=pdf: ext.extract_info_from_pdf_text(p)),
+            (f"infer_categoria_from_folder[{tam}]", lambda n=pasta, t=texto: ext.infer_categoria_from_folder(n, t)),
+            (f"merge_certificate_data[{tam}]", lambda e=existente, n=novo: ext.merge_certificate_data(e, n)),
+        ]
+        for zoom in ZOOMS:
+            out = os.path.join(tmpdir, f"{tam}-{zoom}.png")
+            casos.append((
+                f"render_pdf_first_page_to_png[{tam},zoom={zoom}]",
+                lambda p=pdf, o=out, z=zoom: ext.render_pdf_first_page_to_png(p, o, zoom=z, overwrite=True),
+            ))
+    return casos
+
+
+# =========================
+# MEDIÇÃO
+# =========================
+def medir(fn, tempo_min: float = TEMPO_MIN, repeticoes: int = REPETICOES) -> dict:
+    """ops/s (melhor de `repeticoes`) e memória alocada por chamada."""
+    timer = timeit.Timer(fn)
+    numero, _ = timer.autorange()
+    numero = max(1, int(numero * tempo_min / 0.2))
+    melhor = min(timer.repeat(repeat=repeticoes, number=numero))
+
+    tracemalloc.start()
+    try:
+        fn()  # aquece caches (regex, lru_cache do classificador)
+        tracemalloc.reset_peak()
+        antes, _ = tracemalloc.get_traced_memory()
+        fn()
+        depois, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ops": numero / melhor,
+        "us": melhor / numero * 1e6,
+        "pico": max(0, pico - antes),
+        "retido": max(0, depois - antes),
+    }
+
+
+def formatar_bytes(n: float) -> str:
+    for unidade in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unidade}" if unidade == "B" else f"{n:.1f} {unidade}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def comparar(nome: str, atual: dict, base: dict | None, limite: float) -> list:
+    """Motivos de regressão do caso (lista vazia = ok)."""
+    if not base:
+        return []
+    motivos = []
+    if atual["ops"] < base["ops"] * (1 - limite):
+        motivos.append(f"ops/s {base['ops']:,.0f} -> {atual['ops']:,.0f} ({atual['ops'] / base['ops'] - 1:+.0%})")
+    # Alocações pequenas oscilam alguns bytes; só conta acima de 1 KB
+    if atual["pico"] > max(base["pico"] * (1 + limite), base["pico"] + 1024):
+        motivos.append(f"memória {formatar_bytes(base['pico'])} -> {formatar_bytes(atual['pico'])}")
+    return motivos
+
+
+def carregar_baseline(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def salvar_baseline(path: str, resultados: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    dados = {
+        "criado": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "maquina": platform.machine(),
+        "casos": resultados,
+    }
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+    os.replace(path + ".tmp", path)
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro-benchmarks dos helpers do extrator")
+    parser.add_argument("--filtro", help="só casos cujo nome contém este texto")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava os resultados como novo baseline")
+    parser.add_argument("--limite", type=float, default=LIMITE_PADRAO, help="regressão tolerada (0.2 = 20%%)")
+    parser.add_argument("--tempo", type=float, default=TEMPO_MIN, help="segundos por rodada de medição")
+    args = parser.parse_args(argv)
+
+    baseline = carregar_baseline(args.baseline).get("casos", {})
+
+    print(f"\n{'='*96}")
+    print(f"⏱️  MICRO-BENCHMARKS — Python {platform.python_version()}"
+          f"{' (sem baseline)' if not baseline else ''}")
+    print(f"{'='*96}\n")
+    print(f"{'Caso':<52}{'ops/s':>12}{'µs/op':>11}{'pico':>11}{'vs base':>10}")
+    print("-" * 96)
+
+    resultados, regressoes = {}, []
+    inicio = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for nome, fn in build_cases(tmpdir):
+            if args.filtro and args.filtro not in nome:
+                continue
+            r = medir(fn, tempo_min=args.tempo)
+            resultados[nome] = r
+            base = baseline.get(nome)
+            delta = f"{r['ops'] / base['ops'] - 1:+.0%}" if base else "—"
+            motivos = comparar(nome, r, base, args.limite)
+            marca = " ⚠️" if motivos else ""
+            print(f"{nome:<52}{r['ops']:>12,.0f}{r['us']:>11.1f}{formatar_bytes(r['pico']):>11}{delta:>10}{marca}")
+            if motivos:
+                regressoes.append((nome, motivos))
+
+    print("-" * 96)
+    print(f"{len(resultados)} caso(s) em {time.perf_counter() - inicio:.1f}s")
+
+    if args.salvar_baseline:
+        # Preserva casos não medidos nesta execução (ex.: --filtro)
+        salvar_baseline(args.baseline, {**baseline, **resultados})
+        print(f"💾 Baseline salvo em {args.baseline}")
+        return 0
+
+    if regressoes:
+        print(f"\n⚠️  {len(regressoes)} regressão(ões) acima de {args.limite:.0%}:")
+        for nome, motivos in regressoes:
+            print(f"   • {nome}: {'; '.join(motivos)}")
+        return 1
+
+    if baseline:
+        print(f"✅ Sem regressões acima de {args.limite:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,564 @@
+"""
+Catálogo local de certificados (SQLite)
+=======================================
+
+Fonte de verdade do extrator: pastas, certificados, SHAs de blob, previews
+gerados e informações extraídas dos PDFs. O certificados.json publicado no
+site passa a ser uma exportação deste banco.
+
+- Execuções incrementais fazem upsert indexado só das pastas processadas
+- Edições manuais no certificados.json são reimportadas automaticamente
+  (o mtime do JSON exportado fica registrado)
+- Consultas rápidas, ex.: previews ausentes ou fora do endereço por conteúdo
+- Exportação/importação em streaming (merge sort externo em runs NDJSON):
+  a memória não cresce com o tamanho do catálogo
+
+Uso:
+    python data/catalogo.py export      # regrava certificados.json a partir do banco
+    python data/catalogo.py import      # (re)importa certificados.json para o banco
+    python data/catalogo.py stale       # previews desatualizados/ausentes
+    python data/catalogo.py stats       # contagens por categoria
+    python data/catalogo.py bench --itens 100000   # memória/tempo da exportação em streaming
+"""
+
+import os
+import sys
+import json
+import time
+import heapq
+import random
+import sqlite3
+import tempfile
+import argparse
+import tracemalloc
+from datetime import datetime
+
+from comum import SHARED_PREVIEW_DIR, caminho_do_preview
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+DB_FILE = os.path.join(SCRIPT_DIR, ".cache", "catalogo.sqlite")
+OUTPUT_JSON = os.path.join(SCRIPT_DIR, "certificados.json")
+
+# Pasta de previews da fonte padrão; cada fonte de data/fontes.json tem a sua (`previews`)
+PREVIEWS_PADRAO = "assets/img/certificados"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pastas (
+    id          TEXT PRIMARY KEY,
+    nome        TEXT,
+    titulo      TEXT,
+    categoria   TEXT,
+    destaque    INTEGER NOT NULL DEFAULT 0,
+    ano         TEXT,
+    readme_sha  TEXT,
+    extracao    TEXT,
+    texto_sha   TEXT,
+    origens     TEXT,
+    item        TEXT NOT NULL,
+    atualizado  TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_pastas_categoria ON pastas(categoria);
+CREATE INDEX IF NOT EXISTS idx_pastas_readme_sha ON pastas(readme_sha);
+
+CREATE TABLE IF NOT EXISTS certificados (
+    pasta_id    TEXT NOT NULL REFERENCES pastas(id) ON DELETE CASCADE,
+    nome        TEXT NOT NULL,
+    blob_sha    TEXT,
+    preview     TEXT,
+    url         TEXT,
+    is_formacao INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (pasta_id, nome)
+);
+CREATE INDEX IF NOT EXISTS idx_certificados_sha ON certificados(blob_sha);
+
+CREATE TABLE IF NOT EXISTS meta (
+    chave TEXT PRIMARY KEY,
+    valor TEXT
+);
+"""
+
+# Colunas adicionadas depois da criação do schema: (tabela, coluna, tipo)
+MIGRACOES = [
+    ("pastas", "texto_sha", "TEXT"),
+    ("pastas", "origens", "TEXT"),
+]
+
+
+# =========================
+# CONEXÃO / IMPORTAÇÃO
+# =========================
+def conectar(path: str | None = None) -> sqlite3.Connection:
+    path = path or DB_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    migrar(conn)
+    return conn
+
+
+def conectar_leitura(path: str | None = None) -> sqlite3.Connection | None:
+    """Abre o catálogo só para leitura (dry-run, conferências); None se ele ainda não existe."""
+    path = path or DB_FILE
+    if not os.path.exists(path):
+        return None
+    # Sem -wal pendente o arquivo está completo: immutable não cria -wal/-shm
+    imutavel = "" if os.path.exists(path + "-wal") else "&immutable=1"
+    return sqlite3.connect(f"file:{path}?mode=ro{imutavel}", uri=True)
+
+
+def migrar(conn):
+    """Adiciona em bancos antigos as colunas que o schema ganhou depois."""
+    for tabela, coluna, tipo in MIGRACOES:
+        colunas = {row[1] for row in conn.execute(f"PRAGMA table_info({tabela})")}
+        if coluna not in colunas:
+            conn.execute(f"ALTER TABLE {tabela} ADD COLUMN {coluna} {tipo}")
+
+
+def get_meta(conn, chave: str, padrao=None):
+    row = conn.execute("SELECT valor FROM meta WHERE chave = ?", (chave,)).fetchone()
+    return row[0] if row else padrao
+
+
+def set_meta(conn, chave: str, valor):
+    conn.execute(
+        "INSERT INTO meta (chave, valor) VALUES (?, ?) ON CONFLICT(chave) DO UPDATE SET valor = excluded.valor",
+        (chave, None if valor is None else str(valor)),
+    )
+
+
+def prefixo_dos_previews(previews: str = PREVIEWS_PADRAO) -> str:
+    """Prefixo dos previews endereçados por conteúdo de uma fonte (<previews>/_conteudo/)."""
+    return f"{previews}/{SHARED_PREVIEW_DIR}/"
+
+
+def sha_do_preview(preview: str, previews: str = PREVIEWS_PADRAO) -> str | None:
+    """Previews endereçados por conteúdo carregam o SHA do blob no nome."""
+    prefixo = prefixo_dos_previews(previews)
+    if preview and preview.startswith(prefixo):
+        return preview[len(prefixo):].rsplit(".", 1)[0]
+    return None
+
+
+def upsert_item(conn, item: dict, build: dict | None = None, previews: str = PREVIEWS_PADRAO):
+    """
+    Grava (insert/update) uma pasta e seus certificados.
+    `build` traz dados que não vão para o JSON: nome da pasta, SHA do README,
+    SHAs dos PDFs, o que foi extraído do texto do PDF, o SHA do PDF de onde
+    o texto saiu e a origem de cada campo ({campo: "readme" | "pdf" | ...}).
+    `previews` é a pasta de previews da fonte (de onde sai o SHA dos
+    certificados que o build não traz).
+    """
+    build = build or {}
+    shas = build.get("shas", {})
+    conn.execute(
+        """
+        INSERT INTO pastas (id, nome, titulo, categoria, destaque, ano, readme_sha, extracao, texto_sha, origens, item, atualizado)
+        VALUES (:id, :nome, :titulo, :categoria, :destaque, :ano, :readme_sha, :extracao, :texto_sha, :origens, :item, :atualizado)
+        ON CONFLICT(id) DO UPDATE SET
+            nome = COALESCE(excluded.nome, pastas.nome),
+            titulo = excluded.titulo,
+            categoria = excluded.categoria,
+            destaque = excluded.destaque,
+            ano = excluded.ano,
+            readme_sha = COALESCE(excluded.readme_sha, pastas.readme_sha),
+            extracao = COALESCE(excluded.extracao, pastas.extracao),
+            texto_sha = COALESCE(excluded.texto_sha, pastas.texto_sha),
+            origens = COALESCE(excluded.origens, pastas.origens),
+            item = excluded.item,
+            atualizado = excluded.atualizado
+        """,
+        {
+            "id": item["id"],
+            "nome": build.get("nome"),
+            "titulo": item.get("titulo", ""),
+            "categoria": item.get("categoria", ""),
+            "destaque": int(bool(item.get("destaque"))),
+            "ano": str(item.get("ano") or ""),
+            "readme_sha": build.get("readme_sha"),
+            "extracao": json.dumps(build["extracao"], ensure_ascii=False) if build.get("extracao") else None,
+            "texto_sha": build.get("texto_sha"),
+            "origens": json.dumps(build["origens"]) if build.get("origens") else None,
+            "item": json.dumps(item, ensure_ascii=False, default=str),
+            "atualizado": datetime.now().isoformat(),
+        },
+    )
+    conn.execute("DELETE FROM certificados WHERE pasta_id = ?", (item["id"],))
+    conn.executemany(
+        "INSERT INTO certificados (pasta_id, nome, blob_sha, preview, url, is_formacao) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (
+                item["id"],
+                c.get("nome"),
+                shas.get(c.get("nome")) or sha_do_preview(c.get("preview", ""), previews),
+                c.get("preview"),
+                c.get("url"),
+                int(bool(c.get("isFormacao"))),
+            )
+            for c in item.get("certificados", [])
+        ],
+    )
+
+
+def atualizar_extracao(conn, item: dict, extracao: dict):
+    """Regrava só o item e a extração de uma pasta (reaplicação de regras, sem mexer nos certificados)."""
+    conn.execute(
+        "UPDATE pastas SET item = ?, ano = ?, extracao = ?, atualizado = ? WHERE id = ?",
+        (
+            json.dumps(item, ensure_ascii=False, default=str),
+            str(item.get("ano") or ""),
+            json.dumps(extracao, ensure_ascii=False),
+            datetime.now().isoformat(),
+            item["id"],
+        ),
+    )
+
+
+def atualizar_item(conn, item: dict):
+    """Regrava só o item (campos derivados, ex.: descritor de zoom), sem mexer nos certificados."""
+    conn.execute(
+        "UPDATE pastas SET item = ?, atualizado = ? WHERE id = ?",
+        (json.dumps(item, ensure_ascii=False, default=str), datetime.now().isoformat(), item["id"]),
+    )
+
+
+def importar_json(conn, path: str = OUTPUT_JSON, previews: str = PREVIEWS_PADRAO) -> int:
+    """
+    Importa (upsert) todos os itens do certificados.json, um de cada vez, e
+    remove do banco as pastas que não estão mais no JSON: o JSON publicado é
+    a referência (item apagado à mão não volta na próxima exportação).
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        e_array = f.read(4096).lstrip().startswith("[")
+    total = 0
+    with conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS importados (id TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM importados")
+        for item in iter_array_json(path):
+            if isinstance(item, dict) and item.get("id"):
+                upsert_item(conn, item, previews=previews)
+                conn.execute("INSERT OR IGNORE INTO importados (id) VALUES (?)", (item["id"],))
+                total += 1
+        if e_array:  # JSON que não é lista não diz nada sobre o que foi removido
+            conn.execute("DELETE FROM certificados WHERE pasta_id NOT IN (SELECT id FROM importados)")
+            conn.execute("DELETE FROM pastas WHERE id NOT IN (SELECT id FROM importados)")
+        conn.execute("DELETE FROM importados")
+        set_meta(conn, "json_mtime", os.stat(path).st_mtime_ns)
+    return total
+
+
+def sincronizar_json(conn, path: str = OUTPUT_JSON, previews: str = PREVIEWS_PADRAO) -> int:
+    """
+    Reimporta o JSON se ele mudou desde a última exportação (edição manual,
+    checkout de outra versão) ou se o banco ainda está vazio.
+    """
+    if not os.path.exists(path):
+        return 0
+    vazio = conn.execute("SELECT 1 FROM pastas LIMIT 1").fetchone() is None
+    if vazio or get_meta(conn, "json_mtime") != str(os.stat(path).st_mtime_ns):
+        return importar_json(conn, path, previews)
+    return 0
+
+
+# =========================
+# CONSULTAS
+# =========================
+def obter_item(conn, item_id: str) -> dict | None:
+    row = conn.execute("SELECT item FROM pastas WHERE id = ?", (item_id,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def contar(conn) -> int:
+    return conn.execute("SELECT COUNT(*) FROM pastas").fetchone()[0]
+
+
+def iter_itens(conn):
+    for (item,) in conn.execute("SELECT item FROM pastas"):
+        yield json.loads(item)
+
+
+def chave_ordem(item: dict) -> tuple:
+    """Mesma ordem de sempre: destaques primeiro, depois título."""
+    return (not item.get("destaque", False), item.get("titulo", "").lower())
+
+
+def ordenar(itens) -> list:
+    return sorted(itens, key=chave_ordem)
+
+
+def exportar_json(conn, path: str = OUTPUT_JSON, tmp_dir: str | None = None) -> int:
+    """
+    Gera o certificados.json a partir do banco (escrita atômica), em
+    streaming: memória limitada a TAMANHO_RUN itens, qualquer que seja o
+    tamanho do catálogo. Saída idêntica à de json.dump(ordenar(...), indent=2).
+    """
+    tmp = path + ".tmp"
+    with tempfile.TemporaryDirectory(prefix="export-", dir=tmp_dir or os.path.dirname(os.path.abspath(path))) as pasta_runs:
+        with open(tmp, "w", encoding="utf-8") as f:
+            total = escrever_array_json(f, itens_ordenados(iter_itens(conn), pasta_runs))
+    os.replace(tmp, path)
+    with conn:
+        set_meta(conn, "json_mtime", os.stat(path).st_mtime_ns)
+    return total
+
+
+def previews_desatualizados(conn, site_root: str = SITE_ROOT, previews: str = PREVIEWS_PADRAO) -> list:
+    """
+    Certificados cujo preview não está no endereço por conteúdo do blob atual
+    (na pasta `previews` da fonte) ou cujo arquivo não existe no disco.
+    """
+    out = []
+    rows = conn.execute(
+        "SELECT pasta_id, nome, blob_sha, preview FROM certificados ORDER BY pasta_id, nome"
+    )
+    for pasta_id, nome, blob_sha, preview in rows:
+        esperado = caminho_do_preview(previews, blob_sha) if blob_sha else None
+        if not preview or not os.path.exists(os.path.join(site_root, preview)):
+            out.append((pasta_id, nome, "ausente"))
+        elif esperado and preview != esperado:
+            out.append((pasta_id, nome, "desatualizado"))
+        elif not esperado:
+            out.append((pasta_id, nome, "sem hash"))
+    return out
+
+
+# =========================
+# EXPORTAÇÃO EM STREAMING (merge sort externo)
+# =========================
+# Itens por run ordenado (o que fica em memória de uma vez) e quantos runs
+# o merge abre juntos; acima disso os runs são fundidos em passadas
+TAMANHO_RUN = 5000
+RUNS_POR_MERGE = 64
+
+
+def gravar_run(registros, pasta: str, n: int) -> str:
+    """Grava registros (chave, item) já ordenados num run NDJSON."""
+    path = os.path.join(pasta, f"run-{n:05d}.ndjson")
+    with open(path, "w", encoding="utf-8") as f:
+        for chave, item in registros:
+            f.write(json.dumps([*chave, item], ensure_ascii=False, default=str))
+            f.write("\n")
+    return path
+
+
+def ler_run(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        for linha in f:
+            *chave, item = json.loads(linha)
+            yield tuple(chave), item
+
+
+def itens_ordenados(itens, pasta_runs: str):
+    """
+    Itens na ordem de chave_ordem via merge sort externo: blocos de
+    TAMANHO_RUN itens são ordenados e despejados em runs NDJSON, depois
+    fundidos com heapq.merge. Um catálogo que cabe num bloco só não toca
+    o disco. O número de entrada desempata (ordenação estável, como sorted).
+    """
+    bloco, runs = [], []
+    for seq, item in enumerate(itens):
+        bloco.append(((*chave_ordem(item), seq), item))
+        if len(bloco) >= TAMANHO_RUN:
+            bloco.sort(key=lambda r: r[0])
+            runs.append(gravar_run(bloco, pasta_runs, len(runs)))
+            bloco = []
+    bloco.sort(key=lambda r: r[0])
+    if not runs:
+        yield from (item for _, item in bloco)
+        return
+    if bloco:
+        runs.append(gravar_run(bloco, pasta_runs, len(runs)))
+    del bloco
+
+    proximo = len(runs)
+    while len(runs) > RUNS_POR_MERGE:
+        grupo, runs = runs[:RUNS_POR_MERGE], runs[RUNS_POR_MERGE:]
+        runs.append(gravar_run(heapq.merge(*map(ler_run, grupo), key=lambda r: r[0]), pasta_runs, proximo))
+        proximo += 1
+        for path in grupo:
+            os.remove(path)
+    for _, item in heapq.merge(*map(ler_run, runs), key=lambda r: r[0]):
+        yield item
+
+
+def escrever_array_json(f, itens) -> int:
+    """Escreve um array JSON item a item (mesmo layout de json.dump com indent=2)."""
+    total = 0
+    f.write("[")
+    for item in itens:
+        f.write(",\n  " if total else "\n  ")
+        f.write(json.dumps(item, ensure_ascii=False, indent=2, default=str).replace("\n", "\n  "))
+        total += 1
+    f.write("\n]" if total else "]")
+    return total
+
+
+def iter_array_json(path: str, bloco: int = 1 << 16):
+    """
+    Elementos de um array JSON lidos aos pedaços, sem carregar o arquivo
+    inteiro. Arquivo que não é um array não gera nada.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf, fim_arquivo, dentro = "", False, False
+        while True:
+            buf = buf.lstrip(" \t\r\n,") if dentro else buf.lstrip()
+            if not buf and not fim_arquivo:
+                mais = f.read(bloco)
+                fim_arquivo, buf = not mais, mais
+                continue
+            if not dentro:
+                if not buf.startswith("["):
+                    return
+                buf, dentro = buf[1:], True
+                continue
+            if buf.startswith("]"):
+                return
+            try:
+                valor, fim = decoder.raw_decode(buf)
+                completo = fim < len(buf) or fim_arquivo
+            except json.JSONDecodeError:
+                completo = False
+            if not completo:
+                if fim_arquivo:
+                    raise json.JSONDecodeError("array JSON incompleto", buf[:200], 0)
+                mais = f.read(bloco)
+                fim_arquivo, buf = not mais, buf + mais
+                continue
+            yield valor
+            buf = buf[fim:]
+
+
+# =========================
+# BENCHMARK
+# =========================
+def item_sintetico(rnd, n: int) -> dict:
+    """Item com o formato e o tamanho típicos de uma pasta do certificados.json."""
+    palavras = ["Análise", "Dados", "Python", "Ágil", "Gestão", "Power", "BI", "Estatística",
+                "Liderança", "Machine", "Learning", "Excel", "SQL", "Nuvem", "Segurança", "Ética"]
+    titulo = " ".join(rnd.choice(palavras) for _ in range(rnd.randint(2, 6)))
+    slug = f"{titulo.lower().replace(' ', '-')}-{n}"
+    return {
+        "id": slug,
+        "titulo": titulo,
+        "tipo": rnd.choice(["Formação", "Curso"]),
+        "instituicao": rnd.choice(["Alura", "DIO", "Coursera", "FGV"]),
+        "categoria": rnd.choice(palavras),
+        "duracao": f"{rnd.randint(2, 80)} horas",
+        "destaque": rnd.random() < 0.1,
+        "competencias": rnd.sample(palavras, rnd.randint(3, 9)),
+        "descricao": " ".join(rnd.choice(palavras) for _ in range(25)),
+        "descricaoCompleta": "\n\n".join(" ".join(rnd.choice(palavras) for _ in range(60)) for _ in range(3)),
+        "certificados": [
+            {"nome": f"{titulo} {i}.pdf", "url": f"https://github.com/exemplo/certificados/blob/main/{slug}/{i}.pdf",
+             "preview": caminho_do_preview(PREVIEWS_PADRAO, f"{rnd.getrandbits(160):040x}"), "isFormacao": i == 0}
+            for i in range(rnd.randint(1, 3))
+        ],
+    }
+
+
+def medir_pico(funcao):
+    """(resultado, segundos, pico de memória do Python em bytes) de funcao()."""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    try:
+        resultado = funcao()
+        return resultado, time.perf_counter() - inicio, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def exportar_em_memoria(conn, path: str) -> int:
+    """Exportação antiga (lista inteira ordenada em memória + um json.dump), para comparação."""
+    final_list = ordenar(iter_itens(conn))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(final_list, f, ensure_ascii=False, indent=2)
+    return len(final_list)
+
+
+def bench(itens: int, comparar: bool = True, seed: int = 42) -> bool:
+    """
+    Exporta e reimporta catálogos sintéticos de itens/10 e `itens` pastas e
+    mostra tempo e pico de memória: no modo streaming o pico não deve crescer
+    com o catálogo. Confere que a saída é idêntica à exportação em memória.
+    """
+    ok = True
+    with tempfile.TemporaryDirectory(prefix="bench-catalogo-") as pasta:
+        for n in sorted({max(1, itens // 10), itens}):
+            rnd = random.Random(seed)
+            conn = conectar(os.path.join(pasta, f"bench-{n}.sqlite"))
+            with conn:
+                for i in range(n):
+                    upsert_item(conn, item_sintetico(rnd, i))
+            saida = os.path.join(pasta, f"bench-{n}.json")
+            print(f"\n📦 {n:,} itens sintéticos")
+
+            total, dt, pico = medir_pico(lambda: exportar_json(conn, saida))
+            print(f"   export streaming:  {dt:6.1f}s  pico {pico / 1048576:7.1f} MB  "
+                  f"({os.path.getsize(saida) / 1048576:,.0f} MB de JSON)")
+            if comparar:
+                referencia = saida + ".ref"
+                _, dt, pico = medir_pico(lambda: exportar_em_memoria(conn, referencia))
+                print(f"   export em memória: {dt:6.1f}s  pico {pico / 1048576:7.1f} MB")
+                with open(saida, "rb") as a, open(referencia, "rb") as b:
+                    igual = a.read() == b.read()
+                print(f"   {'✅' if igual else '❌'} saída {'idêntica' if igual else 'DIFERENTE'} da exportação em memória")
+                ok = ok and igual
+                os.remove(referencia)
+            conn.close()
+
+            conn = conectar(os.path.join(pasta, f"bench-{n}-import.sqlite"))
+            importados, dt, pico = medir_pico(lambda: importar_json(conn, saida))
+            print(f"   import streaming:  {dt:6.1f}s  pico {pico / 1048576:7.1f} MB")
+            ok = ok and importados == total == n
+            conn.close()
+    return ok
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Catálogo SQLite de certificados")
+    parser.add_argument("comando", choices=["export", "import", "stale", "stats", "bench"])
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--json", default=OUTPUT_JSON)
+    parser.add_argument("--previews", default=PREVIEWS_PADRAO, help="pasta de previews da fonte (relativa ao site)")
+    parser.add_argument("--itens", type=int, default=100_000, help="bench: tamanho do catálogo sintético")
+    parser.add_argument("--sem-comparar", action="store_true", help="bench: não mede a exportação em memória")
+    args = parser.parse_args(argv)
+
+    if args.comando == "bench":
+        return 0 if bench(args.itens, comparar=not args.sem_comparar) else 1
+
+    conn = conectar(args.db)
+    if args.comando == "import":
+        print(f"✅ {importar_json(conn, args.json, args.previews)} item(ns) importado(s)")
+    elif args.comando == "export":
+        sincronizar_json(conn, args.json, args.previews)
+        print(f"✅ {exportar_json(conn, args.json)} item(ns) exportado(s) para {args.json}")
+    elif args.comando == "stale":
+        sincronizar_json(conn, args.json, args.previews)
+        stale = previews_desatualizados(conn, previews=args.previews)
+        for pasta_id, nome, motivo in stale:
+            print(f"  • [{motivo}] {pasta_id}/{nome}")
+        print(f"{'⚠️' if stale else '✅'} {len(stale)} preview(s) a refazer")
+    elif args.comando == "stats":
+        sincronizar_json(conn, args.json, args.previews)
+        for categoria, n in conn.execute(
+            "SELECT categoria, COUNT(*) FROM pastas GROUP BY categoria ORDER BY COUNT(*) DESC, categoria"
+        ):
+            print(f"  {n:>4}  {categoria}")
+        total_certs = conn.execute("SELECT COUNT(*) FROM certificados").fetchone()[0]
+        print(f"📊 {contar(conn)} pasta(s), {total_certs} certificado(s)")
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
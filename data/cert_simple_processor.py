@@ -6,7 +6,8 @@ O QUE FAZ:
 1. Varre pastas do repo certificados
 2. Lê README.md (se existir)
 3. Gera certificados.json
-4. Cria previews PNG dos PDFs (nomes curtos)
+4. Cria previews PNG dos PDFs, endereçados por conteúdo
+   (assets/img/certificados/_conteudo/<sha>.png, os mesmos do extrator)
 5. Pula pastas já processadas
 
 NÃO FAZ:
@@ -27,6 +28,9 @@ from io import BytesIO
 from pathlib import Path
 import fitz  # pymupdf
 
+from classificador import classificar
+from comum import caminho_do_preview, git_blob_sha
+
 
 # =========================
 # CONFIG
@@ -45,7 +49,8 @@ if GITHUB_TOKEN:
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_JSON = SCRIPT_DIR / "certificados.json"
 SITE_ROOT = SCRIPT_DIR.parent
-ASSETS_PREVIEW_ROOT = SITE_ROOT / "assets" / "img" / "certificados"
+PREVIEWS = "assets/img/certificados"  # relativo ao site (a `previews` da fonte padrão)
+ASSETS_PREVIEW_ROOT = SITE_ROOT / PREVIEWS
 
 
 # =========================
@@ -155,34 +160,19 @@ def render_pdf_to_png(pdf_bytes: bytes, out_path: Path, zoom: float = 2.0) -> bo
     return True
 
 
-def normalize_preview_path(folder_id: str, pdf_filename: str) -> str:
+def normalize_preview_path(blob_sha: str) -> str:
     """Path do preview para usar no JSON (relativo ao site)."""
-    return f"assets/img/certificados/{folder_id}/{slugify(pdf_filename)}.png"
+    return caminho_do_preview(PREVIEWS, blob_sha)
 
 
-def preview_file_path(folder_id: str, pdf_filename: str) -> Path:
+def preview_file_path(blob_sha: str) -> Path:
     """Path físico onde salvar o PNG."""
-    return ASSETS_PREVIEW_ROOT / folder_id / f"{slugify(pdf_filename)}.png"
+    return SITE_ROOT / normalize_preview_path(blob_sha)
 
 
 def infer_categoria(folder_name: str) -> str:
-    """Infere categoria baseado no nome da pasta."""
-    fn = folder_name.lower()
-    
-    if any(x in fn for x in ["python", "sql", "java", "javascript", "r-"]):
-        return "Programação"
-    elif any(x in fn for x in ["power bi", "tableau", "visualizacao"]):
-        return "Business Intelligence"
-    elif any(x in fn for x in ["machine learning", "deep learning", "ai", "ia"]):
-        return "Machine Learning"
-    elif any(x in fn for x in ["data science", "analytics"]):
-        return "Data Science"
-    elif any(x in fn for x in ["excel", "office"]):
-        return "Produtividade"
-    elif any(x in fn for x in ["aws", "azure", "cloud", "gcp"]):
-        return "Cloud Computing"
-    else:
-        return "Diversos"
+    """Infere categoria pelas regras de data/categorias.json."""
+    return classificar(folder_name)
 
 
 # =========================
@@ -192,18 +182,13 @@ def infer_categoria(folder_name: str) -> str:
 def is_folder_processed(folder_id: str, existing_data: dict) -> bool:
     """
     Verifica se pasta já foi processada.
-    Critério: existe no JSON E tem pelo menos 1 preview gerado.
+    Critério: existe no JSON E todos os previews dela existem no disco.
     """
     if folder_id not in existing_data:
         return False
     
-    # Verifica se tem pelo menos 1 preview
-    folder_preview_dir = ASSETS_PREVIEW_ROOT / folder_id
-    if not folder_preview_dir.exists():
-        return False
-    
-    png_files = list(folder_preview_dir.glob("*.png"))
-    return len(png_files) > 0
+    previews = [c.get("preview") for c in existing_data[folder_id].get("certificados", [])]
+    return bool(previews) and all(p and (SITE_ROOT / p).exists() for p in previews)
 
 
 def process_folder(folder_name: str, folder_path: str, existing_data: dict) -> dict | None:
@@ -269,14 +254,19 @@ def process_folder(folder_name: str, folder_path: str, existing_data: dict) -> d
         pdf_name = pdf["name"]
         is_formacao = "formação" in pdf_name.lower() or "formacao" in pdf_name.lower()
         
-        # Gera preview
+        # Gera preview (um por PDF único: o SHA do blob vem da Contents API)
+        blob_sha = pdf.get("sha")
         try:
-            pdf_bytes = download_bytes(pdf["download_url"], timeout=120)
-            out_png = preview_file_path(folder_id, pdf_name)
-            
-            was_created = render_pdf_to_png(pdf_bytes, out_png, zoom=2.0)
+            pdf_bytes = None
+            if not blob_sha:
+                pdf_bytes = download_bytes(pdf["download_url"], timeout=120)
+                blob_sha = git_blob_sha(pdf_bytes)
+            out_png = preview_file_path(blob_sha)
             
-            if was_created:
+            if not out_png.exists():
+                if pdf_bytes is None:
+                    pdf_bytes = download_bytes(pdf["download_url"], timeout=120)
+                render_pdf_to_png(pdf_bytes, out_png, zoom=2.0)
                 print(f"  🖼️  {pdf_name[:40]}...")
         except Exception as e:
             print(f"  ⚠️ Erro preview {pdf_name}: {e}")
@@ -284,7 +274,7 @@ def process_folder(folder_name: str, folder_path: str, existing_data: dict) -> d
         certificados.append({
             "nome": pdf_name,
             "url": f"https://github.com/{OWNER}/{REPO}/blob/{BRANCH}/{quote(folder_path)}/{quote(pdf_name)}",
-            "preview": normalize_preview_path(folder_id, pdf_name),
+            "preview": normalize_preview_path(blob_sha) if blob_sha else "",
             "isFormacao": is_formacao
         })
     
@@ -305,8 +295,8 @@ def process_folder(folder_name: str, folder_path: str, existing_data: dict) -> d
     # Thumbnail
     thumbnail = meta.get("thumbnail")
     if not thumbnail and formacao_pdf:
-        thumbnail = normalize_preview_path(folder_id, formacao_pdf["name"])
-    elif not thumbnail and certificados:
+        thumbnail = next((c["preview"] for c in certificados if c["nome"] == formacao_pdf["name"]), "")
+    if not thumbnail and certificados:
         thumbnail = certificados[0]["preview"]
     
     if not thumbnail:
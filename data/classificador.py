@@ -0,0 +1,184 @@
+"""
+Classificador de categorias dos certificados
+=============================================
+
+Substitui as cadeias de `any(x in nome ...)` dos extratores por regras em
+data/categorias.json:
+
+- termos casam só em fronteira de palavra ("ia" não casa em "essenciais")
+- aliases apontam para um termo canônico ("powerbi" -> "power bi")
+- prioridade decide quando mais de uma categoria casa
+- o texto do PDF (opcional) só desempata/complementa, com peso menor
+
+As regras viram um único dicionário de n-gramas, então classificar custa
+O(tokens x maior_termo), independente da quantidade de regras.
+
+Uso:
+    python data/classificador.py "Nome da pasta"   # classifica um nome
+    python data/classificador.py --golden           # confere as regras contra data/categorias_golden.json
+    python data/classificador.py --bench 5000       # benchmark com nomes sintéticos
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import unicodedata
+from functools import lru_cache
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+RULES_FILE = os.path.join(SCRIPT_DIR, "categorias.json")
+GOLDEN_FILE = os.path.join(SCRIPT_DIR, "categorias_golden.json")
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def normalizar(texto: str) -> str:
+    """Minúsculas e sem acentos."""
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    return texto.encode("ascii", "ignore").decode("ascii")
+
+
+def tokenizar(texto: str) -> list:
+    """Minúsculas, sem acentos, só [a-z0-9], separado em tokens."""
+    return _NON_ALNUM_RE.sub(" ", normalizar(texto)).split()
+
+
+class ClassificadorCategorias:
+    """Matcher compilado a partir das regras: {n-grama: categorias}."""
+
+    def __init__(self, regras: dict):
+        self.padrao = regras.get("padrao", "Diversos")
+        self.peso_texto = float(regras.get("peso_texto", 0.25))
+        self.prioridade = {}
+        self.termos = {}  # tupla de tokens -> [categorias]
+
+        for cat in regras.get("categorias", []):
+            self.prioridade[cat["nome"]] = cat.get("prioridade", 0)
+            for termo in cat.get("termos", []):
+                self._adicionar(termo, cat["nome"])
+
+        for alias, canonico in regras.get("aliases", {}).items():
+            for nome in self.termos.get(tuple(tokenizar(canonico)), []):
+                self._adicionar(alias, nome)
+
+        self.maior_termo = max((len(t) for t in self.termos), default=1)
+
+    def _adicionar(self, termo: str, categoria: str):
+        chave = tuple(tokenizar(termo))
+        if chave:
+            destinos = self.termos.setdefault(chave, [])
+            if categoria not in destinos:
+                destinos.append(categoria)
+
+    def pontuar(self, texto: str) -> dict:
+        """Conta, por categoria, quantos termos casam no texto."""
+        tokens = tokenizar(texto)
+        pontos = {}
+        termos = self.termos
+        for i in range(len(tokens)):
+            for n in range(1, min(self.maior_termo, len(tokens) - i) + 1):
+                for cat in termos.get(tuple(tokens[i:i + n]), ()):
+                    pontos[cat] = pontos.get(cat, 0) + 1
+        return pontos
+
+    def classificar(self, nome_pasta: str, texto_pdf: str = "") -> str:
+        """
+        Categoria da pasta: vence a de maior prioridade entre as que casam no
+        nome; o texto do PDF só decide quando o nome não casa com nada.
+        """
+        pontos = self.pontuar(nome_pasta)
+        if not pontos and texto_pdf:
+            pontos = {c: n * self.peso_texto for c, n in self.pontuar(texto_pdf).items()}
+        if not pontos:
+            return self.padrao
+        return max(pontos, key=lambda c: (self.prioridade.get(c, 0), pontos[c]))
+
+
+@lru_cache(maxsize=None)
+def carregar_classificador(path: str = RULES_FILE) -> ClassificadorCategorias:
+    """Lê e compila as regras uma única vez por processo."""
+    with open(path, "r", encoding="utf-8") as f:
+        return ClassificadorCategorias(json.load(f))
+
+
+def classificar(nome_pasta: str, texto_pdf: str = "") -> str:
+    return carregar_classificador().classificar(nome_pasta, texto_pdf)
+
+
+# =========================
+# GOLDEN / BENCHMARK
+# =========================
+def golden(path: str = GOLDEN_FILE) -> int:
+    """
+    Confere as regras contra os casos de data/categorias_golden.json (nome da
+    pasta, trecho do PDF e categoria esperada). São pastas sem `categoria` no
+    README, em que a categoria sai das regras; a do README é escolha do autor
+    e não diz nada sobre elas.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        casos = json.load(f)["casos"]
+
+    erros = 0
+    for caso in casos:
+        obtido = classificar(caso["pasta"], caso.get("texto", ""))
+        if obtido != caso["categoria"]:
+            erros += 1
+            print(f"❌ {caso['pasta']}: esperado '{caso['categoria']}', obtido '{obtido}'")
+
+    print(f"{'✅' if not erros else '⚠️'} {len(casos) - erros}/{len(casos)} casos do golden conferem")
+    return 1 if erros else 0
+
+
+def benchmark(n: int = 5000, seed: int = 42):
+    """Mede µs por classificação em nomes sintéticos, com as regras reais e infladas 10x/100x."""
+    with open(RULES_FILE, "r", encoding="utf-8") as f:
+        regras = json.load(f)
+
+    rnd = random.Random(seed)
+    vocab = [t for cat in regras["categorias"] for t in cat["termos"]]
+    ruido = ["curso", "formacao", "avancado", "com", "para", "de", "pratica", "modulo", "essenciais",
+             "fundamentos", "iniciante", "trilha", "projeto", "2024", "parte", "ii", "vol"]
+    nomes = [
+        " ".join(rnd.choice(vocab if rnd.random() < 0.3 else ruido) for _ in range(rnd.randint(2, 12)))
+        for _ in range(n)
+    ]
+
+    print(f"📊 {n} nomes sintéticos (2-12 palavras)")
+    for fator in (1, 10, 100):
+        extra = [
+            {"nome": f"Sintética {i}", "prioridade": 1, "termos": [f"termo{i} extra{i % 7}", f"palavra{i}"]}
+            for i in range(len(regras["categorias"]) * (fator - 1) * 5)
+        ]
+        clf = ClassificadorCategorias({**regras, "categorias": regras["categorias"] + extra})
+        inicio = time.perf_counter()
+        for nome in nomes:
+            clf.classificar(nome)
+        dt = time.perf_counter() - inicio
+        print(f"   • {len(clf.termos):>6} termos: {dt / n * 1e6:7.2f} µs/nome  ({n / dt:,.0f} nomes/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classificador de categorias por regras")
+    parser.add_argument("nomes", nargs="*", help="nomes de pasta para classificar")
+    parser.add_argument("--golden", nargs="?", const=GOLDEN_FILE, metavar="ARQUIVO",
+                        help="confere as regras contra os casos de categorias_golden.json")
+    parser.add_argument("--bench", type=int, nargs="?", const=5000, help="benchmark com N nomes sintéticos")
+    args = parser.parse_args(argv)
+
+    if args.golden:
+        return golden(args.golden)
+    if args.bench:
+        benchmark(args.bench)
+        return 0
+    for nome in args.nomes:
+        print(f"{nome} -> {classificar(nome)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
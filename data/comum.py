@@ -0,0 +1,61 @@
+"""
+Helpers compartilhados pelos scripts de data/
+==============================================
+
+Hashes, JSON em disco e caminhos que vários scripts usam; cada um importa
+daqui em vez de manter a própria cópia.
+
+- git_blob_sha: SHA de blob do git (o campo `sha` da Contents API)
+- caminho_do_preview: preview endereçado por conteúdo (<previews>/_conteudo/<sha>.png)
+- hash_arquivo: hash de um arquivo lido em blocos (sha256 por padrão)
+- carregar_json / salvar_json: leitura tolerante e gravação atômica
+"""
+
+import os
+import json
+import hashlib
+
+
+BLOCO = 1 << 20  # leitura de arquivos em blocos de 1 MB
+
+# Previews endereçados por conteúdo: um PNG por PDF único (SHA do blob),
+# compartilhado entre todas as pastas que contêm o mesmo arquivo
+SHARED_PREVIEW_DIR = "_conteudo"
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Calcula o SHA de blob do git (mesmo valor do campo `sha` da Contents API)."""
+    return hashlib.sha1(f"blob {len(data)}\0".encode() + data).hexdigest()
+
+
+def caminho_do_preview(pasta_previews: str, blob_sha: str) -> str:
+    """Preview compartilhado de um PDF, relativo ao site (pasta_previews é a `previews` da fonte)."""
+    return f"{pasta_previews}/{SHARED_PREVIEW_DIR}/{blob_sha}.png"
+
+
+def hash_arquivo(path, algoritmo: str = "sha256") -> str:
+    """Hexdigest do conteúdo de um arquivo, lido em blocos de BLOCO."""
+    h = hashlib.new(algoritmo)
+    with open(path, "rb") as f:
+        for bloco in iter(lambda: f.read(BLOCO), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def carregar_json(path):
+    """Conteúdo de um JSON, ou None se ele não existir ou estiver corrompido."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def salvar_json(path, data, **kwargs):
+    """Grava um JSON de forma atômica (arquivo .tmp + os.replace), criando a pasta."""
+    path = os.fspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, **kwargs)
+    os.replace(tmp, path)
@@ -12,7 +12,6 @@ Requisitos:
 import os
 from pathlib import Path
 from PIL import Image
-from pdf2image import convert_from_path
 
 # Configurações
 INPUT_DIR = "diplomas_originais"  # Pasta com os diplomas originais
@@ -38,6 +37,7 @@ def converter_pdf_para_imagem(pdf_path):
     """Converte a primeira página de um PDF para imagem"""
     print(f"📄 Convertendo PDF: {pdf_path}")
     try:
+        from pdf2image import convert_from_path  # só necessário para PDFs
         # Converte apenas a primeira página (índice 0)
         images = convert_from_path(
             pdf_path,
@@ -51,35 +51,46 @@ def converter_pdf_para_imagem(pdf_path):
         return None
 
 
+def recortar_proporcao(img, tamanho=THUMB_SIZE):
+    """Recorta a imagem na proporção de `tamanho` (mantém o topo) e redimensiona"""
+    width, height = img.size
+    target_ratio = tamanho[0] / tamanho[1]
+    current_ratio = width / height
+
+    if current_ratio > target_ratio:
+        # Imagem muito larga - crop nas laterais
+        new_width = int(height * target_ratio)
+        left = (width - new_width) // 2
+        img = img.crop((left, 0, left + new_width, height))
+    else:
+        # Imagem muito alta - crop no topo/base
+        new_height = int(width / target_ratio)
+        top = 0  # Mantém o topo (cabeçalho do diploma)
+        img = img.crop((0, top, width, top + new_height))
+
+    # Redimensiona para o tamanho final
+    return img.resize(tamanho, Image.Resampling.LANCZOS)
+
+
+def remover_alpha(img, fundo=(255, 255, 255)):
+    """Converte para RGB achatando a transparência sobre um fundo sólido"""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, fundo)
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+    return img.convert('RGB') if img.mode != 'RGB' else img
+
+
 def processar_imagem(img, output_path):
     """Processa e salva a imagem no tamanho correto"""
     try:
-        # Calcula o crop centralizado
-        width, height = img.size
-        target_ratio = THUMB_SIZE[0] / THUMB_SIZE[1]  # 4:3
-        current_ratio = width / height
-
-        if current_ratio > target_ratio:
-            # Imagem muito larga - crop nas laterais
-            new_width = int(height * target_ratio)
-            left = (width - new_width) // 2
-            img = img.crop((left, 0, left + new_width, height))
-        else:
-            # Imagem muito alta - crop no topo/base
-            new_height = int(width / target_ratio)
-            top = 0  # Mantém o topo (cabeçalho do diploma)
-            img = img.crop((0, top, width, top + new_height))
-
-        # Redimensiona para o tamanho final
-        img = img.resize(THUMB_SIZE, Image.Resampling.LANCZOS)
+        # Calcula o crop centralizado e redimensiona (4:3)
+        img = recortar_proporcao(img, THUMB_SIZE)
 
         # Converte para RGB se necessário (remove alpha)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
+        img = remover_alpha(img)
 
         # Salva com qualidade alta
         img.save(output_path, 'JPEG', quality=QUALITY, optimize=True)
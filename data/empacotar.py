@@ -0,0 +1,627 @@
+"""
+Build estático do front (main.js e styles.css)
+==============================================
+
+Gera em assets/build/ um bundle de JS por página e o CSS minificado, com o
+hash do conteúdo no nome, e reescreve as tags <script>/<link> das páginas.
+
+JS:
+1. Separa o main.js em declarações/comandos de nível superior (tokenizador
+   próprio: strings, template literals, regex e comentários);
+2. Remove as definições sombreadas: de funções repetidas fica só a última
+   (é a que o JS usaria de qualquer forma) e comandos idênticos repetidos
+   (ex.: o registro do init) ficam uma vez só, na última posição;
+3. Por página: as funções de init das seções que a página não tem viram
+   stubs vazios e entra só o que é alcançável a partir dos comandos de
+   nível superior (exports de window.portfolioApp das seções removidas saem);
+4. Minifica sem mudar o significado: tira comentários e espaços, mantém uma
+   quebra de linha onde o ASI poderia depender dela.
+
+CSS: tira comentários e espaços redundantes (strings preservadas).
+
+As tags reescritas ganham data-fonte="<arquivo original>", que é como o
+build as reencontra nas próximas execuções.
+
+Incremental: data/.cache/empacotar.json guarda o hash das fontes e da
+configuração; se nada mudou e as saídas existem, não refaz nada. O --check
+não depende desse estado (que não vai para o git): refaz o build em memória
+e compara com assets/build/, as tags das páginas e o manifesto.
+
+Uso:
+    python data/empacotar.py            # gera os bundles e reescreve as páginas
+    python data/empacotar.py --forcar   # refaz mesmo sem mudanças
+    python data/empacotar.py --check    # exit 1 se o que está no repo não bater com o build
+"""
+
+import os
+import re
+import sys
+import json
+import zlib
+import hashlib
+import argparse
+
+import manifesto
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+ESTADO_FILE = os.path.join(SCRIPT_DIR, ".cache", "empacotar.json")
+
+# Sobe ao mudar o tokenizador/minificador/regras: força rebuild
+VERSAO = 1
+
+JS_FONTE = "assets/js/main.js"
+CSS_FONTE = "assets/css/styles.css"
+SAIDA = "assets/build"
+TAMANHO_HASH = 10
+
+# Página -> funções de init de seções que ela não tem (viram stubs vazios)
+PAGINAS = {
+    "index.html": [],
+    "certificados.html": ["initProjects", "initDiplomas"],
+    "diplomas.html": ["initProjects", "initCertificates"],
+    "projetos.html": ["initCertificates", "initDiplomas"],
+}
+
+
+# =========================
+# TOKENIZADOR JS
+# =========================
+# Tipos: "ws" (espaço, com ou sem quebra), "comentario", "string", "template",
+# "regex", "nome" (identificadores, palavras-chave, números) e "pontuacao"
+_NOME_RE = re.compile(r"[A-Za-z0-9_$À-￿]+")
+_NUMERO_RE = re.compile(r"\d[\d_]*(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?")
+_PONTUACAO = sorted(
+    [">>>=", "...", "===", "!==", "**=", "<<=", ">>=", ">>>", "&&=", "||=", "??=",
+     "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--", "+=", "-=", "*=", "/=",
+     "%=", "&=", "|=", "^=", "**", "<<", ">>"],
+    key=len, reverse=True,
+)
+_ANTES_DE_REGEX = set("(,=:[!&|?{};+-*%<>~^") | {
+    "=>", "==", "===", "!=", "!==", "<=", ">=", "&&", "||", "??", "+=", "-=", "*=", "/=", "%=",
+    "return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw",
+    "instanceof", "yield", "await", "}", "...",
+}
+
+
+class ErroTokenizacao(Exception):
+    pass
+
+
+def _fim_string(src: str, i: int) -> int:
+    aspas = src[i]
+    j = i + 1
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == aspas:
+            return j + 1
+        if c == "\n":
+            break
+        j += 1
+    raise ErroTokenizacao(f"string não terminada na posição {i}")
+
+
+def _fim_regex(src: str, i: int) -> int:
+    j, classe = i + 1, False
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "\n":
+            break
+        if classe:
+            classe = c != "]"
+        elif c == "[":
+            classe = True
+        elif c == "/":
+            j += 1
+            while j < len(src) and (src[j].isalnum() or src[j] in "_$"):
+                j += 1  # flags
+            return j
+        j += 1
+    raise ErroTokenizacao(f"regex não terminada na posição {i}")
+
+
+def _fim_template(src: str, i: int) -> int:
+    """Fim do template literal que começa em i (expressões ${...} aninhadas inclusive)."""
+    j = i + 1
+    while j < len(src):
+        c = src[j]
+        if c == "\\":
+            j += 2
+            continue
+        if c == "`":
+            return j + 1
+        if c == "$" and src.startswith("${", j):
+            j = _fim_expressao(src, j + 2)
+            continue
+        j += 1
+    raise ErroTokenizacao(f"template não terminado na posição {i}")
+
+
+def expressoes_template(src: str) -> list:
+    """Código de cada ${...} de um template literal (só o nível de fora)."""
+    expressoes, j = [], 1
+    while j < len(src) - 1:
+        if src[j] == "\\":
+            j += 2
+        elif src.startswith("${", j):
+            fim = _fim_expressao(src, j + 2)
+            expressoes.append(src[j + 2:fim - 1])
+            j = fim
+        else:
+            j += 1
+    return expressoes
+
+
+def _fim_expressao(src: str, i: int) -> int:
+    """Fim (após a }) de uma expressão ${...} de template."""
+    profundidade = 0
+    for tipo, texto, fim in _tokens_de(src, i):
+        if tipo == "pontuacao" and texto == "{":
+            profundidade += 1
+        elif tipo == "pontuacao" and texto == "}":
+            if profundidade == 0:
+                return fim
+            profundidade -= 1
+    raise ErroTokenizacao(f"expressão de template não terminada na posição {i}")
+
+
+def _tokens_de(src: str, i: int = 0):
+    """Gera (tipo, texto, fim) a partir de i."""
+    anterior = None  # último token significativo (para decidir regex x divisão)
+    n = len(src)
+    while i < n:
+        c = src[i]
+        if c.isspace():
+            j = i
+            while j < n and src[j].isspace():
+                j += 1
+            yield "ws", src[i:j], j
+        elif src.startswith("//", i):
+            j = src.find("\n", i)
+            j = n if j < 0 else j
+            yield "comentario", src[i:j], j
+        elif src.startswith("/*", i):
+            j = src.find("*/", i + 2)
+            if j < 0:
+                raise ErroTokenizacao(f"comentário não terminado na posição {i}")
+            j += 2
+            yield "comentario", src[i:j], j
+        elif c in "'\"":
+            j = _fim_string(src, i)
+            anterior = src[i:j]
+            yield "string", anterior, j
+        elif c == "`":
+            j = _fim_template(src, i)
+            anterior = src[i:j]
+            yield "template", anterior, j
+        elif c == "/" and (anterior is None or anterior in _ANTES_DE_REGEX):
+            j = _fim_regex(src, i)
+            anterior = src[i:j]
+            yield "regex", anterior, j
+        else:
+            m = _NUMERO_RE.match(src, i) if (c.isdigit() or (c == "." and src[i + 1:i + 2].isdigit())) else None
+            m = m or _NOME_RE.match(src, i)
+            if m:
+                j = m.end()
+                anterior = src[i:j]
+                yield "nome", anterior, j
+            else:
+                op = next((p for p in _PONTUACAO if src.startswith(p, i)), c)
+                j = i + len(op)
+                anterior = op
+                yield "pontuacao", op, j
+        i = j
+
+
+def tokenizar(src: str) -> list:
+    """[(tipo, texto)] do arquivo inteiro (a concatenação dos textos é o próprio src)."""
+    return [(tipo, texto) for tipo, texto, _ in _tokens_de(src)]
+
+
+# =========================
+# COMANDOS DE NÍVEL SUPERIOR
+# =========================
+def separar_comandos(tokens: list) -> list:
+    """
+    Agrupa os tokens em comandos de nível superior. Cada comando é um dict
+    {tokens, declara, usa, tipo} — comentários/espaços antes dele vão junto.
+    """
+    comandos, atual, profundidade = [], [], 0
+
+    def significativos(toks):
+        return [(t, x) for t, x in toks if t not in ("ws", "comentario")]
+
+    def fechar():
+        if significativos(atual):
+            comandos.append(analisar(atual[:]))
+        atual.clear()
+
+    i = 0
+    while i < len(tokens):
+        tipo, texto = tokens[i]
+        atual.append(tokens[i])
+        if tipo == "pontuacao":
+            if texto in "([{":
+                profundidade += 1
+            elif texto in ")]}":
+                profundidade -= 1
+                if profundidade == 0 and texto == "}" and _bloco_termina(atual, tokens, i):
+                    fechar()
+            elif texto == ";" and profundidade == 0:
+                fechar()
+        i += 1
+    fechar()
+    return comandos
+
+
+def _bloco_termina(atual: list, tokens: list, i: int) -> bool:
+    """Um } no nível 0 encerra declarações de função/classe e if/for/while (sem else a seguir)."""
+    sig = [x for t, x in atual if t not in ("ws", "comentario")]
+    inicio = sig[:2]
+    if inicio[:1] == ["function"] or inicio == ["async", "function"] or inicio[:1] == ["class"]:
+        return True
+    if inicio[:1] in (["if"], ["for"], ["while"], ["try"]):
+        proximo = next((x for t, x in tokens[i + 1:] if t not in ("ws", "comentario")), None)
+        return proximo not in ("else", "catch", "finally")
+    return False
+
+
+def analisar(tokens: list) -> dict:
+    sig = [(t, x) for t, x in tokens if t not in ("ws", "comentario")]
+    nomes = [x for _, x in sig]
+    declara, tipo = None, "comando"
+    if nomes[:1] == ["function"]:
+        declara, tipo = nomes[1], "funcao"
+    elif nomes[:2] == ["async", "function"]:
+        declara, tipo = nomes[2], "funcao"
+    elif nomes[:1] in (["const"], ["let"], ["var"], ["class"]):
+        declara, tipo = nomes[1], "declaracao"
+
+    usa = set()
+    for k, (t, x) in enumerate(sig):
+        if t == "nome" and not x[0].isdigit() and (k == 0 or sig[k - 1][1] not in (".", "?.")):
+            usa.add(x)
+    for t, x in sig:
+        if t == "template":
+            for expr in expressoes_template(x):
+                usa |= analisar(tokenizar(expr))["usa"] if expr.strip() else set()
+    usa.discard(declara)
+
+    texto_sig = " ".join(nomes)
+    exporta = nomes[:3] == ["window", ".", "portfolioApp"]
+    return {"tokens": tokens, "declara": declara, "usa": usa, "tipo": tipo, "chave": texto_sig, "exporta": exporta}
+
+
+def remover_sombreados(comandos: list) -> tuple:
+    """(comandos sem as definições/comandos repetidos, descrições do que saiu)."""
+    ultima_funcao, ultimo_comando = {}, {}
+    for k, c in enumerate(comandos):
+        if c["tipo"] == "funcao":
+            ultima_funcao[c["declara"]] = k
+        elif c["tipo"] == "comando" and not c["exporta"]:
+            ultimo_comando[c["chave"]] = k
+
+    mantidos, removidos = [], []
+    for k, c in enumerate(comandos):
+        if c["tipo"] == "funcao" and ultima_funcao[c["declara"]] != k:
+            removidos.append(f"function {c['declara']} (sombreada)")
+        elif c["tipo"] == "comando" and not c["exporta"] and ultimo_comando[c["chave"]] != k:
+            removidos.append(f"comando repetido: {c['chave'][:40]}…")
+        else:
+            mantidos.append(c)
+    return mantidos, removidos
+
+
+def _alcance(raizes: list, por_nome: dict) -> set:
+    vistos, pilha = set(), [n for c in raizes for n in c["usa"]]
+    while pilha:
+        nome = pilha.pop()
+        if nome in vistos or nome not in por_nome:
+            continue
+        vistos.add(nome)
+        pilha.extend(por_nome[nome]["usa"])
+    return vistos
+
+
+def comandos_da_pagina(comandos: list, sem: list) -> list:
+    """Comandos do bundle de uma página (stubs para `sem` + só o alcançável)."""
+    stubs = {}
+    for nome in sem:
+        stubs[nome] = analisar(tokenizar(f"function {nome}() {{}}\n"))
+    por_nome = {c["declara"]: stubs.get(c["declara"], c) for c in comandos if c["declara"]}
+
+    raizes = [c for c in comandos if c["tipo"] == "comando" and not c["exporta"]]
+    alcancado = _alcance(raizes, por_nome)
+
+    # Código que só as seções removidas usavam: exports que apontam para ele saem
+    originais = {c["declara"]: c for c in comandos if c["declara"]}
+    so_removidas = _alcance([originais[n] for n in sem if n in originais], originais) - alcancado
+    exports = [c for c in comandos if c["exporta"] and not (c["usa"] & so_removidas)]
+    alcancado |= _alcance(exports, por_nome)
+
+    saida = []
+    for c in comandos:
+        if c["declara"]:
+            if c["declara"] in alcancado:
+                saida.append(por_nome[c["declara"]])
+        elif not c["exporta"] or c in exports:
+            saida.append(c)
+    return saida
+
+
+# =========================
+# MINIFICAÇÃO
+# =========================
+_PALAVRA = re.compile(r"[A-Za-z0-9_$À-￿]")
+_SEM_QUEBRA_DEPOIS = set("{;,([:=?") | {"=>", "&&", "||", "??", "+", "*", "/", "%", "==", "===", "!=", "!==",
+                                      "<", ">", "<=", ">=", "+=", "-=", "*=", "/=", "..."}
+_SEM_QUEBRA_ANTES = set(")]},;:.?") | {"=>", "&&", "||", "??", "==", "===", "!=", "!==", "?."}
+
+
+def minificar_js(tokens: list) -> str:
+    """
+    Junta os tokens sem comentários e com o mínimo de espaço. Uma quebra de
+    linha original só some quando o token anterior/seguinte deixa claro que
+    o comando continua (o ASI não pode ter efeito ali).
+    """
+    saida = []
+    anterior = None
+    quebra = espaco = False
+    for tipo, texto in tokens:
+        if tipo == "comentario":
+            espaco = True
+            continue
+        if tipo == "ws":
+            espaco = True
+            quebra = quebra or "\n" in texto
+            continue
+        if anterior is not None:
+            if quebra and anterior not in _SEM_QUEBRA_DEPOIS and texto not in _SEM_QUEBRA_ANTES:
+                saida.append("\n")
+            elif espaco and (
+                (_PALAVRA.match(anterior[-1]) and _PALAVRA.match(texto[0]))
+                or (anterior[-1] in "+-/" and texto[0] == anterior[-1])
+                or (anterior[-1] == "/" and texto[0] == "*")
+            ):
+                saida.append(" ")
+        saida.append(texto)
+        anterior = texto
+        quebra = espaco = False
+    return "".join(saida) + "\n"
+
+
+_CSS_TOKEN = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|(/\*.*?\*/)|(\s+)|([{};:,>])|([^"'/\s{};:,>]+|/)""", re.S)
+
+
+def minificar_css(src: str) -> str:
+    saida = []
+    espaco = False
+    for string, comentario, ws, pont, resto in _CSS_TOKEN.findall(src):
+        if comentario:
+            continue
+        if ws:
+            espaco = True
+            continue
+        texto = string or pont or resto
+        if pont == "}" and saida and saida[-1] == ";":
+            saida.pop()  # último ; do bloco
+        if espaco and saida and saida[-1] not in "{};:,>" and pont not in ("{", "}", ";", ",", ">") and pont != ":":
+            saida.append(" ")
+        elif espaco and saida and pont == ":" and saida[-1] not in "{};":
+            saida.append(" ")  # seletor descendente com pseudo-classe: "a :hover"
+        saida.append(texto)
+        espaco = False
+    return "".join(saida) + "\n"
+
+
+# =========================
+# BUILD
+# =========================
+def sha(texto) -> str:
+    dados = texto.encode("utf-8") if isinstance(texto, str) else texto
+    return hashlib.sha1(dados).hexdigest()
+
+
+def gz(texto: str) -> int:
+    return len(zlib.compress(texto.encode("utf-8"), 9))
+
+
+def nome_com_hash(base: str, conteudo: str, ext: str) -> str:
+    return f"{SAIDA}/{base}.{sha(conteudo)[:TAMANHO_HASH]}{ext}"
+
+
+_TAG_RE = r"""<{tag}\b[^>]*?\b{attr}="({fonte}|{saida}/[^"]+)"[^>]*>"""
+
+
+def reescrever_tag(html: str, tag: str, attr: str, fonte: str, destino: str) -> str:
+    """Aponta a tag da fonte (ou de um build anterior dela) para o destino."""
+    padrao = re.compile(_TAG_RE.format(tag=tag, attr=attr, fonte=re.escape(fonte), saida=re.escape(SAIDA)))
+
+    def trocar(m):
+        original = m.group(0)
+        if m.group(1) != fonte and f'data-fonte="{fonte}"' not in original:
+            return original  # build de outra fonte
+        nova = original.replace(f'{attr}="{m.group(1)}"', f'{attr}="{destino}"', 1)
+        if "data-fonte=" not in nova:
+            fim = -2 if nova.endswith("/>") else -1
+            nova = nova[:fim].rstrip() + f' data-fonte="{fonte}"' + (" />" if fim == -2 else ">")
+        return nova
+
+    return padrao.sub(trocar, html)
+
+
+def gerar(js: str, css: str, paginas) -> tuple:
+    """
+    Build em memória: ({rel: conteúdo}, {página|"css": rel}, definições
+    removidas, relatório de tamanhos). Não toca no disco.
+    """
+    comandos, removidos = remover_sombreados(separar_comandos(tokenizar(js)))
+    css_min = minificar_css(css)
+    destino_css = nome_com_hash("styles", css_min, ".css")
+    arquivos = {destino_css: css_min}
+    saidas = {"css": destino_css}
+    relatorio = []
+
+    for pagina in paginas:
+        bundle = minificar_js([tok for c in comandos_da_pagina(comandos, PAGINAS[pagina]) for tok in c["tokens"]])
+        destino_js = nome_com_hash(os.path.splitext(pagina)[0], bundle, ".js")
+        arquivos[destino_js] = bundle
+        saidas[pagina] = destino_js
+        relatorio.append((pagina, len(js) + len(css), gz(js) + gz(css), len(bundle) + len(css_min), gz(bundle) + gz(css_min)))
+    return arquivos, saidas, removidos, relatorio
+
+
+def divergencias(site_root: str, arquivos: dict, saidas: dict, paginas: dict) -> list:
+    """
+    O que no site não bate com um build em memória: bundles faltando, com
+    outro conteúdo ou sobrando em assets/build/, páginas apontando para
+    outro bundle e o manifesto sem os bundles atuais (ou com antigos).
+    """
+    problemas = []
+    for rel, conteudo in arquivos.items():
+        try:
+            with open(os.path.join(site_root, rel), "r", encoding="utf-8") as f:
+                if f.read() != conteudo:
+                    problemas.append(f"{rel}: conteúdo diferente do build")
+        except FileNotFoundError:
+            problemas.append(f"{rel}: não existe")
+
+    pasta = os.path.join(site_root, SAIDA)
+    atuais = {os.path.basename(rel) for rel in arquivos}
+    sobrando = sorted(set(os.listdir(pasta)) - atuais) if os.path.isdir(pasta) else []
+    problemas += [f"{SAIDA}/{nome}: nenhuma página usa" for nome in sobrando]
+
+    for pagina, path in paginas.items():
+        if not _paginas_apontam(path, saidas):
+            problemas.append(f"{pagina}: não aponta para {saidas[pagina]} e {saidas['css']}")
+
+    manifesto_path = os.path.join(site_root, os.path.relpath(manifesto.OUTPUT_FILE, SITE_ROOT))
+    try:
+        with open(manifesto_path, "r", encoding="utf-8") as f:
+            no_manifesto = {rel for rel in json.load(f).get("arquivos", {}) if rel.startswith(SAIDA + "/")}
+    except (FileNotFoundError, json.JSONDecodeError):
+        no_manifesto = set()
+    if no_manifesto != set(arquivos):
+        problemas.append(f"{os.path.relpath(manifesto_path, site_root)}: bundles diferentes dos do build")
+    return problemas
+
+
+def construir(site_root: str = SITE_ROOT, estado_path: str = ESTADO_FILE, forcar: bool = False,
+              check: bool = False) -> bool:
+    """
+    Gera os bundles e reescreve as páginas. Retorna se algo estava desatualizado.
+    Com check=True não escreve nada nem usa o estado em data/.cache/: refaz o
+    build em memória e compara com o que está no site (ver divergencias).
+    """
+    js_path = os.path.join(site_root, JS_FONTE)
+    css_path = os.path.join(site_root, CSS_FONTE)
+    if not (os.path.exists(js_path) and os.path.exists(css_path)):
+        return False
+    with open(js_path, "r", encoding="utf-8") as f:
+        js = f.read()
+    with open(css_path, "r", encoding="utf-8") as f:
+        css = f.read()
+
+    paginas = {p: os.path.join(site_root, p) for p in PAGINAS if os.path.exists(os.path.join(site_root, p))}
+    if check:
+        arquivos, saidas, _, _ = gerar(js, css, paginas)
+        problemas = divergencias(site_root, arquivos, saidas, paginas)
+        print(f"📦 Build do front: {'desatualizado' if problemas else 'sem mudanças'}")
+        for problema in problemas:
+            print(f"   • {problema}")
+        return bool(problemas)
+
+    assinatura = sha(json.dumps([VERSAO, sha(js), sha(css), PAGINAS], sort_keys=True))
+    try:
+        with open(estado_path, "r", encoding="utf-8") as f:
+            estado = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        estado = {}
+
+    saidas = estado.get("saidas", {})
+    em_dia = (
+        not forcar and estado.get("assinatura") == assinatura
+        and all(os.path.exists(os.path.join(site_root, s)) for s in saidas.values())
+        and all(_paginas_apontam(paginas[p], saidas) for p in paginas)
+    )
+    if em_dia:
+        print("📦 Build do front: sem mudanças")
+        return False
+
+    arquivos, saidas, removidos, relatorio = gerar(js, css, paginas)
+    pasta = os.path.join(site_root, SAIDA)
+    os.makedirs(pasta, exist_ok=True)
+    for rel, conteudo in arquivos.items():
+        destino = os.path.join(site_root, rel)
+        if forcar or not os.path.exists(destino):
+            with open(destino + ".tmp", "w", encoding="utf-8") as f:
+                f.write(conteudo)
+            os.replace(destino + ".tmp", destino)
+
+    for pagina, path in paginas.items():
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+        novo = reescrever_tag(html, "script", "src", JS_FONTE, saidas[pagina])
+        novo = reescrever_tag(novo, "link", "href", CSS_FONTE, saidas["css"])
+        if novo != html:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(novo)
+            os.replace(path + ".tmp", path)
+
+    # Bundles antigos que nenhuma página usa mais
+    atuais = {os.path.basename(s) for s in arquivos}
+    for nome in os.listdir(pasta):
+        if nome not in atuais:
+            os.remove(os.path.join(pasta, nome))
+
+    os.makedirs(os.path.dirname(estado_path), exist_ok=True)
+    with open(estado_path, "w", encoding="utf-8") as f:
+        json.dump({"assinatura": assinatura, "saidas": saidas}, f, indent=2)
+
+    print(f"📦 Build do front ({len(removidos)} definição(ões) sombreada(s) removida(s))")
+    for r in removidos:
+        print(f"   • {r}")
+    print(f"   {'Página':<20}{'Antes':>10}{'Depois':>10}{'gzip antes':>12}{'gzip depois':>13}{'Economia':>10}")
+    for pagina, antes, gz_antes, depois, gz_depois in relatorio:
+        print(f"   {pagina:<20}{antes / 1024:>8.1f}KB{depois / 1024:>8.1f}KB{gz_antes / 1024:>10.1f}KB"
+              f"{gz_depois / 1024:>11.1f}KB{(1 - depois / antes) * 100:>9.1f}%")
+    return True
+
+
+def _paginas_apontam(path: str, saidas: dict) -> bool:
+    with open(path, "r", encoding="utf-8") as f:
+        html = f.read()
+    pagina = os.path.basename(path)
+    return f'src="{saidas.get(pagina)}"' in html and f'href="{saidas.get("css")}"' in html
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build estático do front (bundles por página, minificação, hash)")
+    parser.add_argument("--forcar", action="store_true", help="refaz mesmo sem mudanças nas fontes")
+    parser.add_argument("--check", action="store_true", help="só verifica; exit 1 se o build estiver desatualizado")
+    args = parser.parse_args(argv)
+
+    try:
+        desatualizado = construir(forcar=args.forcar, check=args.check)
+    except ErroTokenizacao as e:
+        print(f"❌ Não foi possível tokenizar {JS_FONTE}: {e}")
+        return 1
+
+    # Bundles novos têm outro nome: o manifesto do service worker acompanha
+    if desatualizado and not args.check:
+        manifesto.atualizar()
+    return 1 if args.check and desatualizado else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,36 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 import re
+import sys
 import json
+import time
+import hashlib
+import shutil
+import argparse
+import subprocess
 import yaml
+import pypdf
 import requests
 from urllib.parse import quote
+from fnmatch import fnmatch
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pypdf import PdfReader
 from io import BytesIO
 from datetime import datetime
 
 import fitz  # pymupdf
+from PIL import Image
+
+import catalogo
+import facetas
+import manifesto
+import piramides
+import prerender
+import relacionados
+import textos
+from classificador import classificar
+from comum import SHARED_PREVIEW_DIR, caminho_do_preview, carregar_json, git_blob_sha, salvar_json
 
 
 # =========================
@@ -20,7 +41,14 @@ OWNER = "guicorrea93"
 REPO = "certificados"
 BRANCH = "main"
 
-API_BASE = "https://api.github.com"
+# Pode apontar para um servidor local (ex.: mock nos testes do modo --watch)
+API_BASE = os.getenv("GITHUB_API_BASE", "https://api.github.com")
+
+# READMEs de muitas pastas numa consulta GraphQL só (um alias por pasta, em
+# lotes para ficar longe dos limites da API). Exige token; sem ele, ou se a
+# consulta falhar, cada pasta baixa o README pela REST como antes
+GRAPHQL_URL = os.getenv("GITHUB_GRAPHQL_URL", f"{API_BASE}/graphql")
+GRAPHQL_LOTE = 50
 
 # Token (já configurado no seu PC via env var)
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
@@ -29,6 +57,10 @@ HEADERS = {"Accept": "application/vnd.github+json"}
 if GITHUB_TOKEN:
     HEADERS["Authorization"] = f"Bearer {GITHUB_TOKEN}"
 
+# Sessão única: reaproveita conexões (keep-alive) entre pastas e entre execuções
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+
 # Onde salvar o JSON (na pasta data do seu site)
 OUTPUT_JSON = os.path.join(os.path.dirname(__file__), "certificados.json")
 
@@ -36,14 +68,235 @@ OUTPUT_JSON = os.path.join(os.path.dirname(__file__), "certificados.json")
 SITE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 ASSETS_PREVIEW_ROOT = os.path.join(SITE_ROOT, "assets", "img", "certificados")
 
+# Mosaico por pasta (thumbnail do card): resolução do card em telas 2x
+MOSAIC_SIZE = (800, 500)
+MOSAIC_MAX_TILES = 4
+MOSAIC_QUALITY = 80
+
+# Seções do README copiadas para o catálogo (heading "## ..." -> campo)
+README_SECTIONS = {
+    "📌 Descrição curta": "descricao",
+    "📖 Descrição completa": "descricaoCompleta",
+}
+
+# Loader YAML em C (libyaml) quando disponível, bem mais rápido que o puro Python
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Cache local do extrator (não é publicado no site)
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+
+# Catálogo SQLite (fonte de verdade; certificados.json é exportado dele)
+CATALOG_DB = os.path.join(CACHE_DIR, "catalogo.sqlite")
+
+# Journal da execução: uma linha por pasta concluída, permite --resume após falha
+JOURNAL_FILE = os.path.join(CACHE_DIR, "journal.ndjson")
+
+# Texto dos PDFs por página, comprimido, por SHA do blob + versão do extrator
+# de texto. Sobe o sufixo ao mudar a forma de extrair (não as regras de campos)
+TEXTOS_DB = os.path.join(CACHE_DIR, "textos.sqlite")
+TEXTO_VERSAO = f"pypdf-{pypdf.__version__}/1"
+
+# OCR (Tesseract local) da 1ª página dos PDFs sem camada de texto (scans).
+# Fica no mesmo cache de textos com versão própria, fixa: cada PDF é lido
+# uma vez só, mesmo trocando a versão do Tesseract. Sobe o sufixo para refazer
+OCR_VERSAO = "ocr-tesseract/1"
+OCR_DPI = 300
+OCR_LADO_MAXIMO = 4000   # px: páginas enormes não passam disso
+OCR_IDIOMAS = ("por", "eng")
+OCR_TIMEOUT = 120
+
+# Campos preenchidos pelas regras sobre o texto do PDF (extract_info_from_text)
+CAMPOS_EXTRAIDOS = ("ano", "duracao", "instituicao")
+
+# Fontes (repositórios) processadas numa mesma execução, cada uma com seu
+# catálogo e pasta de previews. Sem o arquivo, só a fonte padrão abaixo.
+FONTES_FILE = os.path.join(os.path.dirname(__file__), "fontes.json")
+
+FONTE_PADRAO = {
+    "nome": "certificados",
+    "owner": OWNER,
+    "repo": REPO,
+    "branch": BRANCH,
+    "catalogo": OUTPUT_JSON,
+    "previews": "assets/img/certificados",
+}
+
+# Processos que renderizam previews (um pool só para todas as pastas e fontes)
+RENDER_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# PDFs já baixados nesta execução, por SHA do blob (limite em bytes)
+DOWNLOAD_CACHE_BYTES = 256 * 1024 * 1024
+
+# Orçamento de rate limit (compartilhado entre as fontes): abaixo da reserva a
+# execução espera o reset; se a espera passar do máximo, para e deixa o
+# restante para o --resume
+RATE_LIMIT_RESERVA = 50
+RATE_LIMIT_ESPERA_MAX = 15 * 60
+
+# Publicação progressiva: durante a execução o catálogo (e o HTML
+# pré-renderizado) é regravado a cada tantos segundos com o que já ficou
+# pronto, começando pelas pastas prioritárias; 0 publica só no fim
+PUBLICAR_A_CADA = 120
+
+# Ordem de processamento (menor primeiro); empate por nome
+PRIORIDADE_DESTAQUE = 0
+PRIORIDADE_SEM_PREVIEW = 1
+PRIORIDADE_ALTERADA = 2
+PRIORIDADE_NORMAL = 3
+
+
+# =========================
+# RECURSOS COMPARTILHADOS
+# =========================
+RATE_LIMIT = {"restante": None, "reset": None, "chamadas": 0}
+
+DOWNLOAD_CACHE = {"itens": OrderedDict(), "bytes": 0}
+
+RENDER = {"pool": None, "pendentes": {}}  # pendentes: png de saída -> future
+
+TEXTOS = {"conn": None}
+
+# ativo: None = automático (se houver tesseract no PATH); False com --sem-ocr
+OCR = {"ativo": None, "comando": None, "idiomas": None,
+       "sem_texto": 0, "cache": 0, "execucoes": 0, "falhas": 0, "segundos": 0.0}
+
+
+class OrcamentoEsgotado(Exception):
+    """Rate limit abaixo da reserva e reset distante demais para esperar."""
+
+
+class FalhaNaPasta(Exception):
+    """Pasta não pôde ser lida (rede, 403...): não vai para o journal e é tentada de novo."""
+
+
+def registrar_rate_limit(response, *args, **kwargs):
+    """Hook da sessão: acompanha o rate limit de todas as chamadas, de todas as fontes."""
+    RATE_LIMIT["chamadas"] += 1
+    restante = response.headers.get("X-RateLimit-Remaining")
+    # A GraphQL tem orçamento próprio (em pontos): não conta para a REST
+    if restante is not None and response.headers.get("X-RateLimit-Resource", "core") == "core":
+        RATE_LIMIT["restante"] = int(restante)
+        RATE_LIMIT["reset"] = int(response.headers.get("X-RateLimit-Reset", 0)) or None
+    return response
+
+
+SESSION.hooks["response"].append(registrar_rate_limit)
+
+
+def aguardar_orcamento():
+    """Espera o reset do rate limit se estiver abaixo da reserva (ou desiste)."""
+    restante, reset = RATE_LIMIT["restante"], RATE_LIMIT["reset"]
+    if restante is None or restante >= RATE_LIMIT_RESERVA:
+        return
+    espera = max(0, (reset or time.time()) - time.time()) + 1
+    if espera > RATE_LIMIT_ESPERA_MAX:
+        raise OrcamentoEsgotado(f"{restante} chamada(s) restante(s), reset em {espera / 60:.0f} min")
+    print(f"⏳ Rate limit: {restante} chamada(s) restante(s); aguardando {espera:.0f}s")
+    time.sleep(espera)
+    RATE_LIMIT["restante"] = None
+
+
+def download_pdf(pdf_file: dict) -> bytes:
+    """Baixa um PDF uma vez por execução (PDFs iguais em pastas/fontes diferentes têm o mesmo SHA)."""
+    itens = DOWNLOAD_CACHE["itens"]
+    sha = pdf_file.get("sha")
+    if sha and sha in itens:
+        itens.move_to_end(sha)
+        return itens[sha]
+
+    data = download_bytes(pdf_file["download_url"], timeout=120)
+    itens[sha or git_blob_sha(data)] = data
+    DOWNLOAD_CACHE["bytes"] += len(data)
+    while DOWNLOAD_CACHE["bytes"] > DOWNLOAD_CACHE_BYTES and len(itens) > 1:
+        _, antigo = itens.popitem(last=False)
+        DOWNLOAD_CACHE["bytes"] -= len(antigo)
+    return data
+
+
+def textos_conn():
+    if TEXTOS["conn"] is None:
+        TEXTOS["conn"] = textos.conectar(TEXTOS_DB)
+    return TEXTOS["conn"]
+
+
+def render_pool() -> ProcessPoolExecutor:
+    if RENDER["pool"] is None:
+        RENDER["pool"] = ProcessPoolExecutor(max_workers=RENDER_WORKERS)
+    return RENDER["pool"]
+
+
+def aguardar_renders(paths=None) -> set:
+    """Espera os renders pendentes (todos ou só os `paths`); devolve os que falharam."""
+    pendentes = RENDER["pendentes"]
+    falhas = set()
+    for out_png in list(pendentes if paths is None else [p for p in paths if p in pendentes]):
+        try:
+            pendentes.pop(out_png).result()
+        except Exception as e:
+            print(f"  ⚠️ Falha renderizando {os.path.basename(out_png)}: {e}")
+            falhas.add(out_png)
+    return falhas
+
+
+def encerrar_render_pool():
+    aguardar_renders()
+    if RENDER["pool"] is not None:
+        RENDER["pool"].shutdown()
+        RENDER["pool"] = None
+
+
+# =========================
+# FONTES
+# =========================
+def carregar_fontes(nomes=None) -> list:
+    """
+    Fontes de data/fontes.json: as pedidas em `nomes` ou todas as ativas.
+    Fonte com "ativo": false não roda nem pedida por nome (o catálogo dela
+    é mantido de outro jeito e seria sobrescrito). Caminhos de catálogo são
+    relativos a data/.
+    """
+    try:
+        with open(FONTES_FILE, "r", encoding="utf-8") as f:
+            config = json.load(f).get("fontes", [])
+    except OSError:
+        config = [FONTE_PADRAO]
+
+    fontes, inativas = [], set()
+    for cfg in config:
+        fonte = {**cfg, "catalogo": os.path.join(os.path.dirname(__file__), cfg["catalogo"])}
+        if not fonte.get("ativo", True):
+            inativas.add(fonte["nome"])
+        elif nomes is None or fonte["nome"] in nomes:
+            fontes.append(fonte)
+
+    pedidas_inativas = set(nomes or []) & inativas
+    if pedidas_inativas:
+        raise ValueError(f"fonte(s) desativada(s) em fontes.json: {', '.join(sorted(pedidas_inativas))}")
+    desconhecidas = set(nomes or []) - {f["nome"] for f in fontes}
+    if desconhecidas:
+        raise ValueError(f"fonte(s) não configurada(s) em fontes.json: {', '.join(sorted(desconhecidas))}")
+    return fontes
+
+
+def arquivo_da_fonte(path: str, fonte: dict) -> str:
+    """Arquivo de estado por fonte (catálogo, journal...); a padrão mantém os nomes de sempre."""
+    if fonte["nome"] == FONTE_PADRAO["nome"]:
+        return path
+    raiz, ext = os.path.splitext(path)
+    return f"{raiz}-{fonte['nome']}{ext}"
+
+
+def descricao_fonte(fonte: dict) -> str:
+    return f"{fonte['owner']}/{fonte['repo']}@{fonte['branch']}"
+
 
 # =========================
 # HELPERS
 # =========================
-def gh_contents(path: str):
+def gh_contents(path: str, fonte: dict = FONTE_PADRAO):
     """Lista conteúdo (arquivos/pastas) de um path via GitHub Contents API."""
-    url = f"{API_BASE}/repos/{OWNER}/{REPO}/contents/{quote(path)}"
-    r = requests.get(url, headers=HEADERS, params={"ref": BRANCH}, timeout=60)
+    url = f"{API_BASE}/repos/{fonte['owner']}/{fonte['repo']}/contents/{quote(path)}"
+    r = SESSION.get(url, params={"ref": fonte["branch"]}, timeout=60)
     r.raise_for_status()
     return r.json()
 
@@ -77,34 +330,93 @@ def slugify(s: str) -> str:
     return s
 
 
-def normalize_preview_path(folder_id: str, pdf_filename: str) -> str:
+
+def normalize_preview_path(blob_sha: str, fonte: dict = FONTE_PADRAO) -> str:
     """Caminho do preview que o FRONT vai usar (relativo ao site)."""
-    return f"assets/img/certificados/{folder_id}/{slugify(pdf_filename)}.png"
+    return caminho_do_preview(fonte["previews"], blob_sha)
 
 
-def preview_output_file(folder_id: str, pdf_filename: str) -> str:
+def preview_output_file(blob_sha: str, fonte: dict = FONTE_PADRAO) -> str:
     """Caminho físico no disco para salvar o PNG."""
-    return os.path.join(ASSETS_PREVIEW_ROOT, folder_id, f"{slugify(pdf_filename)}.png")
+    return os.path.join(SITE_ROOT, fonte["previews"], SHARED_PREVIEW_DIR, f"{blob_sha}.png")
+
+
+def legacy_preview_file(folder_id: str, pdf_filename: str, fonte: dict = FONTE_PADRAO) -> str:
+    """Caminho antigo (por pasta) do preview, usado para migrar PNGs já gerados."""
+    return os.path.join(SITE_ROOT, fonte["previews"], folder_id, f"{slugify(pdf_filename)}.png")
 
 
 def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 
-def parse_readme_frontmatter(readme_text: str):
-    """Tenta extrair Front Matter do README. Retorna dict vazio se falhar."""
-    try:
-        if not readme_text.startswith("---"):
-            return {}, readme_text
+def load_json_cache(name: str) -> dict:
+    """Lê um cache JSON de CACHE_DIR (dict vazio se não existir ou estiver corrompido)."""
+    data = carregar_json(os.path.join(CACHE_DIR, name))
+    return data if isinstance(data, dict) else {}
+
+
+def save_json_cache(name: str, data: dict):
+    """Grava um cache JSON em CACHE_DIR de forma atômica."""
+    salvar_json(os.path.join(CACHE_DIR, name), data, default=str)
+
 
-        parts = readme_text.split("---", 2)
-        if len(parts) < 3:
-            return {}, readme_text
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\r?\n(.*?)^---[ \t]*(?:\r?\n|\Z)", re.S | re.M)
+_HEADING_RE = re.compile(r"^##[ \t]+(.+?)[ \t]*\r?$", re.M)
 
-        yaml_block = parts[1].strip()
-        markdown = parts[2].lstrip("\n")
 
-        meta = yaml.safe_load(yaml_block) or {}
+def split_frontmatter(readme_text: str) -> tuple:
+    """Separa (yaml_block, markdown). yaml_block é None se não houver Front Matter."""
+    m = _FRONTMATTER_RE.match(readme_text)
+    if not m:
+        return None, readme_text
+    return m.group(1), readme_text[m.end():].lstrip("\n")
+
+
+def split_sections(markdown: str) -> dict:
+    """
+    Tokeniza os headings "## ..." uma única vez e devolve {heading: conteúdo}.
+    Subtítulos (###) ficam dentro da seção, como antes.
+    """
+    sections = {}
+    matches = list(_HEADING_RE.finditer(markdown))
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(markdown)
+        sections.setdefault(m.group(1), markdown[m.end():end].strip())
+    return sections
+
+
+def parse_readme(readme_text: str) -> dict:
+    """
+    Faz o parse completo do README em uma passada: {"meta": {...}, "sections": {...}}.
+    O resultado é serializável, então pode ir direto para o cache por SHA.
+    """
+    yaml_block, markdown = split_frontmatter(readme_text)
+    meta = {}
+    if yaml_block is not None:
+        try:
+            meta = yaml.load(yaml_block, Loader=YAML_LOADER) or {}
+        except yaml.YAMLError as e:
+            print(f"⚠️ Erro ao fazer parse do README front matter: {e}")
+            meta, markdown = {}, readme_text
+    if not isinstance(meta, dict):
+        meta = {}
+    return {"meta": meta, "sections": split_sections(markdown)}
+
+
+def select_sections(parsed: dict, headings: dict = README_SECTIONS) -> dict:
+    """Mapeia as seções configuradas (heading -> campo) para {campo: texto}."""
+    sections = parsed.get("sections", {})
+    return {field: sections.get(heading, "") for heading, field in headings.items()}
+
+
+def parse_readme_frontmatter(readme_text: str):
+    """Tenta extrair Front Matter do README. Retorna dict vazio se falhar."""
+    yaml_block, markdown = split_frontmatter(readme_text)
+    if yaml_block is None:
+        return {}, readme_text
+    try:
+        meta = yaml.load(yaml_block, Loader=YAML_LOADER) or {}
         return meta, markdown
     except Exception as e:
         print(f"⚠️ Erro ao fazer parse do README front matter: {e}")
@@ -112,72 +424,177 @@ def parse_readme_frontmatter(readme_text: str):
 
 
 def extract_section(markdown: str, heading: str) -> str:
-    pattern = rf"##\s+{re.escape(heading)}\s*\n(.*?)(\n##\s+|\Z)"
-    m = re.search(pattern, markdown, flags=re.S)
-    return m.group(1).strip() if m else ""
+    return split_sections(markdown).get(heading, "")
 
 
-def extract_info_from_pdf_text(pdf_bytes: bytes) -> dict:
-    """Extrai informações úteis do texto do PDF."""
+def extract_pdf_pages(pdf_bytes: bytes) -> list:
+    """Texto de cada página do PDF ([] se não der para ler)."""
     try:
         reader = PdfReader(BytesIO(pdf_bytes))
-        text = " ".join((page.extract_text() or "") for page in reader.pages)
-        
-        info = {}
-        
-        # Ano
-        year_match = re.search(r"\b(20\d{2})\b", text)
-        if year_match:
-            info["ano"] = year_match.group(1)
-        
-        # Duração (busca padrões como "40 horas", "120h", etc)
-        duration_match = re.search(r"(\d+)\s*(?:horas?|h\b)", text, re.I)
-        if duration_match:
-            info["duracao"] = f"{duration_match.group(1)} horas"
-        
-        # Instituição (algumas palavras-chave comuns)
-        instituicoes = [
-            "Data Science Academy",
-            "Coursera",
-            "Udemy",
-            "USP",
-            "ESALQ",
-            "Alura",
-            "Microsoft",
-            "Google",
-            "AWS",
-            "IBM"
-        ]
-        
-        for inst in instituicoes:
-            if inst.lower() in text.lower():
-                info["instituicao"] = inst
-                break
-        
-        return info
+        return [(page.extract_text() or "") for page in reader.pages]
     except Exception as e:
         print(f"⚠️ Erro ao extrair info do PDF: {e}")
-        return {}
+        return []
+
+
+def extract_pdf_text(pdf_bytes: bytes) -> str:
+    """Texto de todas as páginas do PDF ("" se não der para ler)."""
+    return " ".join(extract_pdf_pages(pdf_bytes))
 
 
-def infer_categoria_from_folder(folder_name: str) -> str:
-    """Infere categoria baseada no nome da pasta."""
-    folder_lower = folder_name.lower()
+def pdf_text_cached(pdf_file: dict) -> tuple:
+    """
+    (texto, sha) de um PDF do repo, pelo cache de textos; só baixa e lê o PDF
+    quando o SHA ainda não tem texto para a versão atual do extrator.
+    """
+    sha = pdf_file.get("sha")
+    conn = textos_conn()
+    paginas = textos.obter(conn, sha, TEXTO_VERSAO) if sha else None
+    if paginas is None:
+        data = download_pdf(pdf_file)
+        sha = sha or git_blob_sha(data)
+        paginas = extract_pdf_pages(data)
+        with conn:
+            textos.gravar(conn, sha, TEXTO_VERSAO, paginas)
+    texto = " ".join(paginas)
+    if not texto.strip():
+        texto = texto_ocr(pdf_file, sha)
+    return texto, sha
+
+
+# =========================
+# OCR (PDFs só com imagem)
+# =========================
+def tesseract() -> tuple | None:
+    """(comando, idiomas) do Tesseract local, ou None se o OCR estiver desligado/indisponível."""
+    if OCR["ativo"] is False:
+        return None
+    if OCR["comando"] is None:
+        comando = shutil.which("tesseract")
+        idiomas = ""
+        if comando:
+            try:
+                saida = subprocess.run([comando, "--list-langs"], capture_output=True, text=True, timeout=30).stdout
+                disponiveis = set(saida.split())
+                idiomas = "+".join(i for i in OCR_IDIOMAS if i in disponiveis) or "eng"
+            except (OSError, subprocess.SubprocessError):
+                comando = None
+        if not comando:
+            print("  ℹ️ PDF sem texto e Tesseract não encontrado: OCR desligado nesta execução")
+            OCR["ativo"] = False
+            return None
+        OCR["comando"], OCR["idiomas"] = comando, idiomas
+    return OCR["comando"], OCR["idiomas"]
+
+
+def ocr_primeira_pagina(pdf_bytes: bytes, comando: str, idiomas: str) -> str:
+    """
+    OCR da 1ª página: renderiza em cinza a OCR_DPI (limitado a OCR_LADO_MAXIMO)
+    e passa o PNG ao tesseract por stdin. Roda no processo principal: o texto
+    é usado logo em seguida (instituição, categoria) e o tesseract já é um
+    processo à parte.
+    """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        if doc.page_count == 0:
+            return ""
+        page = doc.load_page(0)
+        zoom = min(OCR_DPI / 72, OCR_LADO_MAXIMO / max(page.rect.width, page.rect.height))
+        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False)
+        png = pix.tobytes("png")
+    finally:
+        doc.close()
+    out = subprocess.run([comando, "stdin", "stdout", "-l", idiomas, "--dpi", str(round(zoom * 72))],
+                         input=png, capture_output=True, timeout=OCR_TIMEOUT, check=True)
+    return out.stdout.decode("utf-8", "replace")
+
+
+def texto_ocr(pdf_file: dict, sha: str) -> str:
+    """
+    Texto por OCR de um PDF sem camada de texto, pelo cache de textos (por
+    SHA do blob, OCR_VERSAO). Resultado vazio também fica em cache; falha
+    não (tenta de novo na próxima execução). "" se não houver Tesseract.
+    """
+    OCR["sem_texto"] += 1
+    conn = textos_conn()
+    paginas = textos.obter(conn, sha, OCR_VERSAO)
+    if paginas is not None:
+        OCR["cache"] += 1
+        return " ".join(paginas)
+    ferramenta = tesseract()
+    if ferramenta is None:
+        return ""
+
+    inicio = time.perf_counter()
+    try:
+        texto = ocr_primeira_pagina(download_pdf(pdf_file), *ferramenta)
+    except Exception as e:
+        OCR["falhas"] += 1
+        print(f"  ⚠️ OCR falhou para {pdf_file.get('name')}: {e}")
+        return ""
+    dt = time.perf_counter() - inicio
+    OCR["execucoes"] += 1
+    OCR["segundos"] += dt
+    with conn:
+        textos.gravar(conn, sha, OCR_VERSAO, [texto])
+    print(f"  🔎 OCR da 1ª página ({pdf_file.get('name')}): {len(texto.split())} palavra(s) em {dt:.1f}s")
+    return texto
+
+
+def resumo_ocr() -> str | None:
+    """Linha do relatório: PDFs sem texto, acertos do cache e tempo de OCR desta execução."""
+    if not OCR["sem_texto"]:
+        return None
+    taxa = OCR["cache"] / OCR["sem_texto"] * 100
+    falhas = f", {OCR['falhas']} falha(s)" if OCR["falhas"] else ""
+    return (f"🔎 OCR: {OCR['sem_texto']} PDF(s) sem texto, {OCR['cache']} do cache ({taxa:.0f}%), "
+            f"{OCR['execucoes']} lido(s) em {OCR['segundos']:.1f}s{falhas}")
+
+
+def extract_info_from_text(text: str) -> dict:
+    """Extrai ano, duração e instituição do texto do PDF."""
+    info = {}
     
-    if any(x in folder_lower for x in ["python", "r ", "sql", "programming", "programação"]):
-        return "Programação"
-    elif any(x in folder_lower for x in ["bi", "power bi", "tableau", "visualização"]):
-        return "Business Intelligence"
-    elif any(x in folder_lower for x in ["machine learning", "ml", "deep learning", "ai", "ia"]):
-        return "Machine Learning"
-    elif any(x in folder_lower for x in ["data science", "ciência de dados", "analytics"]):
-        return "Data Science"
-    elif any(x in folder_lower for x in ["excel", "office"]):
-        return "Produtividade"
-    elif any(x in folder_lower for x in ["cloud", "aws", "azure", "gcp"]):
-        return "Cloud Computing"
-    else:
-        return "Diversos"
+    # Ano
+    year_match = re.search(r"\b(20\d{2})\b", text)
+    if year_match:
+        info["ano"] = year_match.group(1)
+    
+    # Duração (busca padrões como "40 horas", "120h", etc)
+    duration_match = re.search(r"(\d+)\s*(?:horas?|h\b)", text, re.I)
+    if duration_match:
+        info["duracao"] = f"{duration_match.group(1)} horas"
+    
+    # Instituição (algumas palavras-chave comuns)
+    instituicoes = [
+        "Data Science Academy",
+        "Coursera",
+        "Udemy",
+        "USP",
+        "ESALQ",
+        "Alura",
+        "Microsoft",
+        "Google",
+        "AWS",
+        "IBM"
+    ]
+    
+    for inst in instituicoes:
+        if inst.lower() in text.lower():
+            info["instituicao"] = inst
+            break
+    
+    return info
+
+
+def extract_info_from_pdf_text(pdf_bytes: bytes) -> dict:
+    """Extrai informações úteis do texto do PDF."""
+    return extract_info_from_text(extract_pdf_text(pdf_bytes))
+
+
+def infer_categoria_from_folder(folder_name: str, pdf_text: str = "") -> str:
+    """Infere categoria pelas regras de data/categorias.json (nome da pasta + texto do PDF)."""
+    return classificar(folder_name, pdf_text)
 
 
 def load_existing_data(path: str) -> dict:
@@ -197,7 +614,7 @@ def load_existing_data(path: str) -> dict:
 
 
 def download_bytes(url: str, timeout=120) -> bytes:
-    r = requests.get(url, timeout=timeout)
+    r = SESSION.get(url, timeout=timeout)
     r.raise_for_status()
     return r.content
 
@@ -220,6 +637,106 @@ def render_pdf_first_page_to_png(pdf_bytes: bytes, out_png_path: str, zoom: floa
     doc.close()
 
 
+def ensure_preview(folder_id: str, pdf_file: dict, pdf_bytes: bytes | None = None,
+                   fonte: dict = FONTE_PADRAO) -> tuple:
+    """
+    Garante o preview compartilhado de um PDF e retorna (sha, status).
+
+    PDFs idênticos em pastas diferentes têm o mesmo SHA de blob, então são
+    baixados e renderizados uma única vez. Previews antigos por pasta são
+    reaproveitados (movidos) em vez de renderizados de novo.
+
+    Com RENDER_WORKERS > 1 o render vai para o pool compartilhado e o status
+    "criado" significa "agendado": use aguardar_renders() antes de ler o PNG.
+    """
+    blob_sha = pdf_file.get("sha")
+    if not blob_sha:
+        if pdf_bytes is None:
+            pdf_bytes = download_pdf(pdf_file)
+        blob_sha = git_blob_sha(pdf_bytes)
+
+    out_png = preview_output_file(blob_sha, fonte)
+    legacy_png = legacy_preview_file(folder_id, pdf_file["name"], fonte)
+
+    if os.path.exists(out_png) or out_png in RENDER["pendentes"]:
+        if os.path.exists(legacy_png):
+            os.remove(legacy_png)  # cópia duplicada da versão compartilhada
+        return blob_sha, "existente"
+
+    ensure_dir(os.path.dirname(out_png))
+    if os.path.exists(legacy_png):
+        os.replace(legacy_png, out_png)
+        return blob_sha, "migrado"
+
+    if pdf_bytes is None:
+        pdf_bytes = download_pdf(pdf_file)
+    if RENDER_WORKERS > 1:
+        RENDER["pendentes"][out_png] = render_pool().submit(
+            render_pdf_first_page_to_png, pdf_bytes, out_png, 2.0, False
+        )
+    else:
+        render_pdf_first_page_to_png(pdf_bytes, out_png, zoom=2.0, overwrite=False)
+    return blob_sha, "criado"
+
+
+def mosaic_rel_path(folder_id: str, fonte: dict = FONTE_PADRAO) -> str:
+    """Caminho do mosaico da pasta (relativo ao site)."""
+    return f"{fonte['previews']}/{folder_id}-thumb.jpg"
+
+
+def build_folder_mosaic(folder_id: str, previews: list, cache: dict, fonte: dict = FONTE_PADRAO) -> str:
+    """
+    Monta um mosaico (contact sheet) com até MOSAIC_MAX_TILES previews da pasta.
+
+    O mosaico só é refeito quando a lista de previews muda; como os previews
+    são endereçados por conteúdo, a própria lista de caminhos é a assinatura.
+    Retorna o caminho relativo do mosaico, ou "" se não houver previews.
+    """
+    tiles = [p for p in previews if p and os.path.exists(os.path.join(SITE_ROOT, p))]
+    tiles = tiles[:MOSAIC_MAX_TILES]
+    if not tiles:
+        return ""
+
+    rel_path = mosaic_rel_path(folder_id, fonte)
+    out_path = os.path.join(SITE_ROOT, rel_path)
+    signature = hashlib.sha1(
+        "|".join(tiles + [f"{MOSAIC_SIZE[0]}x{MOSAIC_SIZE[1]}"]).encode()
+    ).hexdigest()
+    cache_key = folder_id if fonte["nome"] == FONTE_PADRAO["nome"] else f"{fonte['nome']}/{folder_id}"
+    if cache.get(cache_key) == signature and os.path.exists(out_path):
+        return rel_path
+
+    cols = 1 if len(tiles) == 1 else 2
+    rows = 1 if len(tiles) <= 2 else 2
+    cell_w, cell_h = MOSAIC_SIZE[0] // cols, MOSAIC_SIZE[1] // rows
+
+    sheet = Image.new("RGB", MOSAIC_SIZE, (17, 24, 39))
+    for i, tile_path in enumerate(tiles):
+        with Image.open(os.path.join(SITE_ROOT, tile_path)) as img:
+            img = img.convert("RGB")
+            # Preenche a célula mantendo o topo do certificado
+            scale = max(cell_w / img.width, cell_h / img.height)
+            img = img.resize(
+                (max(cell_w, round(img.width * scale)), max(cell_h, round(img.height * scale))),
+                Image.Resampling.LANCZOS,
+            )
+            left = (img.width - cell_w) // 2
+            img = img.crop((left, 0, left + cell_w, cell_h))
+            sheet.paste(img, ((i % cols) * cell_w, (i // cols) * cell_h))
+
+    ensure_dir(os.path.dirname(out_path))
+    sheet.save(out_path, "JPEG", quality=MOSAIC_QUALITY, optimize=True, progressive=True)
+    cache[cache_key] = signature
+    return rel_path
+
+
+def resolve_local_thumbnail(thumbnail: str | None) -> str | None:
+    """Descarta thumbnails locais do README que não existem no disco (evita 404)."""
+    if not thumbnail or thumbnail.startswith(("http://", "https://")):
+        return thumbnail
+    return thumbnail if os.path.exists(os.path.join(SITE_ROOT, thumbnail)) else None
+
+
 def merge_certificate_data(existing: dict, new: dict) -> dict:
     """
     Mescla dados existentes com novos, preservando informações importantes.
@@ -240,9 +757,14 @@ def merge_certificate_data(existing: dict, new: dict) -> dict:
     if new.get("ano"):
         merged["ano"] = new["ano"]
     
-    # Atualiza thumbnail
+    # Atualiza thumbnail e mosaico
     if new.get("thumbnail"):
         merged["thumbnail"] = new["thumbnail"]
+    if new.get("mosaico"):
+        merged["mosaico"] = new["mosaico"]
+    # Zoom segue o PDF atual: PDF trocado sem pirâmide nova fica sem zoom
+    if "zoom" in new:
+        merged["zoom"] = new["zoom"]
     
     # Atualiza competências
     if new.get("competencias"):
@@ -253,6 +775,10 @@ def merge_certificate_data(existing: dict, new: dict) -> dict:
     new_certs = {c["nome"]: c for c in new.get("certificados", [])}
     
     # Atualiza certificados existentes e adiciona novos
+    # (se o preview falhou nesta execução, mantém o anterior)
+    for nome, cert in new_certs.items():
+        if not cert.get("preview") and existing_certs.get(nome, {}).get("preview"):
+            new_certs[nome] = {**cert, "preview": existing_certs[nome]["preview"]}
     existing_certs.update(new_certs)
     merged["certificados"] = list(existing_certs.values())
     merged["totalCertificados"] = len(merged["certificados"])
@@ -268,208 +794,1013 @@ def merge_certificate_data(existing: dict, new: dict) -> dict:
 
 
 # =========================
-# MAIN
+# EXTRAÇÃO
 # =========================
-def main():
-    print(f"\n{'='*60}")
-    print(f"🔄 EXTRAÇÃO INCREMENTAL DE CERTIFICADOS")
-    print(f"{'='*60}\n")
+def load_caches() -> dict:
+    """Carrega os caches persistentes do extrator (mantidos em memória no modo --watch)."""
+    return {
+        "mosaicos": load_json_cache("mosaicos.json"),
+        "readmes": load_json_cache("readmes.json"),
+    }
+
+
+def save_caches(caches: dict):
+    save_json_cache("mosaicos.json", caches["mosaicos"])
+    save_json_cache("readmes.json", caches["readmes"])
+
+
+def process_folder(folder: dict, caches: dict, fonte: dict = FONTE_PADRAO) -> dict | None:
+    """
+    Processa uma pasta do repo e devolve o item do catálogo (None se a pasta
+    for pulada, ex. sem PDFs). Levanta FalhaNaPasta se a listagem falhar.
+    """
+    folder_name = folder["name"]
+    folder_path = folder["path"]
+    repo_url = f"https://github.com/{fonte['owner']}/{fonte['repo']}"
+
+    print(f"\n📁 Processando: {folder_name}")
+
+    try:
+        items = gh_contents(folder_path, fonte)
+    except Exception as e:
+        raise FalhaNaPasta(f"{folder_name}: {e}") from e
+
+    # ✅ Tenta ler README (mas não é obrigatório)
+    readme = next((x for x in items if x.get("type") == "file" and x.get("name", "").lower() == "readme.md"), None)
     
-    # Carrega dados existentes
-    existing_by_id = load_existing_data(OUTPUT_JSON)
-    print(f"📊 Certificados existentes: {len(existing_by_id)}")
+    meta = {}
+    descricao = ""
+    descricao_completa = ""
+    readme_sha = None
     
-    result_by_id = {}
-    new_count = 0
-    updated_count = 0
-    skipped_count = 0
+    if readme:
+        try:
+            # README inalterado (mesmo SHA de blob) nem é baixado de novo
+            readme_sha = readme.get("sha")
+            parsed = caches["readmes"].get(readme_sha) if readme_sha else None
+            if parsed is None:
+                readme_text = SESSION.get(readme["download_url"], timeout=60).text
+                parsed = parse_readme(readme_text)
+                if readme_sha:
+                    caches["readmes"][readme_sha] = parsed
+                print(f"  ✓ README encontrado e processado")
+            else:
+                print(f"  ↻ README em cache")
+            meta = parsed["meta"]
+            sections = select_sections(parsed)
+            descricao = sections.get("descricao", "")
+            descricao_completa = sections.get("descricaoCompleta", "")
+        except Exception as e:
+            print(f"  ⚠️ Erro ao processar README: {e}")
+    else:
+        print(f"  ⚠️ Sem README - usando valores padrão")
 
-    root = gh_contents("")
-    folders = [x for x in root if x.get("type") == "dir"]
+    # ✅ Busca PDFs
+    pdf_files = [x for x in items if x.get("type") == "file" and x.get("name", "").lower().endswith(".pdf")]
+    
+    if not pdf_files:
+        print(f"  ⚠️ Nenhum PDF encontrado, pulando pasta")
+        return None
 
-    for folder in sorted(folders, key=lambda x: x.get("name", "").lower()):
-        folder_name = folder["name"]
-        folder_path = folder["path"]
+    print(f"  ✓ {len(pdf_files)} PDF(s) encontrado(s)")
+
+    # ✅ ID da pasta
+    folder_id = meta.get("id") or slugify(folder_name)
 
-        print(f"\n📁 Processando: {folder_name}")
+    # ✅ PDF de formação (para ano e thumbnail)
+    formacao_pdf = next((p for p in pdf_files if "formação" in p["name"].lower()), None)
 
+    # ✅ Informações extraídas do PDF de formação (ou do primeiro PDF), via cache de textos
+    extracted_info = {}
+    pdf_text = ""
+    texto_sha = None
+    ano = meta.get("ano")
+    ref_pdf = formacao_pdf or pdf_files[0]
+
+    if ref_pdf.get("download_url"):
         try:
-            items = gh_contents(folder_path)
+            pdf_text, texto_sha = pdf_text_cached(ref_pdf)
+            extracted_info = extract_info_from_text(pdf_text)
+            if not ano:
+                ano = extracted_info.get("ano")
         except Exception as e:
-            print(f"❌ Erro ao acessar {folder_name}: {e}")
-            continue
+            print(f"  ⚠️ Erro ao extrair info do PDF {ref_pdf['name']}: {e}")
 
-        # ✅ Tenta ler README (mas não é obrigatório)
-        readme = next((x for x in items if x.get("type") == "file" and x.get("name", "").lower() == "readme.md"), None)
-        
-        meta = {}
-        descricao = ""
-        descricao_completa = ""
-        
-        if readme:
-            try:
-                readme_text = requests.get(readme["download_url"], timeout=60).text
-                meta, md = parse_readme_frontmatter(readme_text)
-                descricao = extract_section(md, "📌 Descrição curta")
-                descricao_completa = extract_section(md, "📖 Descrição completa")
-                print(f"  ✓ README encontrado e processado")
-            except Exception as e:
-                print(f"  ⚠️ Erro ao processar README: {e}")
+    # ✅ Processa todos os certificados
+    certificados = []
+    shas = {}
+    for p in sorted(pdf_files, key=lambda x: x["name"].lower()):
+        pdf_name = p["name"]
+        is_formacao = ("formação" in pdf_name.lower())
+
+        # Gera preview (só se ainda não existir para este conteúdo)
+        preview = ""
+        try:
+            blob_sha, status = ensure_preview(folder_id, p, fonte=fonte)
+            preview = normalize_preview_path(blob_sha, fonte)
+            shas[pdf_name] = blob_sha
+            if status == "existente":
+                print(f"  ↻ Preview existente: {pdf_name}")
+            else:
+                print(f"  ✓ Preview {status}: {pdf_name}")
+        except Exception as e:
+            print(f"  ⚠️ Falha gerando preview: {pdf_name} -> {e}")
+
+        certificados.append({
+            "nome": pdf_name,
+            "url": f"{repo_url}/blob/{fonte['branch']}/{quote(folder_path)}/{quote(pdf_name)}",
+            "preview": preview,
+            "isFormacao": is_formacao
+        })
+
+    # Renders agendados no pool precisam terminar antes do mosaico
+    falhas = aguardar_renders(preview_output_file(sha, fonte) for sha in shas.values())
+    for c in certificados:
+        if c["preview"] and preview_output_file(shas[c["nome"]], fonte) in falhas:
+            c["preview"] = ""
+
+    # ✅ Mosaico da pasta (formação primeiro) e thumbnail automático
+    previews_by_name = {c["nome"]: c["preview"] for c in certificados}
+    formacao_preview = previews_by_name.get(formacao_pdf["name"]) if formacao_pdf else ""
+    member_previews = [formacao_preview] + [
+        c["preview"] for c in certificados if c["preview"] != formacao_preview
+    ]
+    mosaico = ""
+    try:
+        mosaico = build_folder_mosaic(folder_id, member_previews, caches["mosaicos"], fonte)
+    except Exception as e:
+        print(f"  ⚠️ Falha gerando mosaico: {e}")
+
+    thumbnail = (
+        resolve_local_thumbnail(meta.get("thumbnail"))
+        or mosaico
+        or formacao_preview
+        or (certificados[0]["preview"] if certificados else "")
+    )
+
+    # ✅ Pirâmide de zoom profundo do PDF de referência (gerada com --zoom)
+    zoom = ""
+    ref_sha = shas.get(ref_pdf["name"])
+    if ref_sha and piramides.pronta(piramides.destino_da_piramide(ref_sha, SITE_ROOT)):
+        zoom = piramides.descritor_rel(ref_sha)
+
+    # ✅ Usa valores do README ou infere/extrai do PDF
+    titulo = meta.get("titulo") or folder_name.replace("-", " ").title()
+    instituicao = meta.get("instituicao") or extracted_info.get("instituicao", "")
+    duracao = meta.get("duracao") or extracted_info.get("duracao", "")
+    categoria = meta.get("categoria") or infer_categoria_from_folder(folder_name, pdf_text)
+
+    # De onde veio cada campo: --reextrair só mexe no que não veio do README
+    origens = {campo: "readme" if meta.get(campo) else "pdf" for campo in CAMPOS_EXTRAIDOS}
+    origens["categoria"] = "readme" if meta.get("categoria") else "inferida"
+    
+    # ✅ Descrição padrão se não houver
+    if not descricao:
+        descricao = f"Certificação em {titulo}"
+        if instituicao:
+            descricao += f" pela {instituicao}"
+    
+    if not descricao_completa:
+        descricao_completa = descricao
+
+    # ✅ Cria novo item
+    new_item = {
+        "id": folder_id,
+        "titulo": titulo,
+        "tipo": meta.get("tipo", "Formação"),
+        "instituicao": instituicao,
+        "categoria": categoria,
+        "duracao": duracao,
+        "destaque": bool(meta.get("destaque", False)),
+        "thumbnail": thumbnail,
+        "mosaico": mosaico,
+        "zoom": zoom,
+        "competencias": meta.get("competencias", []) or [],
+        "descricao": descricao,
+        "descricaoCompleta": descricao_completa,
+        "certificados": certificados,
+        "totalCertificados": len(certificados),
+        "githubFolder": f"{repo_url}/tree/{fonte['branch']}/{quote(folder_path)}",
+        "status": "Concluído",
+        "ano": ano or "",
+        # Dados só do catálogo SQLite (removidos antes de ir para o JSON)
+        "_build": {
+            "nome": folder_name,
+            "readme_sha": readme_sha,
+            "shas": shas,
+            "extracao": extracted_info,
+            "texto_sha": texto_sha,
+            "origens": origens,
+        },
+    }
+
+    return new_item
+
+
+# =========================
+# READMEs EM LOTE (GraphQL)
+# =========================
+def consulta_readmes(n: int) -> str:
+    """Consulta GraphQL com `n` aliases f0..fn-1, um object(expression:) por README."""
+    variaveis = "".join(f", $e{i}: String!" for i in range(n))
+    campos = "\n".join(f"    f{i}: object(expression: $e{i}) {{ ... on Blob {{ oid isBinary isTruncated text }} }}"
+                       for i in range(n))
+    return (f"query($owner: String!, $repo: String!{variaveis}) {{\n"
+            f"  repository(owner: $owner, name: $repo) {{\n{campos}\n  }}\n}}")
+
+
+def graphql(query: str, variables: dict) -> dict:
+    r = SESSION.post(GRAPHQL_URL, json={"query": query, "variables": variables}, timeout=60)
+    r.raise_for_status()
+    body = r.json()
+    if not body.get("data"):
+        raise RuntimeError("; ".join(e.get("message", "?") for e in body.get("errors", [])) or "resposta vazia")
+    return body["data"]
+
+
+def prefetch_readmes(folders: list, caches: dict, fonte: dict = FONTE_PADRAO) -> dict:
+    """
+    Busca os README.md das pastas em lotes de GRAPHQL_LOTE por chamada
+    GraphQL e guarda o parse no cache por SHA do blob: process_folder acha o
+    README em cache e não faz o download pela REST. Pasta sem README (ou com
+    outro nome, ex. readme.md) vem nula e fica para a REST. Sem token, com a
+    fonte marcada "graphql": false ou com erro, não faz nada.
+    Retorna {nome da pasta: SHA do README} das que vieram (para a prioridade).
+    """
+    if not GITHUB_TOKEN or not fonte.get("graphql", True) or not folders:
+        return {}
+    paths = [f["path"] for f in folders]
+    nomes = {f["path"]: f["name"] for f in folders}
+    encontrados = {}
+    novos = chamadas = 0
+    try:
+        for inicio in range(0, len(paths), GRAPHQL_LOTE):
+            lote = paths[inicio:inicio + GRAPHQL_LOTE]
+            variaveis = {"owner": fonte["owner"], "repo": fonte["repo"]}
+            variaveis.update({f"e{i}": f"{fonte['branch']}:{p}/README.md" for i, p in enumerate(lote)})
+            repo = graphql(consulta_readmes(len(lote)), variaveis).get("repository") or {}
+            chamadas += 1
+            for i in range(len(lote)):
+                blob = repo.get(f"f{i}")
+                if not blob or blob.get("isBinary") or blob.get("isTruncated") or blob.get("text") is None:
+                    continue
+                encontrados[nomes[lote[i]]] = blob["oid"]
+                if blob["oid"] not in caches["readmes"]:
+                    caches["readmes"][blob["oid"]] = parse_readme(blob["text"])
+                    novos += 1
+    except Exception as e:
+        print(f"⚠️ READMEs via GraphQL indisponíveis ({e}); seguindo pela REST")
+    if chamadas:
+        print(f"📚 READMEs via GraphQL: {novos} novo(s) de {len(paths)} pasta(s) em {chamadas} chamada(s)")
+    return encontrados
+
+
+# =========================
+# PRIORIDADE E PUBLICAÇÃO PROGRESSIVA
+# =========================
+def prioridades(folders: list, conn, caches: dict, readmes: dict) -> dict:
+    """
+    Prioridade de cada pasta: destaques primeiro (os cards do index.html),
+    depois pastas sem preview (novas ou com PNG ausente no disco), depois
+    as alteradas (README com SHA diferente do último build), depois o resto.
+
+    Destaque vem do front matter do README quando ele já está em cache
+    (`readmes`: nome -> SHA, do prefetch GraphQL) e, senão, do catálogo.
+    Numa primeira execução sem token nada disso é conhecido antes de
+    processar: tudo cai em "sem preview" e a ordem fica a alfabética.
+    """
+    pastas = {nome: (pasta_id, destaque, readme_sha) for nome, pasta_id, destaque, readme_sha
+              in conn.execute("SELECT nome, id, destaque, readme_sha FROM pastas WHERE nome IS NOT NULL")}
+    sem_preview = {
+        pasta_id for pasta_id, preview in conn.execute("SELECT pasta_id, preview FROM certificados")
+        if not preview or not os.path.exists(os.path.join(SITE_ROOT, preview))
+    }
+    out = {}
+    for folder in folders:
+        nome = folder["name"]
+        pasta_id, destaque, readme_sha = pastas.get(nome, (None, 0, None))
+        parsed = caches["readmes"].get(readmes.get(nome))
+        if parsed is not None and "destaque" in parsed["meta"]:
+            destaque = parsed["meta"]["destaque"]
+        if destaque:
+            out[nome] = PRIORIDADE_DESTAQUE
+        elif pasta_id is None or pasta_id in sem_preview:
+            out[nome] = PRIORIDADE_SEM_PREVIEW
+        elif nome in readmes and readmes[nome] != readme_sha:
+            out[nome] = PRIORIDADE_ALTERADA
         else:
-            print(f"  ⚠️ Sem README - usando valores padrão")
+            out[nome] = PRIORIDADE_NORMAL
+    return out
 
-        # ✅ Busca PDFs
-        pdf_files = [x for x in items if x.get("type") == "file" and x.get("name", "").lower().endswith(".pdf")]
-        
-        if not pdf_files:
-            print(f"  ⚠️ Nenhum PDF encontrado, pulando pasta")
-            continue
 
-        print(f"  ✓ {len(pdf_files)} PDF(s) encontrado(s)")
+def publicar(conn, fonte: dict) -> int:
+    """Exporta o catálogo da fonte e atualiza relacionados/facetas (deltas). Retorna o total de itens."""
+    catalog_json = fonte["catalogo"]
+    total = catalogo.exportar_json(conn, catalog_json)
+    # Relacionados (só recalcula as linhas afetadas pelas pastas alteradas)
+    relacionados.atualizar(
+        catalog_json,
+        arquivo_da_fonte(os.path.join(os.path.dirname(catalog_json), "relacionados.json"), fonte),
+        arquivo_da_fonte(os.path.join(CACHE_DIR, "relacionados.json"), fonte),
+    )
+    # Facetas/estatísticas/ordenações (só os itens alterados entram no delta)
+    facetas.atualizar(
+        catalog_json,
+        arquivo_da_fonte(os.path.join(os.path.dirname(catalog_json), "facetas.json"), fonte),
+        arquivo_da_fonte(os.path.join(CACHE_DIR, "facetas.json"), fonte),
+    )
+    return total
+
+
+def publicar_parcial(conn, fonte: dict, feitas: int, total_pastas: int):
+    """Snapshot no meio da execução: catálogo válido com o que já foi processado + HTML/manifesto."""
+    total = publicar(conn, fonte)
+    atualizar_site()
+    print(f"📤 Publicação parcial: {total} item(ns) no catálogo ({feitas}/{total_pastas} pasta(s) desta execução)")
 
-        # ✅ ID da pasta
-        folder_id = meta.get("id") or slugify(folder_name)
 
-        # ✅ Verifica se já existe
-        existing_item = existing_by_id.get(folder_id)
-        is_new = existing_item is None
+# =========================
+# SELEÇÃO E PLANO (--only / --since / --dry-run)
+# =========================
+def pasta_casa(nome: str, item_id: str | None, padroes: list) -> bool:
+    """A pasta casa com algum glob pelo nome no repo ou pelo id (catálogo ou slug)?"""
+    candidatos = {nome.lower(), slugify(nome)}
+    if item_id:
+        candidatos.add(item_id.lower())
+    return any(fnmatch(c, p.lower()) for c in candidatos for p in padroes)
 
-        # ✅ PDF de formação (para ano e thumbnail)
-        formacao_pdf = next((p for p in pdf_files if "formação" in p["name"].lower()), None)
 
-        # ✅ Informações extraídas do primeiro PDF (se não tiver README)
-        extracted_info = {}
-        ano = meta.get("ano")
-        
-        if formacao_pdf and formacao_pdf.get("download_url"):
-            try:
-                form_bytes = download_bytes(formacao_pdf["download_url"], timeout=120)
-                extracted_info = extract_info_from_pdf_text(form_bytes)
-                if not ano:
-                    ano = extracted_info.get("ano")
-
-                # Gera preview do certificado de formação (só se não existir)
-                out_png = preview_output_file(folder_id, formacao_pdf["name"])
-                render_pdf_first_page_to_png(form_bytes, out_png, zoom=2.0, overwrite=False)
-                if os.path.exists(out_png):
-                    print(f"  ✓ Preview: {formacao_pdf['name']}")
-            except Exception as e:
-                print(f"  ⚠️ Erro ao processar PDF de formação: {e}")
-        elif pdf_files:
-            # Se não tem formação, usa o primeiro PDF
+def catalogo_total(path: str) -> int:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return len(json.load(f))
+    except (OSError, ValueError):
+        return 0
+
+
+def planejar(folders: list, caches: dict, fonte: dict = FONTE_PADRAO) -> dict:
+    """
+    Imprime o que uma execução faria nessas pastas, sem baixar nem gravar
+    nada: READMEs e PDFs a baixar (com tamanho) e previews a renderizar.
+    Só lista o conteúdo das pastas (uma chamada à API por pasta); o cache de
+    textos é aberto só para leitura.
+    """
+    conn = textos.conectar_leitura(TEXTOS_DB)
+    plano = {"pastas": 0, "downloads": 0, "bytes": 0, "renders": 0, "chamadas": 0}
+    print(f"\n🧭 Plano (dry-run) — {fonte['nome']}: {len(folders)} pasta(s)")
+    print(f"   {'Pasta':<40}{'PDFs':>6}{'Downloads':>11}{'KB':>9}{'Renders':>9}  README")
+
+    for folder in sorted(folders, key=lambda x: x.get("name", "").lower()):
+        try:
+            items = gh_contents(folder["path"], fonte)
+        except Exception as e:
+            print(f"   {folder['name']:<40}  ⚠️ {e}")
+            continue
+        plano["chamadas"] += 1
+        pdfs = [x for x in items if x.get("type") == "file" and x.get("name", "").lower().endswith(".pdf")]
+        if not pdfs:
+            continue
+        readme = next((x for x in items if x.get("type") == "file" and x.get("name", "").lower() == "readme.md"), None)
+
+        downloads, tamanho, renders = 0, 0, 0
+        situacao_readme = "—"
+        if readme:
+            situacao_readme = "cache" if readme.get("sha") in caches["readmes"] else "baixar"
+            if situacao_readme == "baixar":
+                downloads += 1
+                tamanho += readme.get("size", 0)
+
+        # Texto só do PDF de referência (o mesmo que process_folder lê)
+        ref_pdf = next((p for p in pdfs if "formação" in p["name"].lower()), pdfs[0])
+        vistos = set()
+        for p in pdfs:
+            sha = p.get("sha")
+            if sha in vistos:
+                continue  # mesmo conteúdo: um download e um render só
+            vistos.add(sha)
+            sem_preview = not (sha and os.path.exists(preview_output_file(sha, fonte))) and not os.path.exists(
+                legacy_preview_file(slugify(folder["name"]), p["name"], fonte))
+            sem_texto = p is ref_pdf and (not sha or conn is None or textos.obter(conn, sha, TEXTO_VERSAO) is None)
+            renders += sem_preview
+            if sem_preview or sem_texto:
+                downloads += 1
+                tamanho += p.get("size", 0)
+
+        plano["pastas"] += 1
+        plano["downloads"] += downloads
+        plano["bytes"] += tamanho
+        plano["renders"] += renders
+        print(f"   {folder['name'][:39]:<40}{len(pdfs):>6}{downloads:>11}{tamanho / 1024:>9.0f}{renders:>9}  {situacao_readme}")
+
+    print(f"   Total: {plano['pastas']} pasta(s), {plano['downloads']} download(s) "
+          f"(~{plano['bytes'] / 1048576:.1f} MB), {plano['renders']} render(s), "
+          f"{plano['chamadas'] + 1} chamada(s) à API para o plano")
+    if conn is not None:
+        conn.close()
+    return plano
+
+
+def load_journal(path: str | None = None) -> tuple:
+    """
+    Lê o journal de uma execução interrompida: (cabeçalho, {pasta: item}).
+    Uma última linha truncada (queda no meio da escrita) é ignorada.
+    """
+    path = path or JOURNAL_FILE
+    header, done = {}, {}
+    if not os.path.exists(path):
+        return header, done
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
             try:
-                first_pdf = pdf_files[0]
-                first_bytes = download_bytes(first_pdf["download_url"], timeout=120)
-                extracted_info = extract_info_from_pdf_text(first_bytes)
-                if not ano:
-                    ano = extracted_info.get("ano")
-            except Exception as e:
-                print(f"  ⚠️ Erro ao extrair info do primeiro PDF: {e}")
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if "folder" in record:
+                done[record["folder"]] = record.get("item")
+            else:
+                header = record
+    return header, done
+
+
+def journal_append(fh, record: dict):
+    """Grava uma linha no journal e força ida ao disco (sobrevive a um crash)."""
+    fh.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    fh.flush()
+    os.fsync(fh.fileno())
+
+
+def run(only: set | None = None, caches: dict | None = None, head: str | None = None,
+        resume: bool = False, fonte: dict = FONTE_PADRAO, prerender_html: bool = True,
+        padroes: list | None = None, dry_run: bool = False, registrar_head: bool = True,
+        publicar_a_cada: float = PUBLICAR_A_CADA) -> dict:
+    """
+    Executa uma extração de uma fonte e grava o catálogo dela.
+    `only` limita o processamento a essas pastas (nomes no repo) e `padroes`
+    a pastas cujo nome ou id casa com algum glob; as demais são mantidas
+    como estão no catálogo. `head` é o commit processado, registrado em
+    data/.cache/estado.json para execuções incrementais (só se
+    `registrar_head`: uma seleção parcial não representa o commit inteiro).
+    Cada pasta concluída vai para o journal; com `resume`, as pastas já
+    registradas por uma execução interrompida não são processadas de novo.
+    Com `dry_run` só imprime o plano (downloads e renders estimados).
+    As pastas são processadas por prioridade (destaques, sem preview,
+    alteradas) e o catálogo é publicado também no meio da execução: logo
+    depois dos destaques e a cada `publicar_a_cada` segundos (0: só no fim).
+    """
+    catalog_json = fonte["catalogo"]
+    journal_file = arquivo_da_fonte(JOURNAL_FILE, fonte)
 
-        # ✅ Processa todos os certificados
-        certificados = []
-        for p in sorted(pdf_files, key=lambda x: x["name"].lower()):
-            pdf_name = p["name"]
-            is_formacao = ("formação" in pdf_name.lower())
+    print(f"\n{'='*60}")
+    print(f"🔄 EXTRAÇÃO INCREMENTAL — {fonte['nome']} ({descricao_fonte(fonte)})")
+    print(f"{'='*60}\n")
+    
+    if dry_run:
+        # Só planeja: catálogo aberto para leitura (se existir), nada é gravado
+        conn = catalogo.conectar_leitura(arquivo_da_fonte(CATALOG_DB, fonte))
+        print(f"📊 Itens existentes: {catalogo_total(catalog_json)}")
+    else:
+        # Catálogo SQLite: reimporta o JSON se ele foi editado à mão
+        conn = catalogo.conectar(arquivo_da_fonte(CATALOG_DB, fonte))
+        catalogo.sincronizar_json(conn, catalog_json, fonte["previews"])
+        print(f"📊 Itens existentes: {catalogo.contar(conn)}")
+    
+    if caches is None:
+        caches = load_caches()
+    new_count = 0
+    updated_count = 0
+    skipped_count = 0
 
-            # Gera preview (só se não existir)
+    root = gh_contents("", fonte)
+    folders = [x for x in root if x.get("type") == "dir"]
+    if only is not None:
+        folders = [x for x in folders if x.get("name") in only]
+    if padroes:
+        ids = dict(conn.execute("SELECT nome, id FROM pastas WHERE nome IS NOT NULL")) if conn else {}
+        folders = [x for x in folders if pasta_casa(x["name"], ids.get(x["name"]), padroes)]
+    if only is not None or padroes:
+        print(f"🎯 Pastas selecionadas: {len(folders)}")
+
+    if dry_run:
+        plano = planejar(folders, caches, fonte)
+        if conn is not None:
+            conn.close()
+        return {"total": catalogo_total(catalog_json), "novos": 0, "atualizados": 0, "mantidos": 0,
+                "interrompido": False, "falhas": [], "plano": plano}
+
+    done = {}
+    if resume:
+        header, done = load_journal(journal_file)
+        print(f"⏯️  Retomando execução anterior: {len(done)} pasta(s) já concluída(s)")
+        if header.get("head") and head and header["head"] != head:
+            print(f"⚠️ O branch mudou desde a execução interrompida ({header['head'][:7]} → {head[:7]})")
+
+    pendentes = [x for x in folders if x["name"] not in done]
+    prioridade = prioridades(pendentes, conn, caches, prefetch_readmes(pendentes, caches, fonte))
+    destaques = sum(1 for p in prioridade.values() if p == PRIORIDADE_DESTAQUE)
+
+    ensure_dir(CACHE_DIR)
+    journal = open(journal_file, "a" if resume and done else "w", encoding="utf-8")
+    if not (resume and done):
+        journal_append(journal, {"head": head, "started": datetime.now().isoformat()})
+
+    interrompido = None
+    falhas = []
+    # Já concluídas no journal primeiro (só reaplicam o upsert), depois por prioridade
+    ordem = sorted(folders, key=lambda x: (prioridade.get(x["name"], -1), x.get("name", "").lower()))
+    inicio = publicado = time.monotonic()
+    destaques_prontos = not destaques
+    for n, folder in enumerate(ordem):
+        # Publicação progressiva: logo depois do último destaque e a cada publicar_a_cada segundos
+        p = prioridade.get(folder["name"])
+        if not destaques_prontos and p is not None and p != PRIORIDADE_DESTAQUE:
+            destaques_prontos = True
+            print(f"\n⭐ {destaques} destaque(s) pronto(s) em {time.monotonic() - inicio:.1f}s")
+            if publicar_a_cada:
+                publicar_parcial(conn, fonte, n, len(ordem))
+                publicado = time.monotonic()
+        elif publicar_a_cada and time.monotonic() - publicado >= publicar_a_cada:
+            publicar_parcial(conn, fonte, n, len(ordem))
+            publicado = time.monotonic()
+
+        if folder["name"] in done:
+            new_item = done[folder["name"]]
+            print(f"\n⏭️  {folder['name']}: já concluída no journal")
+        else:
             try:
-                out_png = preview_output_file(folder_id, pdf_name)
-                if not os.path.exists(out_png):
-                    pdf_bytes = download_bytes(p["download_url"], timeout=120)
-                    render_pdf_first_page_to_png(pdf_bytes, out_png, zoom=2.0, overwrite=False)
-                    print(f"  ✓ Preview criado: {pdf_name}")
-                else:
-                    print(f"  ↻ Preview existente: {pdf_name}")
-            except Exception as e:
-                print(f"  ⚠️ Falha gerando preview: {pdf_name} -> {e}")
-
-            certificados.append({
-                "nome": pdf_name,
-                "url": f"https://github.com/{OWNER}/{REPO}/blob/{BRANCH}/{quote(folder_path)}/{quote(pdf_name)}",
-                "preview": normalize_preview_path(folder_id, pdf_name),
-                "isFormacao": is_formacao
-            })
-
-        # ✅ Thumbnail automático
-        thumbnail = meta.get("thumbnail")
-        if not thumbnail and formacao_pdf:
-            thumbnail = normalize_preview_path(folder_id, formacao_pdf["name"])
-        elif not thumbnail and pdf_files:
-            thumbnail = normalize_preview_path(folder_id, pdf_files[0]["name"])
-        
-        if not thumbnail:
-            thumbnail = f"assets/img/certificados/{folder_id}-thumb.png"
-
-        # ✅ Usa valores do README ou infere/extrai do PDF
-        titulo = meta.get("titulo") or folder_name.replace("-", " ").title()
-        instituicao = meta.get("instituicao") or extracted_info.get("instituicao", "")
-        duracao = meta.get("duracao") or extracted_info.get("duracao", "")
-        categoria = meta.get("categoria") or infer_categoria_from_folder(folder_name)
-        
-        # ✅ Descrição padrão se não houver
-        if not descricao:
-            descricao = f"Certificação em {titulo}"
-            if instituicao:
-                descricao += f" pela {instituicao}"
-        
-        if not descricao_completa:
-            descricao_completa = descricao
-
-        # ✅ Cria novo item
-        new_item = {
-            "id": folder_id,
-            "titulo": titulo,
-            "tipo": meta.get("tipo", "Formação"),
-            "instituicao": instituicao,
-            "categoria": categoria,
-            "duracao": duracao,
-            "destaque": bool(meta.get("destaque", False)),
-            "thumbnail": thumbnail,
-            "competencias": meta.get("competencias", []) or [],
-            "descricao": descricao,
-            "descricaoCompleta": descricao_completa,
-            "certificados": certificados,
-            "totalCertificados": len(certificados),
-            "githubFolder": f"https://github.com/{OWNER}/{REPO}/tree/{BRANCH}/{quote(folder_path)}",
-            "status": "Concluído",
-            "ano": ano or "",
-        }
-
-        # ✅ Merge com dados existentes
+                aguardar_orcamento()
+            except OrcamentoEsgotado as e:
+                interrompido = e
+                break
+            try:
+                new_item = process_folder(folder, caches, fonte)
+            except FalhaNaPasta as e:
+                print(f"❌ Erro ao acessar {e}")
+                falhas.append(folder["name"])
+                continue
+            journal_append(journal, {"folder": folder["name"], "item": new_item})
+        if new_item is None:
+            continue
+
+        new_item = dict(new_item)
+        build = new_item.pop("_build", None)
+        folder_id = new_item["id"]
+        folder_name = folder["name"]
+        existing_item = catalogo.obter_item(conn, folder_id)
+
+        # ✅ Merge com dados existentes (upsert indexado no catálogo)
         if existing_item:
-            result_by_id[folder_id] = merge_certificate_data(existing_item, new_item)
+            merged = merge_certificate_data(existing_item, new_item)
             updated_count += 1
             print(f"  🔄 Atualizado: {folder_name}")
         else:
-            result_by_id[folder_id] = new_item
+            merged = new_item
             new_count += 1
             print(f"  ✅ Novo: {folder_name}")
+        with conn:
+            catalogo.upsert_item(conn, merged, build, fonte["previews"])
+
+    if not destaques_prontos and not interrompido:
+        print(f"\n⭐ {destaques} destaque(s) pronto(s) em {time.monotonic() - inicio:.1f}s")
+    save_caches(caches)
+
+    # Exporta o catálogo (itens não processados agora são mantidos como estão)
+    total = publicar(conn, fonte)
+    skipped_count = total - new_count - updated_count
+    conn.close()
+
+    journal.close()
+    if interrompido:
+        # O journal fica: o --resume continua de onde parou
+        print(f"\n⛔ Orçamento da API esgotado ({interrompido}); rode de novo com --resume")
+    elif falhas:
+        # O journal fica só com as concluídas: o --resume tenta de novo as que falharam
+        print(f"\n⚠️ {len(falhas)} pasta(s) com falha ({', '.join(falhas)}); rode de novo com --resume")
+    else:
+        # Compactação: o journal já está refletido no catálogo
+        os.remove(journal_file)
+        if head and registrar_head:
+            save_json_cache(arquivo_da_fonte("estado.json", fonte),
+                            {"commit": head, "updated": datetime.now().isoformat()})
 
-    # Preserva itens antigos que não foram processados agora
-    for old_id, old_item in existing_by_id.items():
-        if old_id not in result_by_id:
-            result_by_id[old_id] = old_item
-            skipped_count += 1
-
-    final_list = list(result_by_id.values())
-    
-    # Ordena por destaque e depois por título
-    final_list.sort(key=lambda x: (not x.get("destaque", False), x.get("titulo", "").lower()))
-    
-    with open(OUTPUT_JSON, "w", encoding="utf-8") as f:
-        json.dump(final_list, f, ensure_ascii=False, indent=2)
+    # HTML estático dos cards (só reescreve as páginas cujo catálogo mudou)
+    if prerender_html:
+        atualizar_site()
 
     print(f"\n{'='*60}")
-    print(f"✅ certificados.json atualizado!")
+    print(f"✅ {os.path.basename(catalog_json)} atualizado!")
     print(f"📊 Estatísticas:")
-    print(f"   • Total: {len(final_list)} certificados")
+    print(f"   • Total: {total} itens")
     print(f"   • Novos: {new_count}")
     print(f"   • Atualizados: {updated_count}")
     print(f"   • Mantidos: {skipped_count}")
-    print(f"📁 Previews em: {ASSETS_PREVIEW_ROOT}")
+    print(f"📁 Previews em: {os.path.join(SITE_ROOT, fonte['previews'])}")
     print(f"{'='*60}\n")
 
+    return {
+        "total": total,
+        "novos": new_count,
+        "atualizados": updated_count,
+        "mantidos": skipped_count,
+        "interrompido": bool(interrompido),
+        "falhas": falhas,
+    }
+
+
+def get_head(fonte: dict) -> str | None:
+    """Commit atual da fonte (clone local, se configurado, ou API)."""
+    try:
+        if fonte.get("local_repo"):
+            return get_local_head(fonte["local_repo"], fonte)
+        return get_branch_head(fonte=fonte)[0]
+    except Exception:
+        return None
+
+
+def atualizar_site():
+    """Depois de exportar: cards pré-renderizados e manifesto de assets (hash de conteúdo)."""
+    prerender.prerender()
+    manifesto.atualizar(
+        os.path.join(SITE_ROOT, "data", "manifesto.json"),
+        os.path.join(CACHE_DIR, "manifesto.json"),
+        SITE_ROOT,
+    )
+
+
+def run_all(fontes: list, resume: bool = False, padroes: list | None = None, since: str | None = None,
+            dry_run: bool = False, publicar_a_cada: float = PUBLICAR_A_CADA) -> dict:
+    """
+    Processa várias fontes numa execução só: sessão HTTP, caches, cache de
+    downloads, pool de render e orçamento de rate limit são compartilhados.
+
+    Seleção: `padroes` (globs de nome/id de pasta) e/ou `since` (pastas
+    alteradas desde esse commit; "" = desde o último commit construído).
+    """
+    caches = load_caches()
+    stats = {}
+    for fonte in fontes:
+        head = get_head(fonte)
+        only, registrar_head = None, not padroes
+        if since is not None:
+            ultimo = load_json_cache(arquivo_da_fonte("estado.json", fonte)).get("commit")
+            base = since or ultimo
+            if not base or not head:
+                print(f"❌ {fonte['nome']}: sem {'commit de build anterior' if not base else 'head do branch'} para o --since")
+                continue
+            only = changed_folders(base, head, fonte.get("local_repo"), fonte)
+            if only is None:
+                print(f"❌ {fonte['nome']}: não foi possível listar as mudanças {base[:7]}..{head[:7]}; "
+                      f"rode sem --since")
+                continue
+            print(f"🔀 {fonte['nome']}: {len(only)} pasta(s) alterada(s) em {base[:7]}..{head[:7]}")
+            # Só o delta a partir do último build representa o commit inteiro
+            registrar_head = registrar_head and base == ultimo
+
+        stats[fonte["nome"]] = run(only=only, head=head, caches=caches, resume=resume, fonte=fonte,
+                                   prerender_html=False, padroes=padroes, dry_run=dry_run,
+                                   registrar_head=registrar_head, publicar_a_cada=publicar_a_cada)
+        if stats[fonte["nome"]]["interrompido"]:
+            break  # sem orçamento: as próximas fontes ficam para a próxima execução
+
+    if dry_run:
+        return stats
+    atualizar_site()
+
+    if len(fontes) > 1:
+        print(f"🧾 {len(stats)}/{len(fontes)} fonte(s) processada(s)")
+    ocr = resumo_ocr()
+    if ocr:
+        print(ocr)
+    restante = RATE_LIMIT["restante"]
+    print(f"🌐 Chamadas HTTP: {RATE_LIMIT['chamadas']}"
+          f"{f' (rate limit restante: {restante})' if restante is not None else ''}")
+    return stats
+
+
+# =========================
+# REAPLICAÇÃO DAS REGRAS (só texto em cache)
+# =========================
+def reextrair(fonte: dict = FONTE_PADRAO) -> dict:
+    """
+    Reaplica extract_info_from_text sobre o texto em cache de cada pasta, sem
+    baixar nem abrir PDFs. Só troca os campos que a origem registrada no
+    build marca como vindos do PDF: valores do README continuam valendo.
+    Pasta sem origem registrada (catálogo anterior) só tem os campos vazios
+    preenchidos.
+    """
+    inicio = time.perf_counter()
+    conn = catalogo.conectar(arquivo_da_fonte(CATALOG_DB, fonte))
+    catalogo.sincronizar_json(conn, fonte["catalogo"], fonte["previews"])
+
+    linhas = conn.execute("SELECT id, item, extracao, texto_sha, origens FROM pastas").fetchall()
+    cache = textos.obter_varios(textos_conn(), (row[3] for row in linhas), TEXTO_VERSAO)
+    # PDFs sem camada de texto: vale o OCR em cache, se houver
+    ocr = textos.obter_varios(textos_conn(), (sha for sha, p in cache.items() if not "".join(p).strip()), OCR_VERSAO)
+
+    alterados, sem_texto = 0, 0
+    with conn:
+        for item_id, item_json, extracao_json, texto_sha, origens_json in linhas:
+            paginas = ocr.get(texto_sha) or cache.get(texto_sha)
+            if paginas is None:
+                sem_texto += 1
+                continue
+            antigo = json.loads(extracao_json) if extracao_json else {}
+            novo = extract_info_from_text(" ".join(paginas))
+            item = json.loads(item_json)
+            origens = json.loads(origens_json) if origens_json else {}
+
+            mudou = novo != antigo
+            for campo in CAMPOS_EXTRAIDOS:
+                atual = str(item.get(campo) or "")
+                do_pdf = origens.get(campo) == "pdf" or (campo not in origens and not atual)
+                if do_pdf and atual != novo.get(campo, ""):
+                    item[campo] = novo.get(campo, "")
+                    mudou = True
+            if mudou:
+                catalogo.atualizar_extracao(conn, item, novo)
+                alterados += 1
+
+    if alterados:
+        catalogo.exportar_json(conn, fonte["catalogo"])
+    conn.close()
+    if alterados:  # ano/duração/instituição mexem nas facetas
+        facetas.atualizar(
+            fonte["catalogo"],
+            arquivo_da_fonte(os.path.join(os.path.dirname(fonte["catalogo"]), "facetas.json"), fonte),
+            arquivo_da_fonte(os.path.join(CACHE_DIR, "facetas.json"), fonte),
+        )
+
+    dt = time.perf_counter() - inicio
+    print(f"🔁 Regras reaplicadas em {len(linhas) - sem_texto} pasta(s) ({dt * 1000:.0f} ms): "
+          f"{alterados} alterada(s), {sem_texto} sem texto em cache")
+    return {"pastas": len(linhas), "alteradas": alterados, "sem_texto": sem_texto, "segundos": dt}
+
+
+# =========================
+# PIRÂMIDES DE ZOOM PROFUNDO
+# =========================
+def raw_url(blob_url: str) -> str:
+    """URL de download de um arquivo a partir do link /blob/ do GitHub."""
+    return blob_url.replace("https://github.com/", "https://raw.githubusercontent.com/", 1).replace("/blob/", "/", 1)
+
+
+def pdf_de_referencia(certs: list, texto_sha: str | None) -> tuple | None:
+    """(nome, sha, url) do PDF de onde saiu o texto (ou o de formação, ou o primeiro)."""
+    certs = sorted(certs, key=lambda c: c[0].lower())
+    ref = (
+        next((c for c in certs if texto_sha and c[1] == texto_sha), None)
+        or next((c for c in certs if c[3]), None)
+        or (certs[0] if certs else None)
+    )
+    return ref[:3] if ref and ref[1] and ref[2] else None
+
+
+def gerar_zoom(fonte: dict = FONTE_PADRAO, todas_paginas: bool = False) -> dict:
+    """
+    Gera as pirâmides de zoom que faltam (PDF de referência de cada pasta) e
+    liga o descritor no item. PDFs já com pirâmide não são nem baixados.
+    """
+    inicio = time.perf_counter()
+    conn = catalogo.conectar(arquivo_da_fonte(CATALOG_DB, fonte))
+    catalogo.sincronizar_json(conn, fonte["catalogo"], fonte["previews"])
+
+    certs = {}
+    for pasta_id, nome, blob_sha, url, is_formacao in conn.execute(
+        "SELECT pasta_id, nome, blob_sha, url, is_formacao FROM certificados"
+    ):
+        certs.setdefault(pasta_id, []).append((nome, blob_sha, url, is_formacao))
+
+    referencias, gerados = {}, 0
+    for item_id, texto_sha in conn.execute("SELECT id, texto_sha FROM pastas").fetchall():
+        ref = pdf_de_referencia(certs.get(item_id, []), texto_sha)
+        if ref is None:
+            continue
+        nome, sha, url = ref
+        destino = piramides.destino_da_piramide(sha, SITE_ROOT)
+        referencias[item_id] = (sha, destino)
+        if piramides.pronta(destino, todas_paginas) or destino in RENDER["pendentes"]:
+            continue
+        try:
+            pdf_bytes = download_pdf({"name": nome, "sha": sha, "download_url": raw_url(url)})
+        except Exception as e:
+            print(f"  ⚠️ Falha baixando {nome}: {e}")
+            continue
+        print(f"  🔍 Pirâmide: {nome}")
+        gerados += 1
+        if RENDER_WORKERS > 1:
+            RENDER["pendentes"][destino] = render_pool().submit(piramides.gerar, pdf_bytes, destino, todas_paginas)
+        else:
+            try:
+                piramides.gerar(pdf_bytes, destino, todas_paginas)
+            except Exception as e:
+                print(f"  ⚠️ Falha gerando a pirâmide de {nome}: {e}")
+    aguardar_renders(destino for _, destino in referencias.values())
+
+    alterados = 0
+    with conn:
+        for item_id, (sha, destino) in referencias.items():
+            item = catalogo.obter_item(conn, item_id)
+            zoom = piramides.descritor_rel(sha) if piramides.pronta(destino) else ""
+            if item.get("zoom", "") != zoom:
+                item["zoom"] = zoom
+                catalogo.atualizar_item(conn, item)
+                alterados += 1
+    if alterados:
+        catalogo.exportar_json(conn, fonte["catalogo"])
+    conn.close()
+
+    dt = time.perf_counter() - inicio
+    print(f"🔍 Zoom profundo: {gerados} pirâmide(s) gerada(s), {alterados} item(ns) atualizado(s) em {dt:.1f}s")
+    return {"geradas": gerados, "alterados": alterados, "segundos": dt}
+
+
+# =========================
+# MODO WATCH
+# =========================
+def get_branch_head(etag: str | None = None, fonte: dict = FONTE_PADRAO) -> tuple:
+    """
+    Consulta o commit do branch com requisição condicional.
+    Retorna (sha, etag); sha é None quando o servidor responde 304 (sem mudança),
+    o que não consome o rate limit da API.
+    """
+    url = f"{API_BASE}/repos/{fonte['owner']}/{fonte['repo']}/git/ref/heads/{quote(fonte['branch'])}"
+    r = SESSION.get(url, headers={"If-None-Match": etag} if etag else {}, timeout=30)
+    if r.status_code == 304:
+        return None, etag
+    r.raise_for_status()
+    return r.json()["object"]["sha"], r.headers.get("ETag")
+
+
+def get_local_head(repo_dir: str, fonte: dict = FONTE_PADRAO) -> str:
+    """Commit do branch em um clone local (sem nenhuma chamada de rede)."""
+    out = subprocess.run(
+        ["git", "-C", repo_dir, "rev-parse", f"refs/heads/{fonte['branch']}"],
+        capture_output=True, text=True, check=True,
+    )
+    return out.stdout.strip()
+
+
+def folders_from_paths(paths) -> set:
+    """Converte caminhos alterados ("Pasta/arquivo.pdf") nos nomes das pastas de topo."""
+    return {p.split("/", 1)[0] for p in paths if p and "/" in p}
+
+
+def changed_folders(base: str, head: str, local_repo: str | None = None,
+                    fonte: dict = FONTE_PADRAO) -> set | None:
+    """
+    Pastas alteradas entre dois commits, via `git diff` local ou Compare API.
+    Retorna None quando não dá para saber (força uma execução completa).
+    """
+    try:
+        if local_repo:
+            out = subprocess.run(
+                ["git", "-C", local_repo, "diff", "--name-only", base, head],
+                capture_output=True, text=True, check=True,
+            )
+            return folders_from_paths(out.stdout.splitlines())
+
+        url = f"{API_BASE}/repos/{fonte['owner']}/{fonte['repo']}/compare/{base}...{head}"
+        r = SESSION.get(url, timeout=60)
+        r.raise_for_status()
+        files = r.json().get("files", [])
+        if len(files) >= 300:
+            return None  # a Compare API trunca a lista em 300 arquivos
+        paths = [f.get("filename") for f in files] + [f.get("previous_filename") for f in files]
+        return folders_from_paths(paths)
+    except Exception as e:
+        print(f"⚠️ Não foi possível calcular o delta ({e}); execução completa")
+        return None
+
+
+def watch(interval: float = 60, debounce: float = 30, fontes: list | None = None):
+    """
+    Fica observando os branches e reconstrói só as pastas alteradas a cada push.
+    Caches e a sessão HTTP ficam quentes entre as iterações; rajadas de pushes
+    são agrupadas esperando o head ficar estável por `debounce` segundos.
+    """
+    fontes = fontes or [FONTE_PADRAO]
+    estado = {
+        f["nome"]: {"last": load_json_cache(arquivo_da_fonte("estado.json", f)).get("commit"), "etag": None}
+        for f in fontes
+    }
+
+    def poll(fonte):
+        if fonte.get("local_repo"):
+            return get_local_head(fonte["local_repo"], fonte)
+        st = estado[fonte["nome"]]
+        head, st["etag"] = get_branch_head(st["etag"], fonte)
+        return head
+
+    caches = load_caches()
+    print(f"👀 Observando {', '.join(descricao_fonte(f) for f in fontes)} "
+          f"(intervalo {interval}s, debounce {debounce}s)")
+
+    while True:
+        for fonte in fontes:
+            st = estado[fonte["nome"]]
+            try:
+                head = poll(fonte)
+                if head and head != st["last"]:
+                    # Debounce: espera o head parar de mudar antes de reconstruir
+                    while True:
+                        time.sleep(debounce)
+                        newer = poll(fonte)
+                        if not newer or newer == head:
+                            break
+                        head = newer
+
+                    only = changed_folders(st["last"], head, fonte.get("local_repo"), fonte) if st["last"] else None
+                    if only is not None and not only:
+                        print(f"↻ {fonte['nome']} {head[:7]}: nenhuma pasta alterada")
+                        save_json_cache(arquivo_da_fonte("estado.json", fonte),
+                                        {"commit": head, "updated": datetime.now().isoformat()})
+                    else:
+                        if run(only=only, caches=caches, head=head, fonte=fonte)["falhas"]:
+                            continue  # head não conta como construído: o próximo ciclo tenta de novo
+                    st["last"] = head
+            except Exception as e:
+                print(f"⚠️ Erro no ciclo de observação ({fonte['nome']}): {e}")
+        time.sleep(interval)
+
+
+# =========================
+# MAIN
+# =========================
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Extração incremental de certificados")
+    parser.add_argument("--fonte", action="append", help="processa só esta fonte de fontes.json (pode repetir)")
+    parser.add_argument("--watch", action="store_true", help="fica observando o branch e reconstrói a cada push")
+    parser.add_argument("--interval", type=float, default=60, help="segundos entre consultas ao branch (--watch)")
+    parser.add_argument("--debounce", type=float, default=30, help="segundos de head estável antes de reconstruir (--watch)")
+    parser.add_argument("--local-repo", help="clone local do repo da fonte para detectar mudanças sem API (uma fonte só)")
+    parser.add_argument("--resume", action="store_true", help="retoma a última execução interrompida a partir do journal")
+    parser.add_argument("--reextrair", action="store_true",
+                        help="só reaplica as regras de campos sobre o texto em cache (sem rede, sem PDFs)")
+    parser.add_argument("--only", action="append", metavar="PASTA",
+                        help="processa só as pastas cujo nome ou id casa com o glob (pode repetir)")
+    parser.add_argument("--since", nargs="?", const="", metavar="COMMIT",
+                        help="processa só as pastas alteradas desde o COMMIT (sem valor: desde o último build)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="só mostra o plano (pastas, downloads e renders estimados), sem gravar nada")
+    parser.add_argument("--publicar-a-cada", type=float, default=PUBLICAR_A_CADA, metavar="SEG",
+                        help="publica o catálogo parcial a cada SEG segundos e logo após os destaques (0: só no fim)")
+    parser.add_argument("--sem-ocr", action="store_true",
+                        help="não passa OCR (Tesseract) nos PDFs sem camada de texto")
+    parser.add_argument("--sem-graphql", action="store_true",
+                        help="baixa o README de cada pasta pela REST, sem a consulta GraphQL em lote")
+    parser.add_argument("--zoom", action="store_true",
+                        help="gera as pirâmides de zoom profundo que faltam (PDF de referência de cada pasta)")
+    parser.add_argument("--zoom-todas-paginas", action="store_true",
+                        help="com --zoom, inclui todas as páginas de PDFs com várias páginas (históricos)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        fontes = carregar_fontes(args.fonte)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    if args.local_repo:
+        if len(fontes) != 1:
+            print("❌ --local-repo vale para uma fonte só; use --fonte ou 'local_repo' no fontes.json")
+            return 1
+        fontes[0]["local_repo"] = args.local_repo
+    if args.sem_graphql:
+        for fonte in fontes:
+            fonte["graphql"] = False
+    if args.sem_ocr:
+        OCR["ativo"] = False
+
+    if args.reextrair:
+        for fonte in fontes:
+            reextrair(fonte)
+        atualizar_site()
+        return 0
+
+    if args.zoom:
+        try:
+            for fonte in fontes:
+                gerar_zoom(fonte, args.zoom_todas_paginas)
+        finally:
+            encerrar_render_pool()
+        atualizar_site()  # descritores novos no catálogo: cards e manifesto acompanham
+        return 0
+
+    try:
+        if args.watch:
+            try:
+                watch(args.interval, args.debounce, fontes)
+            except KeyboardInterrupt:
+                print("\n👋 Observação encerrada")
+        else:
+            run_all(fontes, resume=args.resume, padroes=args.only, since=args.since, dry_run=args.dry_run,
+                    publicar_a_cada=args.publicar_a_cada)
+    finally:
+        encerrar_render_pool()
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Facetas, estatísticas e ordenações do catálogo (pré-calculadas)
+================================================================
+
+Gera data/facetas.json a partir do certificados.json, para a página montar
+os chips de filtro e as estatísticas sem varrer o catálogo inteiro:
+
+- totais (itens, destaques, horas somadas a partir de `duracao`);
+- contagens por categoria, instituição e ano;
+- ordenações prontas (listas de ids): destaques, mais recentes por `ano`
+  e cada categoria na ordem do catálogo (destaque, título).
+
+Incremental: data/.cache/facetas.json guarda um resumo por item (só os
+campos usados aqui). Numa nova execução só os itens cujo resumo mudou (ou
+que sumiram/entraram) são descontados/somados nas contagens e
+removidos/reinseridos (bisect) nas ordenações.
+
+Uso:
+    python data/facetas.py               # atualiza data/facetas.json
+    python data/facetas.py --completo    # ignora o estado e recalcula tudo
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+from bisect import insort
+
+from comum import carregar_json, salvar_json
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.join(SCRIPT_DIR, "certificados.json")
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, "facetas.json")
+ESTADO_FILE = os.path.join(SCRIPT_DIR, ".cache", "facetas.json")
+
+# Sobe ao mudar o resumo, as contagens ou as ordenações: invalida o estado
+VERSAO = 1
+
+SEM_CATEGORIA = "Sem Categoria"  # mesmo rótulo do generateDynamicFilters (main.js)
+
+_HORAS_RE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(?:horas?|hrs?|h)\b", re.I)
+_MINUTOS_RE = re.compile(r"(\d+)\s*(?:minutos?|min)\b", re.I)
+_ANO_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+# =========================
+# RESUMO POR ITEM
+# =========================
+def parse_horas(duracao) -> float:
+    """Horas de um texto de duração ("40 horas", "86h", "1h30min"); 0 se não der."""
+    texto = str(duracao or "")
+    horas = sum(float(h.replace(",", ".")) for h in _HORAS_RE.findall(texto))
+    horas += sum(int(m) for m in _MINUTOS_RE.findall(texto)) / 60
+    return horas
+
+
+def parse_ano(ano) -> int:
+    """Ano mais recente citado ("2023 - 2025" -> 2025); 0 se não houver."""
+    anos = _ANO_RE.findall(str(ano or ""))
+    return max(map(int, anos)) if anos else 0
+
+
+def resumo(item: dict) -> dict:
+    return {
+        "titulo": item.get("titulo", ""),
+        "categoria": item.get("categoria") or SEM_CATEGORIA,
+        "instituicao": item.get("instituicao") or "",
+        "ano": parse_ano(item.get("ano")),
+        "horas": parse_horas(item.get("duracao")),
+        "destaque": bool(item.get("destaque")),
+    }
+
+
+# Chaves das ordenações (a do catálogo é a mesma de catalogo.ordenar)
+def chave_catalogo(r: dict) -> tuple:
+    return (not r["destaque"], r["titulo"].lower())
+
+
+def chave_recentes(r: dict) -> tuple:
+    return (-r["ano"], r["titulo"].lower())
+
+
+# =========================
+# CONTAGENS E ORDENAÇÕES
+# =========================
+def vazio() -> dict:
+    return {
+        "total": 0,
+        "destaques": 0,
+        "horas": 0.0,
+        "categorias": {},
+        "instituicoes": {},
+        "anos": {},
+        "ordens": {"destaques": [], "recentes": [], "categorias": {}},
+    }
+
+
+def contar(contagem: dict, chave, delta: int):
+    if chave in ("", 0, None):
+        return
+    chave = str(chave)
+    contagem[chave] = contagem.get(chave, 0) + delta
+    if contagem[chave] <= 0:
+        del contagem[chave]
+
+
+def somar(facetas: dict, r: dict, sinal: int):
+    """Soma (sinal=1) ou desconta (sinal=-1) um item nos totais e contagens."""
+    facetas["total"] += sinal
+    facetas["destaques"] += sinal * r["destaque"]
+    facetas["horas"] += sinal * r["horas"]
+    contar(facetas["categorias"], r["categoria"], sinal)
+    contar(facetas["instituicoes"], r["instituicao"], sinal)
+    contar(facetas["anos"], r["ano"], sinal)
+
+
+def listas_do_item(facetas: dict, r: dict) -> list:
+    """(lista de ids, chave) das ordenações em que o item aparece."""
+    ordens = facetas["ordens"]
+    listas = [(ordens["recentes"], chave_recentes)]
+    listas.append((ordens["categorias"].setdefault(r["categoria"], []), chave_catalogo))
+    if r["destaque"]:
+        listas.append((ordens["destaques"], chave_catalogo))
+    return listas
+
+
+def aplicar_delta(facetas: dict, resumos: dict, antigos: dict, novos: dict):
+    """
+    Aplica a diferença entre dois conjuntos de resumos: `antigos` saem,
+    `novos` entram. `resumos` ({id: resumo}) já deve refletir o estado novo,
+    que é de onde saem as chaves para as inserções.
+    """
+    for item_id, r in antigos.items():
+        somar(facetas, r, -1)
+        for lista, _ in listas_do_item(facetas, r):
+            lista.remove(item_id)
+
+    for item_id, r in novos.items():
+        somar(facetas, r, 1)
+        for lista, chave in listas_do_item(facetas, r):
+            insort(lista, item_id, key=lambda i, c=chave: (c(resumos[i]), i))
+
+    # Categorias que ficaram vazias saem das ordenações
+    cats = facetas["ordens"]["categorias"]
+    for cat in [c for c, ids in cats.items() if not ids]:
+        del cats[cat]
+
+
+def publicar(facetas: dict) -> dict:
+    """Versão do documento para o site: chaves ordenadas, horas arredondadas."""
+    ordens = facetas["ordens"]
+    return {
+        "total": facetas["total"],
+        "destaques": facetas["destaques"],
+        "horas": round(facetas["horas"], 1),
+        "categorias": dict(sorted(facetas["categorias"].items())),
+        "instituicoes": dict(sorted(facetas["instituicoes"].items())),
+        "anos": dict(sorted(facetas["anos"].items(), reverse=True)),
+        "ordens": {
+            "destaques": ordens["destaques"],
+            "recentes": ordens["recentes"],
+            "categorias": dict(sorted(ordens["categorias"].items())),
+        },
+    }
+
+
+# =========================
+# CÁLCULO (COMPLETO / INCREMENTAL)
+# =========================
+def calcular(itens: list, estado: dict | None = None, completo: bool = False) -> tuple:
+    """Retorna (novo estado, ids alterados). Estado = {versao, resumos, facetas}."""
+    resumos = {it["id"]: resumo(it) for it in itens if it.get("id")}
+
+    if completo or not estado or estado.get("versao") != VERSAO:
+        facetas = vazio()
+        aplicar_delta(facetas, resumos, {}, resumos)
+        return {"versao": VERSAO, "resumos": resumos, "facetas": facetas}, len(resumos)
+
+    anteriores = estado["resumos"]
+    antigos = {i: r for i, r in anteriores.items() if resumos.get(i) != r}
+    novos = {i: r for i, r in resumos.items() if anteriores.get(i) != r}
+    facetas = estado["facetas"]
+    aplicar_delta(facetas, resumos, antigos, novos)
+    return {"versao": VERSAO, "resumos": resumos, "facetas": facetas}, len(antigos.keys() | novos.keys())
+
+
+# =========================
+# ARQUIVOS
+# =========================
+def atualizar(catalogo: str = CATALOG_FILE, saida: str = OUTPUT_FILE, estado_path: str = ESTADO_FILE,
+              completo: bool = False) -> int:
+    """Atualiza o arquivo de facetas de um catálogo. Retorna quantos itens mudaram."""
+    inicio = time.perf_counter()
+    itens = carregar_json(catalogo) or []
+
+    estado, alterados = calcular(itens, carregar_json(estado_path), completo)
+    if alterados:
+        salvar_json(estado_path, estado)
+
+    documento = publicar(estado["facetas"])
+    mudou = carregar_json(saida) != documento
+    if mudou:
+        salvar_json(saida, documento, indent=2)
+
+    dt = time.perf_counter() - inicio
+    print(f"🏷️  Facetas: {alterados}/{len(itens)} item(ns) aplicado(s) em {dt * 1000:.0f} ms"
+          + ("" if mudou else " (sem mudanças)"))
+    return alterados
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-calcula facetas, estatísticas e ordenações do catálogo")
+    parser.add_argument("--catalogo", default=CATALOG_FILE)
+    parser.add_argument("--saida", default=OUTPUT_FILE)
+    parser.add_argument("--completo", action="store_true", help="ignora o estado e recalcula tudo")
+    args = parser.parse_args(argv)
+
+    atualizar(args.catalogo, args.saida, completo=args.completo)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Manifesto de assets com hash de conteúdo (+ lista de precache)
+===============================================================
+
+Gera data/manifesto.json com:
+- "arquivos": caminho lógico -> URL com impressão digital do conteúdo
+  ("data/certificados.json" -> "data/certificados.json?v=3f2a9c1b7d04");
+- "precache": URLs que o service worker (sw.js) baixa na instalação;
+- "versao": hash do manifesto inteiro (muda quando qualquer arquivo muda).
+
+Cobre os artefatos gerados pelo build: catálogos e derivados em data/,
+previews, thumbnails e imagens otimizadas em assets/img/, CSS e JS.
+Só os bundles de assets/build/ (data/empacotar.py) entram sem hash extra:
+o nome deles já é o hash do conteúdo. Previews em _conteudo/ levam ?v= como
+o resto: o nome é o SHA do PDF, não do PNG, e o PNG pode ser re-renderizado
+ou recomprimido (data/otimizar_imagens.py) com o mesmo nome.
+
+A impressão digital vai na query (?v=): o site é estático e servido direto
+do repositório, então não duplicamos cada imagem com outro nome. O sw.js
+guarda cada URL versionada para sempre e só baixa as que mudaram; os
+catálogos data/*.json ele busca primeiro na rede, e o --check falha se o
+hash de qualquer arquivo (catálogos inclusive) diverge do manifesto.
+
+Incremental: data/.cache/manifesto.json guarda tamanho+mtime+hash de cada
+arquivo; só quem mudou de tamanho/mtime é lido e hasheado de novo.
+
+Uso:
+    python data/manifesto.py            # atualiza data/manifesto.json
+    python data/manifesto.py --check    # só verifica (exit 1 se desatualizado)
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+from fnmatch import fnmatch
+
+from comum import carregar_json, hash_arquivo, salvar_json
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, "manifesto.json")
+ESTADO_FILE = os.path.join(SCRIPT_DIR, ".cache", "manifesto.json")
+
+TAMANHO_HASH = 12
+
+# (pasta relativa ao site, padrões) dos artefatos versionados
+ARTEFATOS = [
+    ("data", ["certificados.json", "diplomas.json", "projetos.json", "relacionados.json", "facetas.json"]),
+    ("assets/img", ["*.png", "*.jpg", "*.jpeg", "*.webp", "*.avif", "*.svg", "*.gif"]),
+    ("assets/css", ["*.css"]),
+    ("assets/js", ["*.js"]),
+    ("assets/build", ["*.js", "*.css"]),
+]
+
+# Precache do service worker: só o "shell" que as páginas usam logo de cara
+# (CSS e bundles de assets/build/, catálogos). Imagens entram no cache na
+# primeira vez que forem pedidas. Padrões casam segmento a segmento: o `*`
+# não atravessa "/" (assets/build/* não pega assets/build/x/y.js).
+PRECACHE = [
+    "data/*.json",
+    "assets/build/*",
+]
+
+PASTA_BUILD = "assets/build/"  # bundles com o hash no nome (<pagina>.<hash>.js)
+
+
+# =========================
+# VARREDURA E HASH
+# =========================
+def listar_artefatos(site_root: str = SITE_ROOT):
+    """Gera (caminho relativo, os.stat) de cada artefato versionado."""
+    for pasta, padroes in ARTEFATOS:
+        base = os.path.join(site_root, pasta)
+        for raiz, dirs, arquivos in os.walk(base):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))  # data/.cache etc.
+            for nome in sorted(arquivos):
+                if any(fnmatch(nome, p) for p in padroes):
+                    path = os.path.join(raiz, nome)
+                    yield os.path.relpath(path, site_root).replace(os.sep, "/"), os.stat(path)
+
+
+def casa_padrao(rel: str, padrao: str) -> bool:
+    """fnmatch por segmento de caminho: mesmo número de partes, cada uma casando."""
+    partes, padroes = rel.split("/"), padrao.split("/")
+    return len(partes) == len(padroes) and all(fnmatch(a, p) for a, p in zip(partes, padroes))
+
+
+def nome_tem_hash(rel: str) -> bool:
+    return rel.startswith(PASTA_BUILD)
+
+
+def url_versionada(rel: str, digest: str) -> str:
+    if nome_tem_hash(rel):
+        return rel  # o nome já é o hash do conteúdo
+    return f"{rel}?v={digest}"
+
+
+def calcular(estado: dict | None, site_root: str = SITE_ROOT) -> tuple:
+    """(novo estado {rel: {size, mtime, hash}}, arquivos re-hasheados)."""
+    estado = estado or {}
+    novo, rehash = {}, 0
+    for rel, st in listar_artefatos(site_root):
+        anterior = estado.get(rel)
+        # "conteudo": o hash veio dos bytes (estado antigo sem o campo é refeito)
+        if anterior and (anterior["size"], anterior["mtime"]) == (st.st_size, st.st_mtime_ns) \
+                and anterior.get("conteudo") == (not nome_tem_hash(rel)):
+            novo[rel] = anterior
+            continue
+        if nome_tem_hash(rel):
+            digest = os.path.splitext(os.path.basename(rel))[0].rsplit(".", 1)[-1][:TAMANHO_HASH]
+        else:
+            digest = hash_arquivo(os.path.join(site_root, rel), "sha1")[:TAMANHO_HASH]
+            rehash += 1
+        novo[rel] = {"size": st.st_size, "mtime": st.st_mtime_ns, "hash": digest,
+                     "conteudo": not nome_tem_hash(rel)}
+    return novo, rehash
+
+
+def montar_manifesto(estado: dict) -> dict:
+    arquivos = {rel: url_versionada(rel, e["hash"]) for rel, e in sorted(estado.items())}
+    precache = [url for rel, url in arquivos.items() if any(casa_padrao(rel, p) for p in PRECACHE)]
+    versao = hashlib.sha1(json.dumps(arquivos, sort_keys=True).encode("utf-8")).hexdigest()[:TAMANHO_HASH]
+    return {"versao": versao, "arquivos": arquivos, "precache": precache}
+
+
+# =========================
+# ARQUIVOS
+# =========================
+def atualizar(saida: str = OUTPUT_FILE, estado_path: str = ESTADO_FILE, site_root: str = SITE_ROOT,
+              check: bool = False, completo: bool = False) -> bool:
+    """
+    Atualiza (ou só confere, com check) o manifesto; `completo` ignora o
+    estado incremental e re-hasheia tudo. Retorna se estava desatualizado.
+    """
+    inicio = time.perf_counter()
+    estado, rehash = calcular(None if completo else carregar_json(estado_path), site_root)
+    if not check:  # a verificação não grava nada, nem o estado incremental
+        salvar_json(estado_path, estado)
+
+    manifesto = montar_manifesto(estado)
+    desatualizado = carregar_json(saida) != manifesto
+    if desatualizado and not check:
+        salvar_json(saida, manifesto, indent=2)
+
+    dt = time.perf_counter() - inicio
+    situacao = "sem mudanças" if not desatualizado else ("desatualizado" if check else f"versão {manifesto['versao']}")
+    print(f"🧾 Manifesto: {len(manifesto['arquivos'])} arquivo(s), {len(manifesto['precache'])} no precache, "
+          f"{rehash} re-hasheado(s) em {dt * 1000:.0f} ms ({situacao})")
+    return desatualizado
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera o manifesto de assets com hash de conteúdo")
+    parser.add_argument("--check", action="store_true", help="só verifica; exit 1 se o manifesto estiver desatualizado")
+    parser.add_argument("--completo", action="store_true", help="ignora o estado e re-hasheia tudo")
+    args = parser.parse_args(argv)
+
+    desatualizado = atualizar(check=args.check, completo=args.completo)
+    return 1 if args.check and desatualizado else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
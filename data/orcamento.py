@@ -0,0 +1,277 @@
+"""
+Orçamento de peso das páginas
+=============================
+
+Soma o que cada página do site baixa na primeira visita e compara com os
+limites de data/orcamento.json. Roda só sobre a árvore local (sem servidor):
+
+- assets citados no HTML: <link rel="stylesheet|icon|preload">, <script src>
+  e <img>/<source> que não sejam loading="lazy";
+- url(...) locais dos CSS carregados (fundos, fontes) cujo seletor cita
+  alguma classe/id presente na página — as variantes de @media entram
+  todas, então o número é um teto;
+- os JSON de catálogo que o main.js busca naquela página ("dados" no config);
+- as imagens dos primeiros cards de cada grid (a "primeira dobra"), escolhidas
+  pelos mesmos templates do prerender.py a partir do catálogo.
+
+Transferência: "bruto" é o tamanho do arquivo; "gzip" estima o que vai pela
+rede (texto comprimido com gzip nível 6, imagens como estão).
+
+Limites por página (KB): "gzip" e "bruto" (totais), "js", "css", "dados",
+"imagens", "html" (transferência por tipo) e "asset" (maior arquivo, bruto).
+
+Uso:
+    python data/orcamento.py                    # todas as páginas (exit 1 se estourar)
+    python data/orcamento.py --pagina index.html
+    python data/orcamento.py --resumo           # só os totais
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import argparse
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlsplit
+
+import prerender
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+CONFIG_FILE = os.path.join(SCRIPT_DIR, "orcamento.json")
+
+# Tipos que o servidor comprime; o resto (imagens) vai como está
+COMPRIMIVEIS = {".html", ".css", ".js", ".json", ".svg", ".txt", ".xml"}
+REL_CARREGADOS = {"stylesheet", "icon", "preload", "modulepreload", "apple-touch-icon"}
+
+_CSS_URL_RE = re.compile(r"""url\(\s*['"]?([^'")]+?)['"]?\s*\)""")
+_IMG_SRC_RE = re.compile(r"""<img\b[^>]*?\bsrc="([^"]+)\"""")
+_SELETOR_NOME_RE = re.compile(r"([.#])([\w-]+)")
+
+
+# =========================
+# ASSETS DO HTML
+# =========================
+class _Referencias(HTMLParser):
+    """Coleta (tipo, url) dos assets que a página carrega logo de cara."""
+
+    def __init__(self):
+        super().__init__()
+        self.refs = []
+        self.nomes = set()  # ".classe" e "#id" usados na página
+
+    def handle_starttag(self, tag, attrs):
+        a = dict(attrs)
+        self.nomes.update(f".{c}" for c in (a.get("class") or "").split())
+        if a.get("id"):
+            self.nomes.add(f"#{a['id']}")
+        if tag == "link" and REL_CARREGADOS & set((a.get("rel") or "").lower().split()) and a.get("href"):
+            self.refs.append(("css" if "stylesheet" in a["rel"] else "link", a["href"]))
+        elif tag == "script" and a.get("src"):
+            self.refs.append(("js", a["src"]))
+        elif tag in ("img", "source") and (a.get("loading") or "").lower() != "lazy":
+            src = a.get("src") or (a.get("srcset") or "").split(",")[0].strip().split(" ")[0]
+            if src:
+                self.refs.append(("imagem", src))
+
+    handle_startendtag = handle_starttag
+
+
+def caminho_local(url: str, base: str) -> str | None:
+    """Arquivo local (relativo ao site) de uma URL citada em `base`; None para externas, data: etc."""
+    partes = urlsplit(url)
+    if partes.scheme or partes.netloc or not partes.path:
+        return None
+    caminho = unquote(partes.path)
+    rel = caminho.lstrip("/") if caminho.startswith("/") else os.path.join(os.path.dirname(base), caminho)
+    return os.path.normpath(rel).replace(os.sep, "/")
+
+
+def seletor_da_regra(css: str, pos: int) -> str:
+    """Seletor da regra que contém a posição `pos` do CSS."""
+    abre = css.rfind("{", 0, pos)
+    inicio = max(css.rfind("}", 0, abre), css.rfind("{", 0, abre), css.rfind(";", 0, abre)) + 1
+    return css[inicio:abre]
+
+
+def referencias_css(css_rel: str, site_root: str, nomes: set) -> list:
+    """url(...) locais do CSS usadas pela página (seletor sem classe/id conta sempre)."""
+    try:
+        with open(os.path.join(site_root, css_rel), "r", encoding="utf-8") as f:
+            css = f.read()
+    except OSError:
+        return []
+    refs = []
+    for m in _CSS_URL_RE.finditer(css):
+        seletores = [_SELETOR_NOME_RE.findall(sel) for sel in seletor_da_regra(css, m.start()).split(",")]
+        if seletores and all(sel and not any(a + b in nomes for a, b in sel) for sel in seletores):
+            continue  # nenhum seletor da regra cita algo que a página tem
+        rel = caminho_local(m.group(1).strip(), css_rel)
+        if rel:
+            refs.append(("css-url", rel))
+    return refs
+
+
+# =========================
+# PRIMEIRA DOBRA (imagens implicadas pelo catálogo)
+# =========================
+def imagens_da_dobra(pagina: str, cards: int) -> list:
+    """Imagens dos `cards` primeiros cards de cada grid da página (templates do prerender)."""
+    refs = []
+    for alvo_pagina, elemento, nome, selecionar, template in prerender.TARGETS:
+        if alvo_pagina != pagina:
+            continue
+        itens, _ = prerender.load_catalog(nome)
+        for item in selecionar(itens)[:cards]:
+            for src in _IMG_SRC_RE.findall(template(item)):
+                refs.append((f"card #{elemento}", src.replace("&amp;", "&")))
+    return refs
+
+
+# =========================
+# MEDIÇÃO
+# =========================
+def medir(rel: str, site_root: str, cache: dict) -> tuple | None:
+    """(bruto, gzip) de um arquivo local; None se não existir."""
+    if rel in cache:
+        return cache[rel]
+    path = os.path.join(site_root, rel)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        cache[rel] = None
+        return None
+    comprimido = len(gzip.compress(data, 6)) if os.path.splitext(rel)[1].lower() in COMPRIMIVEIS else len(data)
+    cache[rel] = (len(data), comprimido)
+    return cache[rel]
+
+
+def assets_da_pagina(pagina: str, config: dict, site_root: str) -> tuple:
+    """([(origem, caminho)] sem repetição, [urls externas]) da página."""
+    with open(os.path.join(site_root, pagina), "r", encoding="utf-8") as f:
+        html = f.read()
+    parser = _Referencias()
+    parser.feed(html)
+
+    refs, externas = [("html", pagina)], []
+    for tipo, url in parser.refs:
+        rel = caminho_local(url, pagina)
+        if rel is None:
+            externas.append(url)
+            continue
+        refs.append((tipo, rel))
+        if tipo == "css":
+            refs.extend(referencias_css(rel, site_root, parser.nomes))
+
+    cfg = config["paginas"].get(pagina, {})
+    refs.extend(("dados", rel) for rel in cfg.get("dados", []))
+    for origem, url in imagens_da_dobra(pagina, cfg.get("cards", config.get("cards", 6))):
+        rel = caminho_local(url, pagina)
+        if rel:
+            refs.append((origem, rel))
+
+    vistos, unicos = set(), []
+    for origem, rel in refs:
+        if rel not in vistos:
+            vistos.add(rel)
+            unicos.append((origem, rel))
+    return unicos, externas
+
+
+def categoria(rel: str) -> str:
+    ext = os.path.splitext(rel)[1].lower()
+    if ext in (".js", ".mjs"):
+        return "js"
+    if ext == ".css":
+        return "css"
+    if ext == ".json":
+        return "dados"
+    if ext in (".html", ".htm"):
+        return "html"
+    return "imagens"
+
+
+def avaliar(pagina: str, config: dict, site_root: str, cache: dict) -> dict:
+    refs, externas = assets_da_pagina(pagina, config, site_root)
+    linhas, ausentes = [], []
+    totais = {"bruto": 0, "gzip": 0, "js": 0, "css": 0, "dados": 0, "imagens": 0, "html": 0}
+    for origem, rel in refs:
+        tamanho = medir(rel, site_root, cache)
+        if tamanho is None:
+            ausentes.append(rel)
+            continue
+        bruto, comprimido = tamanho
+        linhas.append((origem, rel, bruto, comprimido))
+        totais["bruto"] += bruto
+        totais["gzip"] += comprimido
+        totais[categoria(rel)] += comprimido
+
+    limites = config["paginas"].get(pagina, {}).get("limites", {})
+    maior = max((l[2] for l in linhas), default=0)
+    estouros = []
+    for chave, limite_kb in limites.items():
+        valor = maior if chave == "asset" else totais.get(chave)
+        if valor is not None and valor > limite_kb * 1024:
+            estouros.append((chave, valor, limite_kb))
+    return {"linhas": linhas, "ausentes": ausentes, "externas": externas, "totais": totais,
+            "maior": maior, "limites": limites, "estouros": estouros}
+
+
+# =========================
+# RELATÓRIO
+# =========================
+def kb(n: int) -> str:
+    return f"{n / 1024:,.1f}"
+
+
+def imprimir(pagina: str, r: dict, resumo: bool = False):
+    print(f"\n📄 {pagina}")
+    if not resumo:
+        print(f"   {'Origem':<26}{'Arquivo':<64}{'KB':>9}{'gzip KB':>10}")
+        for origem, rel, bruto, comprimido in sorted(r["linhas"], key=lambda l: -l[3]):
+            nome = rel if len(rel) <= 62 else "…" + rel[-61:]
+            print(f"   {origem[:25]:<26}{nome:<64}{kb(bruto):>9}{kb(comprimido):>10}")
+        for rel in r["ausentes"]:
+            print(f"   ⚠️ ausente: {rel}")
+        for url in r["externas"]:
+            print(f"   ↗ externo (não medido): {url}")
+
+    t = r["totais"]
+    print(f"   Total: {kb(t['bruto'])} KB bruto, {kb(t['gzip'])} KB gzip "
+          f"(js {kb(t['js'])}, css {kb(t['css'])}, dados {kb(t['dados'])}, imagens {kb(t['imagens'])}, "
+          f"html {kb(t['html'])}) — maior asset {kb(r['maior'])} KB")
+    for chave, limite_kb in r["limites"].items():
+        valor = r["maior"] if chave == "asset" else t.get(chave, 0)
+        marca = "❌" if any(e[0] == chave for e in r["estouros"]) else "✅"
+        print(f"   {marca} {chave:<8} {kb(valor):>9} / {limite_kb:,} KB ({valor / (limite_kb * 1024) * 100:.0f}%)")
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confere o peso de cada página contra o orçamento")
+    parser.add_argument("--config", default=CONFIG_FILE)
+    parser.add_argument("--pagina", action="append", help="só esta página (pode repetir)")
+    parser.add_argument("--resumo", action="store_true", help="só os totais, sem a lista de assets")
+    args = parser.parse_args(argv)
+
+    with open(args.config, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    paginas = args.pagina or list(config["paginas"])
+    cache, estouros = {}, 0
+    for pagina in paginas:
+        r = avaliar(pagina, config, SITE_ROOT, cache)
+        imprimir(pagina, r, args.resumo)
+        estouros += len(r["estouros"])
+
+    print(f"\n{'❌' if estouros else '✅'} {estouros} limite(s) estourado(s) em {len(paginas)} página(s)")
+    return 1 if estouros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
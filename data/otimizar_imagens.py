@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Otimizador de imagens de assets/img
+===================================
+
+O QUE FAZ:
+1. Percorre assets/img/<pasta> e aplica o orçamento configurado para cada pasta
+   (lado máximo, recorte fixo opcional, qualidade)
+2. Recomprime no mesmo formato (mesmo caminho, nada quebra no site) e remove
+   metadados (EXIF, perfis, textos)
+3. Gera irmãos em formato moderno com a extensão original no nome
+   (foo.png -> foo.png.webp e, se suportado, foo.png.avif)
+4. Pula arquivos já otimizados (cache por hash de conteúdo)
+5. Mostra um relatório de bytes antes/depois por pasta
+
+Reaproveita o recorte/achatamento de criar_thumb.py.
+
+Uso:
+    python data/otimizar_imagens.py                # todas as pastas configuradas
+    python data/otimizar_imagens.py sobre_mim       # só algumas pastas
+    python data/otimizar_imagens.py --avif --workers 8
+
+Requisitos:
+- pip install Pillow
+"""
+
+import os
+import io
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps, features
+
+from comum import carregar_json, hash_arquivo, salvar_json
+from criar_thumb import recortar_proporcao, remover_alpha
+import manifesto
+
+
+# =========================
+# CONFIG
+# =========================
+SCRIPT_DIR = Path(__file__).parent
+SITE_ROOT = SCRIPT_DIR.parent
+IMG_ROOT = SITE_ROOT / "assets" / "img"
+CACHE_FILE = SCRIPT_DIR / ".cache" / "otimizacao.json"
+
+EXTENSOES = {".png", ".jpg", ".jpeg"}
+
+# Orçamento por pasta de assets/img:
+# - max_lado: maior dimensão permitida (px)
+# - tamanho: recorte fixo (largura, altura) no estilo de criar_thumb, opcional
+# - qualidade: JPEG/WebP/AVIF
+# - max_kb: tamanho máximo esperado após otimização (só alerta no relatório)
+ORCAMENTOS = {
+    "sobre_mim": {"max_lado": 1376, "qualidade": 82, "max_kb": 400},
+    "avatares": {"max_lado": 1280, "qualidade": 82, "max_kb": 500},
+    "projetos": {"max_lado": 1600, "qualidade": 85, "max_kb": 500},
+    "diplomas": {"max_lado": 1200, "qualidade": 85, "max_kb": 400},
+    "certificados": {"max_lado": 1600, "qualidade": 85, "max_kb": 600},
+}
+
+
+# =========================
+# HELPERS
+# =========================
+def irmao_moderno(caminho: Path, formato: str) -> Path:
+    """foo.png -> foo.png.webp: foo.png e foo.jpg não disputam o mesmo irmão."""
+    return caminho.with_name(f"{caminho.name}.{formato.lower()}")
+
+
+def assinatura_orcamento(orcamento: dict, gerar_avif: bool) -> str:
+    """Muda quando o orçamento muda, invalidando o cache dos arquivos da pasta."""
+    dados = json.dumps({**orcamento, "avif": gerar_avif}, sort_keys=True)
+    return hashlib.sha1(dados.encode()).hexdigest()[:12]
+
+
+def carregar_cache() -> dict:
+    return carregar_json(CACHE_FILE) or {}
+
+
+def salvar_cache(cache: dict):
+    salvar_json(CACHE_FILE, cache, indent=1)
+
+
+def sem_transparencia(img) -> bool:
+    """True se o canal alpha existe mas é totalmente opaco (pode virar RGB)."""
+    return img.mode == "RGBA" and img.getchannel("A").getextrema() == (255, 255)
+
+
+def codificar(img, formato: str, qualidade: int) -> bytes:
+    """Codifica a imagem sem metadados (nenhum exif/icc/pnginfo é repassado)."""
+    buf = io.BytesIO()
+    if formato == "JPEG":
+        remover_alpha(img).save(buf, "JPEG", quality=qualidade, optimize=True, progressive=True)
+    elif formato == "PNG":
+        img.save(buf, "PNG", optimize=True)
+    elif formato == "WEBP":
+        img.save(buf, "WEBP", quality=qualidade, method=6)
+    elif formato == "AVIF":
+        img.save(buf, "AVIF", quality=qualidade)
+    return buf.getvalue()
+
+
+def otimizar_arquivo(tarefa: tuple) -> dict:
+    """
+    Otimiza um arquivo (roda no pool de processos).
+    Sobrescreve o original se a nova versão for menor ou se a imagem passava
+    do orçamento (lado máximo/recorte): aí a redução vale mesmo sem ganho de
+    bytes na recompressão.
+    """
+    caminho, orcamento, gerar_avif = tarefa
+    caminho = Path(caminho)
+    antes = caminho.stat().st_size
+    resultado = {"arquivo": str(caminho), "antes": antes, "depois": antes, "modernos": 0}
+
+    try:
+        with Image.open(caminho) as original:
+            formato = "JPEG" if original.format in ("JPEG", "MPO") else "PNG"
+            img = ImageOps.exif_transpose(original)
+            img.load()
+        dimensoes = img.size
+
+        if orcamento.get("tamanho"):
+            img = recortar_proporcao(img, tuple(orcamento["tamanho"]))
+        else:
+            max_lado = orcamento.get("max_lado")
+            if max_lado and max(img.size) > max_lado:
+                img.thumbnail((max_lado, max_lado), Image.Resampling.LANCZOS)
+
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "A" in img.getbands() or img.mode == "P" else "RGB")
+        if sem_transparencia(img):
+            img = img.convert("RGB")
+
+        qualidade = orcamento.get("qualidade", 85)
+        dados = codificar(img, formato, qualidade)
+        if len(dados) < antes or img.size != dimensoes:
+            tmp = caminho.with_name(caminho.name + ".tmp")
+            tmp.write_bytes(dados)
+            os.replace(tmp, caminho)
+            resultado["depois"] = len(dados)
+
+        modernos = ["WEBP"] + (["AVIF"] if gerar_avif else [])
+        for fmt in modernos:
+            irmao = irmao_moderno(caminho, fmt)
+            dados_modernos = codificar(img, fmt, qualidade)
+            irmao.write_bytes(dados_modernos)
+            resultado["modernos"] += len(dados_modernos)
+
+        resultado["sha"] = hash_arquivo(caminho)
+    except Exception as e:
+        resultado["erro"] = str(e)
+    return resultado
+
+
+def listar_imagens(pastas) -> list:
+    arquivos = []
+    for pasta in pastas:
+        raiz = IMG_ROOT / pasta
+        if not raiz.exists():
+            print(f"⚠️  Pasta não encontrada: {raiz}")
+            continue
+        for path in sorted(raiz.rglob("*")):
+            if path.is_file() and path.suffix.lower() in EXTENSOES:
+                arquivos.append((pasta, path))
+    return arquivos
+
+
+def formatar_bytes(n: float) -> str:
+    for unidade in ("B", "KB", "MB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unidade}" if unidade == "B" else f"{n:.1f} {unidade}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Otimiza as imagens de assets/img")
+    parser.add_argument("pastas", nargs="*", help=f"pastas de assets/img (padrão: {', '.join(ORCAMENTOS)})")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processos em paralelo")
+    parser.add_argument("--avif", action="store_true", help="gera também irmãos .avif (se o Pillow suportar)")
+    parser.add_argument("--forcar", action="store_true", help="ignora o cache e reprocessa tudo")
+    args = parser.parse_args(argv)
+
+    pastas = args.pastas or list(ORCAMENTOS)
+    desconhecidas = [p for p in pastas if p not in ORCAMENTOS]
+    if desconhecidas:
+        print(f"❌ Sem orçamento configurado para: {', '.join(desconhecidas)}")
+        return 1
+
+    gerar_avif = args.avif and features.check("avif")
+    if args.avif and not gerar_avif:
+        print("⚠️  Este Pillow não tem suporte a AVIF; gerando só .webp")
+
+    print(f"\n{'='*70}")
+    print(f"🗜️  OTIMIZADOR DE IMAGENS")
+    print(f"{'='*70}\n")
+
+    cache = {} if args.forcar else carregar_cache()
+    tarefas, pulados = [], []
+    for pasta, path in listar_imagens(pastas):
+        rel = path.relative_to(SITE_ROOT).as_posix()
+        orcamento = ORCAMENTOS[pasta]
+        assinatura = assinatura_orcamento(orcamento, gerar_avif)
+        st = path.stat()
+        entrada = cache.get(rel)
+
+        # Atalho por tamanho+mtime; se mudou, confirma pelo hash do conteúdo
+        if entrada and entrada.get("config") == assinatura and irmao_moderno(path, "WEBP").exists():
+            if (entrada.get("size"), entrada.get("mtime")) == (st.st_size, st.st_mtime_ns) \
+                    or entrada.get("sha") == hash_arquivo(path):
+                pulados.append((pasta, st.st_size))
+                continue
+        tarefas.append((pasta, rel, (str(path), orcamento, gerar_avif)))
+
+    print(f"📁 {len(tarefas) + len(pulados)} imagem(ns): {len(tarefas)} a otimizar, {len(pulados)} já otimizada(s)\n")
+
+    relatorio = {p: {"arquivos": 0, "antes": 0, "depois": 0, "modernos": 0, "acima": []} for p in pastas}
+    for pasta, tamanho in pulados:
+        relatorio[pasta]["arquivos"] += 1
+        relatorio[pasta]["antes"] += tamanho
+        relatorio[pasta]["depois"] += tamanho
+
+    erros = 0
+    if tarefas:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            resultados = pool.map(otimizar_arquivo, [t[2] for t in tarefas], chunksize=4)
+            for (pasta, rel, _), res in zip(tarefas, resultados):
+                if "erro" in res:
+                    print(f"  ❌ {rel}: {res['erro']}")
+                    erros += 1
+                    continue
+                r = relatorio[pasta]
+                r["arquivos"] += 1
+                r["antes"] += res["antes"]
+                r["depois"] += res["depois"]
+                r["modernos"] += res["modernos"]
+                max_kb = ORCAMENTOS[pasta].get("max_kb")
+                if max_kb and res["depois"] > max_kb * 1024:
+                    r["acima"].append((rel, res["depois"]))
+
+                st = Path(res["arquivo"]).stat()
+                cache[rel] = {
+                    "sha": res["sha"],
+                    "size": st.st_size,
+                    "mtime": st.st_mtime_ns,
+                    "config": assinatura_orcamento(ORCAMENTOS[pasta], gerar_avif),
+                }
+        salvar_cache(cache)
+
+    # Relatório antes/depois
+    print(f"{'Pasta':<16}{'Arquivos':>9}{'Antes':>12}{'Depois':>12}{'Economia':>10}{'WebP/AVIF':>12}")
+    print("-" * 71)
+    total_antes = total_depois = 0
+    for pasta, r in relatorio.items():
+        economia = (1 - r["depois"] / r["antes"]) * 100 if r["antes"] else 0
+        print(
+            f"{pasta:<16}{r['arquivos']:>9}{formatar_bytes(r['antes']):>12}"
+            f"{formatar_bytes(r['depois']):>12}{economia:>9.1f}%{formatar_bytes(r['modernos']):>12}"
+        )
+        total_antes += r["antes"]
+        total_depois += r["depois"]
+    print("-" * 71)
+    economia = (1 - total_depois / total_antes) * 100 if total_antes else 0
+    print(f"{'TOTAL':<16}{'':>9}{formatar_bytes(total_antes):>12}{formatar_bytes(total_depois):>12}{economia:>9.1f}%")
+
+    acima = [(rel, n) for r in relatorio.values() for rel, n in r["acima"]]
+    if acima:
+        print(f"\n⚠️  Acima do orçamento (max_kb):")
+        for rel, n in acima:
+            print(f"   • {rel}: {formatar_bytes(n)}")
+
+    # Imagens recomprimidas mudam de hash: o manifesto do service worker acompanha
+    if tarefas:
+        manifesto.atualizar()
+
+    print(f"\n{'='*70}\n")
+    return 1 if erros else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
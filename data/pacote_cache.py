@@ -0,0 +1,309 @@
+"""
+Pacote portátil dos caches do extrator (restore/save em CI)
+===========================================================
+
+Junta num arquivo só (tar.gz versionado) o estado caro de reconstruir:
+catálogos SQLite, textos e OCR dos PDFs, READMEs parseados, mosaicos,
+estado dos deltas (relacionados, facetas, manifesto, bundles) e os previews
+endereçados por conteúdo (<previews>/_conteudo/<sha>.png). PDFs baixados
+não entram: o que se tira deles (texto, previews) já está no pacote.
+
+O nome do arquivo traz a chave da configuração (hash das versões de
+extração, dos parâmetros de render/mosaico/zoom e do fontes.json). Na CI,
+`chave` vira a chave do cache: o job restaura o pacote, roda o extrator
+(só o incremental) e exporta o pacote de novo.
+
+Importação, entrada a entrada, direto do tar (sem extrair tudo antes):
+- o SHA-256 registrado no cabeçalho é conferido durante a extração;
+- entradas que dependem da configuração (READMEs parseados, mosaicos) são
+  descartadas se o pacote é de outra chave;
+- arquivo local mais novo que o do pacote fica (a menos de --forcar);
+- o resto é validado por quem usa, quando usa: READMEs e previews por SHA
+  de blob, manifesto por tamanho+mtime, deltas pela assinatura; textos de
+  outra versão do extrator são podados logo após a importação.
+
+Uso:
+    python data/pacote_cache.py chave
+    python data/pacote_cache.py exportar [--saida X.tar.gz] [--com-zoom]
+    python data/pacote_cache.py importar X.tar.gz [--forcar]
+"""
+
+import io
+import os
+import sys
+import json
+import glob
+import time
+import sqlite3
+import hashlib
+import tarfile
+import argparse
+import tempfile
+from datetime import datetime
+
+import extrator_certificados as ext
+from comum import BLOCO, hash_arquivo
+import piramides
+import textos
+
+
+# Sobe ao mudar o layout do pacote: pacotes antigos são recusados
+VERSAO = 1
+CABECALHO = "pacote.json"
+NIVEL_COMPRESSAO = 6
+
+# Caches em data/.cache: (glob, depende da configuração). Journal (execução
+# em andamento) e baseline de benchmark (por máquina) ficam de fora
+CACHES = [
+    ("catalogo*.sqlite", False),
+    ("textos.sqlite", False),
+    ("readmes.json", True),
+    ("mosaicos.json", True),
+    ("estado*.json", False),
+    ("relacionados*.json", False),
+    ("relacionados*.npz", False),
+    ("facetas*.json", False),
+    ("manifesto.json", False),
+    ("empacotar.json", False),
+    ("otimizacao.json", False),
+]
+
+
+# =========================
+# CHAVE DA CONFIGURAÇÃO
+# =========================
+def configuracao() -> dict:
+    """O que decide se os caches de uma máquina servem em outra."""
+    try:
+        with open(ext.FONTES_FILE, "rb") as f:
+            fontes = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        fontes = None
+    return {
+        "pacote": VERSAO,
+        "texto": ext.TEXTO_VERSAO,
+        "ocr": ext.OCR_VERSAO,
+        "secoes": ext.README_SECTIONS,
+        "mosaico": [list(ext.MOSAIC_SIZE), ext.MOSAIC_MAX_TILES, ext.MOSAIC_QUALITY],
+        "zoom": piramides.parametros(),
+        "fontes": fontes,
+    }
+
+
+def chave_config() -> str:
+    texto = json.dumps(configuracao(), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()[:16]
+
+
+# =========================
+# ENTRADAS
+# =========================
+def pastas_de_previews() -> list:
+    """Pastas de previews de todas as fontes configuradas (ativas ou não)."""
+    try:
+        with open(ext.FONTES_FILE, "r", encoding="utf-8") as f:
+            fontes = json.load(f).get("fontes", [])
+    except OSError:
+        fontes = [ext.FONTE_PADRAO]
+    return sorted({f["previews"] for f in fontes})
+
+
+def entradas(com_zoom: bool = False) -> list:
+    """[(nome no pacote, caminho local, depende da configuração)]."""
+    out = []
+    for padrao, depende in CACHES:
+        for path in sorted(glob.glob(os.path.join(ext.CACHE_DIR, padrao))):
+            out.append((f"cache/{os.path.basename(path)}", path, depende))
+    padroes_site = [f"{p}/{ext.SHARED_PREVIEW_DIR}/*.png" for p in pastas_de_previews()]
+    if com_zoom:
+        padroes_site.append(f"{piramides.ZOOM_DIR}/*/**/*")
+    for padrao in padroes_site:
+        for path in sorted(glob.glob(os.path.join(ext.SITE_ROOT, padrao), recursive=True)):
+            if os.path.isfile(path):
+                rel = os.path.relpath(path, ext.SITE_ROOT).replace(os.sep, "/")
+                out.append((f"site/{rel}", path, False))
+    return out
+
+
+def destino_da_entrada(nome: str) -> str | None:
+    """Caminho local de uma entrada do pacote (None se sair das pastas permitidas)."""
+    prefixo, _, rel = nome.partition("/")
+    base = {"cache": ext.CACHE_DIR, "site": ext.SITE_ROOT}.get(prefixo)
+    if base is None or not rel:
+        return None
+    base = os.path.abspath(base)
+    path = os.path.abspath(os.path.join(base, rel))
+    return path if path.startswith(base + os.sep) else None
+
+
+def copia_sqlite(path: str, destino: str):
+    """Cópia consistente de um banco em WAL (API de backup, sem os -wal/-shm)."""
+    origem = sqlite3.connect(path)
+    copia = sqlite3.connect(destino)
+    try:
+        origem.backup(copia)
+    finally:
+        copia.close()
+        origem.close()
+
+
+# =========================
+# EXPORTAÇÃO
+# =========================
+def exportar(saida: str | None = None, com_zoom: bool = False) -> dict:
+    inicio = time.perf_counter()
+    chave = chave_config()
+    saida = saida or f"cache-extrator-{chave}.tar.gz"
+    lista = entradas(com_zoom)
+
+    cabecalho = {"versao": VERSAO, "chave": chave, "configuracao": configuracao(),
+                 "criado": datetime.now().isoformat(), "entradas": {}}
+    bruto = 0
+    with tempfile.TemporaryDirectory(prefix="pacote-") as tmp:
+        arquivos = []
+        for nome, path, depende in lista:
+            mtime = os.path.getmtime(path)
+            if path.endswith(".sqlite"):
+                copia = os.path.join(tmp, os.path.basename(path))
+                copia_sqlite(path, copia)
+                path = copia
+            tamanho = os.path.getsize(path)
+            bruto += tamanho
+            cabecalho["entradas"][nome] = {"sha256": hash_arquivo(path), "tamanho": tamanho,
+                                           "mtime": mtime, "config": depende}
+            arquivos.append((nome, path, mtime))
+
+        dados = json.dumps(cabecalho, ensure_ascii=False, indent=1).encode("utf-8")
+        os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+        with tarfile.open(saida + ".tmp", "w:gz", compresslevel=NIVEL_COMPRESSAO) as tar:
+            info = tarfile.TarInfo(CABECALHO)
+            info.size, info.mtime = len(dados), int(time.time())
+            tar.addfile(info, io.BytesIO(dados))
+            for nome, path, mtime in arquivos:
+                info = tar.gettarinfo(path, arcname=nome)
+                info.mtime = int(mtime)
+                with open(path, "rb") as f:
+                    tar.addfile(info, f)
+        os.replace(saida + ".tmp", saida)
+
+    dt = time.perf_counter() - inicio
+    comprimido = os.path.getsize(saida)
+    print(f"📦 {len(arquivos)} entrada(s), {bruto / 1048576:.1f} MB → {comprimido / 1048576:.1f} MB "
+          f"em {dt:.1f}s: {saida}")
+    print(f"   chave {chave}")
+    return {"arquivo": saida, "entradas": len(arquivos), "bruto": bruto, "comprimido": comprimido, "segundos": dt}
+
+
+# =========================
+# IMPORTAÇÃO
+# =========================
+def extrair_conferindo(tar, membro, destino: str, sha256: str) -> bool:
+    """Extrai um membro para `destino` conferindo o SHA-256; não toca no destino se não bater."""
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    tmp = destino + ".pacote.tmp"
+    h = hashlib.sha256()
+    with tar.extractfile(membro) as origem, open(tmp, "wb") as f:
+        for bloco in iter(lambda: origem.read(BLOCO), b""):
+            h.update(bloco)
+            f.write(bloco)
+    if h.hexdigest() != sha256:
+        os.remove(tmp)
+        return False
+    if destino.endswith(".sqlite"):
+        for sufixo in ("-wal", "-shm"):  # WAL do banco antigo não vale para o novo
+            if os.path.exists(destino + sufixo):
+                os.remove(destino + sufixo)
+    os.replace(tmp, destino)
+    return True
+
+
+def importar(arquivo: str, forcar: bool = False) -> dict | None:
+    inicio = time.perf_counter()
+    stats = {"importadas": 0, "mantidas": 0, "iguais": 0, "config": 0, "corrompidas": 0,
+             "ignoradas": 0, "textos_podados": 0, "bytes": 0}
+    with tarfile.open(arquivo, "r:*") as tar:
+        primeiro = tar.next()
+        if primeiro is None or primeiro.name != CABECALHO:
+            print(f"❌ {arquivo}: não é um pacote de cache (sem {CABECALHO})")
+            return None
+        cabecalho = json.load(tar.extractfile(primeiro))
+        if cabecalho.get("versao") != VERSAO:
+            print(f"❌ Pacote na versão {cabecalho.get('versao')}, esperado {VERSAO}: ignorado")
+            return None
+        mesma_config = cabecalho.get("chave") == chave_config()
+        if not mesma_config:
+            print(f"⚠️ Pacote de outra configuração ({cabecalho.get('chave')} ≠ {chave_config()}): "
+                  f"caches dependentes dela serão descartados")
+
+        # Membro a membro, na ordem do tar: nada é lido além da entrada atual
+        for membro in tar:
+            info = cabecalho["entradas"].get(membro.name)
+            destino = destino_da_entrada(membro.name)
+            if not membro.isfile() or info is None or destino is None:
+                stats["ignoradas"] += 1
+                continue
+            if info["config"] and not mesma_config:
+                stats["config"] += 1
+                continue
+            if os.path.exists(destino) and not forcar:
+                if membro.name.startswith("site/"):
+                    stats["iguais"] += 1  # endereçado por conteúdo: mesmo nome, mesmo arquivo
+                    continue
+                if os.path.getmtime(destino) >= info["mtime"]:
+                    stats["mantidas"] += 1
+                    continue
+            if not extrair_conferindo(tar, membro, destino, info["sha256"]):
+                print(f"  ⚠️ {membro.name}: SHA-256 não confere, descartado")
+                stats["corrompidas"] += 1
+                continue
+            os.utime(destino, (info["mtime"], info["mtime"]))
+            stats["importadas"] += 1
+            stats["bytes"] += info["tamanho"]
+
+    # Textos de outra versão do extrator nunca mais serão lidos
+    path_textos = os.path.join(ext.CACHE_DIR, "textos.sqlite")
+    if os.path.exists(path_textos):
+        conn = textos.conectar(path_textos)
+        stats["textos_podados"] = textos.limpar(conn, [ext.TEXTO_VERSAO, ext.OCR_VERSAO])
+        conn.close()
+
+    dt = time.perf_counter() - inicio
+    stats["segundos"] = dt
+    print(f"📥 {stats['importadas']} entrada(s) importada(s) ({stats['bytes'] / 1048576:.1f} MB de "
+          f"{os.path.getsize(arquivo) / 1048576:.1f} MB) em {dt:.1f}s")
+    print(f"   {stats['mantidas']} local(is) mais nova(s), {stats['iguais']} preview(s) já existente(s), "
+          f"{stats['config']} de outra configuração, {stats['corrompidas']} corrompida(s), "
+          f"{stats['textos_podados']} texto(s) de outra versão podado(s)")
+    return stats
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta/importa os caches do extrator num pacote portátil")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    sub.add_parser("chave", help="imprime a chave da configuração atual (chave do cache na CI)")
+    p_exp = sub.add_parser("exportar", help="gera o pacote")
+    p_exp.add_argument("--saida", help="arquivo .tar.gz (padrão: cache-extrator-<chave>.tar.gz)")
+    p_exp.add_argument("--com-zoom", action="store_true", help="inclui as pirâmides de zoom (assets/zoom)")
+    p_imp = sub.add_parser("importar", help="restaura um pacote")
+    p_imp.add_argument("arquivo")
+    p_imp.add_argument("--forcar", action="store_true", help="sobrescreve mesmo arquivos locais mais novos")
+    args = parser.parse_args(argv)
+
+    if args.comando == "chave":
+        print(chave_config())
+    elif args.comando == "exportar":
+        exportar(args.saida, args.com_zoom)
+    elif args.comando == "importar":
+        if not os.path.exists(args.arquivo):
+            print(f"ℹ️ {args.arquivo} não existe: nada a importar (build frio)")
+            return 0
+        if importar(args.arquivo, args.forcar) is None:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
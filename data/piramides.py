@@ -0,0 +1,204 @@
+"""
+Pirâmides de zoom profundo dos PDFs de certificado
+==================================================
+
+Transforma páginas de PDF em pirâmides de tiles (estilo Deep Zoom): cada
+nível é a página inteira numa resolução, o de cima com ZOOM_MAXIMO e cada
+nível abaixo com metade da resolução do anterior, até caber em um tile.
+Cada nível é fatiado em tiles de TAMANHO_TILE px.
+
+O modal do certificado (main.js) usa o descritor para ampliar até a
+resolução máxima baixando só os tiles visíveis; os previews do grid
+continuam pequenos.
+
+Cada tile é renderizado direto do PDF com um retângulo de recorte
+(page.get_pixmap(clip=...)): nunca existe em memória um raster da página
+inteira na resolução alta, só um tile de cada vez.
+
+Saída (endereçada pelo SHA de blob do PDF, como os previews):
+    assets/zoom/<sha>/zoom.json               descritor
+    assets/zoom/<sha>/p<página>/<nível>/<coluna>_<linha>.webp
+
+Por padrão só a primeira página; com todas_paginas (históricos com várias
+páginas) as demais entram sob demanda, reaproveitando as já geradas. O
+descritor é gravado por último: se ele existe, os tiles listados existem.
+
+Uso:
+    python data/piramides.py arquivo.pdf [...]            # gera as pirâmides
+    python data/piramides.py arquivo.pdf --todas-paginas  # todas as páginas
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+
+import fitz  # pymupdf
+from PIL import Image
+
+from comum import git_blob_sha
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+ZOOM_DIR = "assets/zoom"
+DESCRITOR = "zoom.json"
+
+# Sobe ao mudar o fatiamento/formato: pirâmides antigas são refeitas
+VERSAO = 1
+
+TAMANHO_TILE = 256
+ZOOM_MAXIMO = 6.0       # ~430 dpi: texto miúdo do certificado legível
+LADO_MAXIMO = 8192      # teto do nível mais alto (PDFs com página enorme)
+FORMATO = "webp"
+QUALIDADE = 82
+PAGINAS_MAXIMO = 40     # históricos muito longos: o resto fica só no PDF
+
+
+# =========================
+# GEOMETRIA
+# =========================
+def niveis(largura_pt: float, altura_pt: float) -> list:
+    """Níveis do menor (cabe num tile) ao maior: [{zoom, largura, altura}]."""
+    zoom = min(ZOOM_MAXIMO, LADO_MAXIMO / max(largura_pt, altura_pt))
+    lista = []
+    while True:
+        largura, altura = math.ceil(largura_pt * zoom), math.ceil(altura_pt * zoom)
+        lista.append({"zoom": round(zoom, 6), "largura": largura, "altura": altura})
+        if max(largura, altura) <= TAMANHO_TILE:
+            break
+        zoom /= 2
+    return lista[::-1]
+
+
+def tiles_do_nivel(nivel: dict):
+    """Gera (coluna, linha, x0, y0, x1, y1) em pixels do nível."""
+    for linha in range(math.ceil(nivel["altura"] / TAMANHO_TILE)):
+        for coluna in range(math.ceil(nivel["largura"] / TAMANHO_TILE)):
+            x0, y0 = coluna * TAMANHO_TILE, linha * TAMANHO_TILE
+            yield (coluna, linha, x0, y0,
+                   min(nivel["largura"], x0 + TAMANHO_TILE), min(nivel["altura"], y0 + TAMANHO_TILE))
+
+
+def caminho_tile(pagina: int, n: int, coluna: int, linha: int) -> str:
+    return f"p{pagina}/{n}/{coluna}_{linha}.{FORMATO}"
+
+
+# =========================
+# RENDER
+# =========================
+def renderizar_pagina(page, destino: str) -> dict:
+    """Renderiza a pirâmide de uma página, tile a tile. Retorna a entrada do descritor."""
+    rect = page.rect
+    lista = niveis(rect.width, rect.height)
+    maior_raster = 0
+    for n, nivel in enumerate(lista):
+        z = nivel["zoom"]
+        matriz = fitz.Matrix(z, z)
+        for coluna, linha, x0, y0, x1, y1 in tiles_do_nivel(nivel):
+            clip = fitz.Rect(rect.x0 + x0 / z, rect.y0 + y0 / z, rect.x0 + x1 / z, rect.y0 + y1 / z)
+            pix = page.get_pixmap(matrix=matriz, clip=clip, alpha=False)
+            maior_raster = max(maior_raster, len(pix.samples))
+            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+            path = os.path.join(destino, caminho_tile(page.number, n, coluna, linha))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            img.save(path, FORMATO.upper(), quality=QUALIDADE)
+    return {"pagina": page.number, "niveis": lista, "maiorRaster": maior_raster}
+
+
+def parametros() -> dict:
+    return {"versao": VERSAO, "tile": TAMANHO_TILE, "zoomMaximo": ZOOM_MAXIMO,
+            "ladoMaximo": LADO_MAXIMO, "formato": FORMATO}
+
+
+def carregar_descritor(destino: str) -> dict | None:
+    try:
+        with open(os.path.join(destino, DESCRITOR), "r", encoding="utf-8") as f:
+            descritor = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    # Pirâmide de outra versão/configuração: refaz do zero
+    return descritor if all(descritor.get(k) == v for k, v in parametros().items()) else None
+
+
+def paginas_desejadas(total: int, todas_paginas: bool) -> list:
+    return list(range(min(total, PAGINAS_MAXIMO))) if todas_paginas else [0]
+
+
+def pronta(destino: str, todas_paginas: bool = False) -> bool:
+    descritor = carregar_descritor(destino)
+    if descritor is None:
+        return False
+    feitas = {p["pagina"] for p in descritor["paginas"]}
+    return set(paginas_desejadas(descritor["totalPaginas"], todas_paginas)) <= feitas
+
+
+def gerar(pdf_bytes: bytes, destino: str, todas_paginas: bool = False) -> dict:
+    """
+    Garante a pirâmide de um PDF em `destino` (só renderiza as páginas que
+    faltam) e devolve o descritor. Roda em processo do pool de render.
+    """
+    descritor = carregar_descritor(destino)
+    feitas = {p["pagina"]: p for p in descritor["paginas"]} if descritor else {}
+
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    try:
+        for pagina in paginas_desejadas(doc.page_count, todas_paginas):
+            if pagina not in feitas:
+                feitas[pagina] = renderizar_pagina(doc.load_page(pagina), destino)
+        total = doc.page_count
+    finally:
+        doc.close()
+
+    descritor = {**parametros(), "totalPaginas": total, "paginas": [feitas[p] for p in sorted(feitas)]}
+    path = os.path.join(destino, DESCRITOR)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(descritor, f, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+    return descritor
+
+
+# =========================
+# CAMINHOS
+# =========================
+def descritor_rel(blob_sha: str) -> str:
+    """Caminho do descritor que o FRONT vai usar (relativo ao site)."""
+    return f"{ZOOM_DIR}/{blob_sha}/{DESCRITOR}"
+
+
+def destino_da_piramide(blob_sha: str, site_root: str = SITE_ROOT) -> str:
+    return os.path.join(site_root, ZOOM_DIR, blob_sha)
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera pirâmides de zoom profundo de PDFs locais")
+    parser.add_argument("pdfs", nargs="+", help="arquivos PDF")
+    parser.add_argument("--todas-paginas", action="store_true", help="inclui todas as páginas (históricos)")
+    args = parser.parse_args(argv)
+
+    for pdf in args.pdfs:
+        with open(pdf, "rb") as f:
+            data = f.read()
+        inicio = time.perf_counter()
+        sha = git_blob_sha(data)
+        descritor = gerar(data, destino_da_piramide(sha), args.todas_paginas)
+        dt = time.perf_counter() - inicio
+
+        tiles = sum(math.ceil(n["largura"] / TAMANHO_TILE) * math.ceil(n["altura"] / TAMANHO_TILE)
+                    for p in descritor["paginas"] for n in p["niveis"])
+        topo = descritor["paginas"][0]["niveis"][-1]
+        maior = max(p["maiorRaster"] for p in descritor["paginas"])
+        print(f"🔍 {os.path.basename(pdf)}: {len(descritor['paginas'])}/{descritor['totalPaginas']} página(s), "
+              f"{tiles} tile(s), topo {topo['largura']}x{topo['altura']} em {dt:.1f}s "
+              f"(maior raster {maior / 1024:.0f} KB x página inteira {topo['largura'] * topo['altura'] * 3 / 1048576:.0f} MB)")
+        print(f"   {descritor_rel(sha)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,470 @@
+"""
+Pré-renderização estática dos cards
+===================================
+
+Escreve direto no HTML os grids que o main.js montaria depois de baixar o
+JSON (certificados, diplomas e projetos, incluindo os destaques do index).
+O primeiro paint já mostra os cards; o main.js só "hidrata" (liga cliques,
+filtros e modais) quando encontra o container com data-prerendered="true".
+
+Os templates abaixo espelham as funções de card do main.js
+(createFeaturedCertCard, createCertificateCard, createFeaturedDiplomaCard,
+createDiplomaCard, createFeaturedCard, createProjectCard) — mudou lá, muda aqui.
+
+Incremental: cada bloco guarda o hash do catálogo de origem no comentário
+marcador; se o JSON não mudou, o bloco (e o arquivo) não é reescrito.
+
+Uso:
+    python data/prerender.py            # atualiza os HTMLs
+    python data/prerender.py --check    # só diz se algum bloco está desatualizado
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+import argparse
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+
+# Sobe quando os templates mudarem, para forçar a regeração
+TEMPLATE_VERSION = "1"
+
+CATALOGS = {
+    "certificados": os.path.join(SCRIPT_DIR, "certificados.json"),
+    "diplomas": os.path.join(SCRIPT_DIR, "diplomas.json"),
+    "projetos": os.path.join(SCRIPT_DIR, "projetos.json"),
+}
+
+
+def esc(value) -> str:
+    """Mesmo resultado do escapeHTML do main.js (textContent -> innerHTML)."""
+    if value is None:
+        return ""
+    return str(value).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def attr(value) -> str:
+    """Valor interpolado em atributo (o main.js não escapa; aqui só as aspas por segurança)."""
+    return "" if value is None else str(value).replace('"', "&quot;")
+
+
+# =========================
+# ÍCONES (iguais aos do main.js)
+# =========================
+ICON_INST_16 = """<svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+                <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+              </svg>"""
+ICON_INST_PLAIN_16 = """<svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+              <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5"/>
+              <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>"""
+ICON_INST_14 = """<svg width="14" height="14" viewBox="0 0 16 16" fill="none">
+              <path d="M2 6L8 2L14 6L8 10L2 6Z" stroke="currentColor" stroke-width="1.5"/>
+              <path d="M2 10L8 14L14 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>"""
+ICON_DURACAO_16 = """<svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                  <path d="M8 14C11.3137 14 14 11.3137 14 8C14 4.68629 11.3137 2 8 2C4.68629 2 2 4.68629 2 8C2 11.3137 4.68629 14 8 14Z" stroke="currentColor" stroke-width="1.5"/>
+                  <path d="M8 5V8L10 10" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                </svg>"""
+ICON_ANO_16 = """<svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+                  <path d="M8 2V8L11 11" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                  <circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.5"/>
+                </svg>"""
+ICON_ANO_14 = """<svg width="14" height="14" viewBox="0 0 16 16" fill="none">
+                <path d="M8 2V8L11 11" stroke="currentColor" stroke-width="1.5" stroke-linecap="round"/>
+                <circle cx="8" cy="8" r="6" stroke="currentColor" stroke-width="1.5"/>
+              </svg>"""
+ICON_SETA = """<svg width="16" height="16" viewBox="0 0 16 16" fill="none">
+              <path d="M6 3L11 8L6 13" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>"""
+ICON_SELO = """<svg width="32" height="32" viewBox="0 0 24 24" fill="none">
+          <path d="M12 2L15.09 8.26L22 9.27L17 14.14L18.18 21.02L12 17.77L5.82 21.02L7 14.14L2 9.27L8.91 8.26L12 2Z"
+                fill="currentColor" stroke="currentColor" stroke-width="1.5"/>
+        </svg>"""
+
+
+# =========================
+# CERTIFICADOS
+# =========================
+def cert_image(cert: dict) -> str:
+    """Mesma escolha de imagem dos cards de certificado no main.js."""
+    certificados = cert.get("certificados") or []
+    if cert.get("tipo") == "Formação":
+        formacao = next((c for c in certificados if c.get("isFormacao")), None)
+        src = (formacao or {}).get("preview") or cert.get("thumbnail")
+    else:
+        src = cert.get("thumbnail")
+    return cert.get("mosaico") or src or "assets/img/certificados/placeholder-cert.png"
+
+
+def cert_card_class(tipo: str, base: str) -> str:
+    if tipo == "diploma":
+        return f"{base} cert-card-diploma"
+    if tipo == "repositório":
+        return f"{base} cert-card-repo"
+    return base
+
+
+def featured_cert_card(cert: dict) -> str:
+    tipo = cert.get("tipo")
+    certificados = cert.get("certificados") or []
+    badge = '<span class="cert-badge">★ Destaque</span>' if cert.get("destaque") else ""
+    count = (
+        f'<span class="cert-count-badge">{len(certificados)} certificados</span>'
+        if tipo == "Formação" and certificados else ""
+    )
+    duracao = f"""
+              <span class="cert-meta-item">
+                {ICON_DURACAO_16}
+                {esc(cert.get("duracao"))}
+              </span>""" if cert.get("duracao") else ""
+    ano = f"""
+              <span class="cert-meta-item">
+                {ICON_ANO_16}
+                {esc(cert.get("ano"))}
+              </span>""" if cert.get("ano") else ""
+
+    return f"""
+    <article class="{cert_card_class(tipo, 'featured-cert-card')}" data-cert-id="{attr(cert.get('id'))}">
+      {badge}
+      {count}
+      <img src="{attr(cert_image(cert))}" alt="Preview de {esc(cert.get('titulo'))}" class="featured-cert-thumb" loading="lazy" />
+      <div class="featured-cert-body">
+        <div class="featured-cert-header">
+          <h3 class="featured-cert-title">{esc(cert.get('titulo'))}</h3>
+          <div class="cert-meta">
+            <span class="cert-meta-item">
+              {ICON_INST_16}
+              {esc(cert.get('instituicao'))}
+            </span>{duracao}{ano}
+          </div>
+        </div>
+        <p class="featured-cert-desc">{esc(cert.get('descricao'))}</p>
+        <div class="featured-cert-footer">
+          <span class="featured-cert-category">{esc(cert.get('categoria'))}</span>
+          <span class="featured-cert-link">
+            Ver detalhes
+            {ICON_SETA}
+          </span>
+        </div>
+      </div>
+    </article>"""
+
+
+def cert_card(cert: dict) -> str:
+    tipo = cert.get("tipo")
+    certificados = cert.get("certificados") or []
+    destaque = (
+        '<span class="tag" style="background: rgba(27, 127, 92, 0.2); border-color: rgba(27, 127, 92, 0.4); color: var(--success);">★ Destaque</span>'
+        if cert.get("destaque") else ""
+    )
+    count = (
+        f'<span class="tag" style="background: rgba(59, 130, 246, 0.2); border-color: rgba(59, 130, 246, 0.4); color: #3B82F6;">{len(certificados)} certificados</span>'
+        if tipo == "Formação" and certificados else ""
+    )
+    ano = f"""
+          <span class="cert-meta-item">
+            {ICON_ANO_14}
+            {esc(cert.get("ano"))}
+          </span>""" if cert.get("ano") else ""
+
+    return f"""
+    <article class="{cert_card_class(tipo, 'cert-card-with-thumb')}" data-cert-id="{attr(cert.get('id'))}">
+      <img src="{attr(cert_image(cert))}" alt="Preview de {esc(cert.get('titulo'))}" class="cert-thumb" loading="lazy" />
+      <div class="cert-card-body">
+        <div class="p-top">
+          <h3 class="p-title">{esc(cert.get('titulo'))}</h3>
+          <span class="p-type">{esc(cert.get('categoria'))}</span>
+        </div>
+        <div class="cert-meta" style="margin: 0.5rem 0;">
+          <span class="cert-meta-item">
+            {ICON_INST_14}
+            {esc(cert.get('instituicao'))}
+          </span>{ano}
+        </div>
+        <p class="p-desc">{esc(cert.get('descricao'))}</p>
+        <div class="tags">
+          {destaque}
+          {count}
+          <span class="tag">{esc(tipo)}</span>
+        </div>
+      </div>
+    </article>"""
+
+
+# =========================
+# DIPLOMAS
+# =========================
+DIPLOMA_FEATURED_CLASSES = {
+    "MBA": "diploma-mba",
+    "Especialização": "diploma-especializacao",
+    "Graduação": "diploma-graduacao",
+}
+DIPLOMA_CARD_CLASSES = {
+    "MBA": "diploma-card-mba",
+    "Especialização": "diploma-card-especializacao",
+    "Graduação": "diploma-card-graduacao",
+}
+
+
+def featured_diploma_card(diploma: dict) -> str:
+    tipo = diploma.get("tipo")
+    duracao = f"""
+          <span class="diploma-meta-item">
+            {ICON_DURACAO_16}
+            {esc(diploma.get("duracao"))}
+          </span>""" if diploma.get("duracao") else ""
+    ano = f"""
+          <span class="diploma-meta-item">
+            {ICON_ANO_16}
+            {esc(diploma.get("ano"))}
+          </span>""" if diploma.get("ano") else ""
+    thumb = diploma.get("thumbnail") or "assets/img/diplomas/placeholder-diploma.png"
+
+    return f"""
+    <article class="featured-diploma-card {DIPLOMA_FEATURED_CLASSES.get(tipo, '')}" data-diploma-id="{attr(diploma.get('id'))}">
+      <div class="diploma-seal">
+        {ICON_SELO}
+      </div>
+      <img src="{attr(thumb)}" alt="Preview de {esc(diploma.get('titulo'))}" class="featured-diploma-thumb" loading="lazy" />
+      <div class="featured-diploma-body">
+        <div class="featured-diploma-header">
+          <h3 class="featured-diploma-title">{esc(diploma.get('titulo'))}</h3>
+          <span class="featured-diploma-type">{esc(tipo)}</span>
+        </div>
+        <div class="diploma-meta">
+          <span class="diploma-meta-item">
+            {ICON_INST_PLAIN_16}
+            {esc(diploma.get('instituicao'))}
+          </span>{duracao}{ano}
+        </div>
+        <p class="featured-diploma-desc">{esc(diploma.get('descricao'))}</p>
+        <div class="featured-diploma-footer">
+          <span class="featured-diploma-nivel">{esc(diploma.get('nivel'))}</span>
+          <span class="featured-diploma-link">
+            Ver detalhes
+            {ICON_SETA}
+          </span>
+        </div>
+      </div>
+    </article>"""
+
+
+def diploma_card(diploma: dict) -> str:
+    tipo = diploma.get("tipo")
+    ano = f"""
+          <span class="diploma-meta-item">
+            {ICON_ANO_14}
+            {esc(diploma.get("ano"))}
+          </span>""" if diploma.get("ano") else ""
+    thumb = diploma.get("thumbnail") or "assets/img/diplomas/placeholder-diploma.png"
+
+    return f"""
+    <article class="diploma-card-with-thumb {DIPLOMA_CARD_CLASSES.get(tipo, '')}" data-diploma-id="{attr(diploma.get('id'))}">
+      <div class="diploma-badge">{esc(tipo)}</div>
+      <img src="{attr(thumb)}" alt="Preview de {esc(diploma.get('titulo'))}" class="diploma-thumb" loading="lazy" />
+      <div class="diploma-card-body">
+        <div class="p-top">
+          <h3 class="p-title">{esc(diploma.get('titulo'))}</h3>
+          <span class="p-type">{esc(diploma.get('nivel'))}</span>
+        </div>
+        <div class="diploma-meta" style="margin: 0.5rem 0;">
+          <span class="diploma-meta-item">
+            {ICON_INST_14}
+            {esc(diploma.get('instituicao'))}
+          </span>{ano}
+        </div>
+        <p class="p-desc">{esc(diploma.get('descricao'))}</p>
+      </div>
+    </article>"""
+
+
+# =========================
+# PROJETOS
+# =========================
+def featured_project_card(project: dict) -> str:
+    tags = "".join(f'<span class="tag">{esc(t)}</span>' for t in (project.get("tags") or [])[:3])
+    thumb = project.get("thumbnail") or "assets/img/projetos/placeholder.png"
+    return f"""
+    <article class="featured-card" data-project-id="{attr(project.get('id'))}">
+      <img src="{attr(thumb)}" alt="Preview de {esc(project.get('titulo'))}" class="featured-thumb" loading="lazy" />
+      <div class="featured-body">
+        <div class="featured-header">
+          <h3 class="featured-title">{esc(project.get('titulo'))}</h3>
+          <span class="featured-type">{esc(project.get('tipo'))}</span>
+        </div>
+        <p class="featured-desc">{esc(project.get('descricao'))}</p>
+        <div class="featured-footer">
+          <div class="featured-tags">
+            {tags}
+          </div>
+          <span class="featured-link">
+            Ver detalhes
+            {ICON_SETA}
+          </span>
+        </div>
+      </div>
+    </article>"""
+
+
+def project_card(project: dict) -> str:
+    tags = "".join(f'<span class="tag">{esc(t)}</span>' for t in (project.get("tags") or [])[:4])
+    destaque = (
+        '<span class="tag" style="background: rgba(242, 140, 40, 0.2); border-color: rgba(242, 140, 40, 0.4); color: var(--accent);">★ Destaque</span>'
+        if project.get("destaque") else ""
+    )
+    thumb = project.get("thumbnail") or "assets/img/projetos/placeholder.png"
+    return f"""
+    <article class="pcard-with-thumb" data-project-id="{attr(project.get('id'))}">
+      <img src="{attr(thumb)}" alt="Preview de {esc(project.get('titulo'))}" class="pcard-thumb" loading="lazy" />
+      <div class="pcard-body">
+        <div class="p-top">
+          <h3 class="p-title">{esc(project.get('titulo'))}</h3>
+          <span class="p-type">{esc(project.get('tipo'))}</span>
+        </div>
+        <p class="p-desc">{esc(project.get('descricao'))}</p>
+        <div class="tags">
+          {destaque}
+          {tags}
+        </div>
+      </div>
+    </article>"""
+
+
+# =========================
+# SELEÇÃO (mesmas regras do main.js)
+# =========================
+def featured_certs(certs: list) -> list:
+    featured = [c for c in certs if c.get("destaque") is True]
+    return featured or certs[:3]
+
+
+def only_featured(items: list) -> list:
+    return [x for x in items if x.get("destaque") is True]
+
+
+def all_items(items: list) -> list:
+    return items
+
+
+# (página, id do container, catálogo, seleção, template)
+TARGETS = [
+    ("index.html", "featuredProjectsGrid", "projetos", only_featured, featured_project_card),
+    ("index.html", "featuredDiplomasGrid", "diplomas", only_featured, featured_diploma_card),
+    ("index.html", "featuredCertsGrid", "certificados", featured_certs, featured_cert_card),
+    ("certificados.html", "certsGrid", "certificados", all_items, cert_card),
+    ("diplomas.html", "diplomasGrid", "diplomas", all_items, diploma_card),
+    ("projetos.html", "projectsGrid", "projetos", all_items, project_card),
+]
+
+
+# =========================
+# INJEÇÃO NO HTML
+# =========================
+def find_container(html: str, element_id: str) -> tuple | None:
+    """
+    Localiza o elemento pelo id: (início da tag de abertura, fim da tag de
+    abertura, início da tag de fechamento). Conta aninhamento da mesma tag.
+    """
+    m = re.search(rf'<(\w+)\b[^>]*\bid="{re.escape(element_id)}"[^>]*>', html)
+    if not m:
+        return None
+    tag = m.group(1)
+    token_re = re.compile(rf"<(/?){tag}\b[^>]*>", re.I)
+    depth, pos = 1, m.end()
+    while depth:
+        t = token_re.search(html, pos)
+        if not t:
+            return None
+        depth += -1 if t.group(1) else 1
+        pos = t.end()
+    return m.start(), m.end(), t.start()
+
+
+def inject(html: str, element_id: str, inner: str, digest: str) -> tuple:
+    """
+    Troca o conteúdo do container; devolve (html, mudou).
+    Sem cards (`inner` vazio), o container volta a ser montado pelo main.js,
+    que mostra a mensagem de "nenhum item".
+    """
+    found = find_container(html, element_id)
+    if not found:
+        raise ValueError(f"container #{element_id} não encontrado")
+    start, open_end, close_start = found
+
+    marker = f"<!-- prerender:{element_id} {digest} -->"
+    if marker in html[open_end:close_start]:
+        return html, False
+
+    open_tag = re.sub(r'\s+data-prerendered="true"', "", html[start:open_end])
+    indent = re.search(r"([ \t]*)$", html[:start]).group(1)
+    if inner:
+        open_tag = open_tag[:-1].rstrip() + ' data-prerendered="true">'
+        body = f"\n{indent}  {marker}{inner}\n{indent}  <!-- /prerender:{element_id} -->\n{indent}"
+    else:
+        body = f"\n{indent}  {marker}\n{indent}  <!-- /prerender:{element_id} -->\n{indent}"
+    new_html = html[:start] + open_tag + body + html[close_start:]
+    return new_html, new_html != html
+
+
+def load_catalog(name: str) -> tuple:
+    with open(CATALOGS[name], "rb") as f:
+        raw = f.read()
+    return json.loads(raw), hashlib.sha1(raw).hexdigest()
+
+
+def prerender(check: bool = False) -> list:
+    """Atualiza os blocos pré-renderizados; devolve as páginas alteradas (ou desatualizadas)."""
+    catalogs = {}
+    pages = {}
+    changed = set()
+
+    for page, element_id, catalog, select, template in TARGETS:
+        if catalog not in catalogs:
+            catalogs[catalog] = load_catalog(catalog)
+        items, catalog_hash = catalogs[catalog]
+
+        if page not in pages:
+            with open(os.path.join(SITE_ROOT, page), "r", encoding="utf-8") as f:
+                pages[page] = f.read()
+
+        digest = hashlib.sha1(f"{TEMPLATE_VERSION}:{element_id}:{catalog_hash}".encode()).hexdigest()[:12]
+        inner = "".join(template(item) for item in select(items))
+        pages[page], did_change = inject(pages[page], element_id, inner, digest)
+        if did_change:
+            changed.add(page)
+            print(f"  ✓ {page} #{element_id}: {len(select(items))} card(s)")
+        else:
+            print(f"  ↻ {page} #{element_id}: sem mudanças")
+
+    if not check:
+        for page in changed:
+            path = os.path.join(SITE_ROOT, page)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(pages[page])
+            os.replace(path + ".tmp", path)
+
+    return sorted(changed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-renderiza os cards dos catálogos nos HTMLs")
+    parser.add_argument("--check", action="store_true", help="não grava; sai com 1 se algo estiver desatualizado")
+    args = parser.parse_args(argv)
+
+    print(f"\n🧱 Pré-renderizando cards{' (verificação)' if args.check else ''}")
+    changed = prerender(check=args.check)
+    if args.check:
+        print(f"{'⚠️' if changed else '✅'} {len(changed)} página(s) desatualizada(s)")
+        return 1 if changed else 0
+    print(f"✅ {len(changed)} página(s) atualizada(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,483 @@
+"""
+Certificados relacionados (pré-calculados)
+==========================================
+
+Calcula, no build, os k itens mais parecidos de cada pasta do catálogo e grava
+em data/relacionados.json ({id: [ids]}), que o modal do site só consulta.
+
+Cada item vira um vetor TF-IDF com competências, título, categoria e
+descrições, cada campo com seu peso. A matriz é esparsa (CSR em arrays NumPy)
+e a similaridade (cosseno) sai em lotes de linhas, X[lote] @ X.T, sem laço
+por item: os termos comuns numa multiplicação densa e os raros num único
+np.bincount sobre as listas invertidas.
+
+Incremental: o estado em data/.cache/ guarda vocabulário, IDF, a assinatura
+de cada item, a matriz e o top-k com as notas. Numa nova execução só os
+itens alterados são tokenizados e só se recalcula:
+- as linhas dos itens novos/alterados;
+- as linhas cujo top-k apontava para um item alterado/removido;
+- as demais só recebem os alterados como candidatos (um lote X[alterados] @ X.T).
+O vocabulário/IDF ficam congelados entre recálculos completos; se mais de
+FRACAO_INCREMENTAL dos itens mudar (ou com --completo), recalcula tudo.
+
+Limites medidos (--bench 5000, um núcleo, NumPy/OpenBLAS): recálculo
+completo ~2,1 s e incremental com 10 alterados ~0,3 s; o catálogo real
+(dezenas de itens) leva ~20 ms. No completo, ~0,5 s é a tokenização em
+Python (um Counter por item) e ~0,6 s vetorização/vocabulário; o resto é
+o cosseno de todos contra todos, O(n²): ~0,8 s para os 25M de notas de S
+e ~0,2 s para o argpartition do top-k. S sai em float32 e em lotes de no
+máximo CELULAS_LOTE células, então a memória não cresce com n², só o tempo.
+
+Uso:
+    python data/relacionados.py                 # atualiza data/relacionados.json
+    python data/relacionados.py --completo      # ignora o estado e recalcula tudo
+    python data/relacionados.py --bench 5000    # benchmark com itens sintéticos
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import hashlib
+import argparse
+from functools import lru_cache
+from itertools import chain, repeat
+from collections import Counter
+
+import numpy as np
+
+from classificador import normalizar, tokenizar
+from comum import salvar_json
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_FILE = os.path.join(SCRIPT_DIR, "certificados.json")
+OUTPUT_FILE = os.path.join(SCRIPT_DIR, "relacionados.json")
+ESTADO_FILE = os.path.join(SCRIPT_DIR, ".cache", "relacionados.json")  # + .npz com a matriz
+
+# Sobe ao mudar pesos, tokens ou a fórmula: invalida o estado salvo
+VERSAO = 1
+
+TOP_K = 4
+NOTA_MINIMA = 0.08          # abaixo disso não é "relacionado", mesmo sobrando vaga
+TRABALHO_LOTE = 4_000_000   # produtos por lote (limita a memória do bincount)
+CELULAS_LOTE = 2_000_000    # células de S por lote (linhas do lote x n), em float32
+FRACAO_DENSA = 0.02         # termos em 2%+ dos itens vão para a parte densa (BLAS)
+FRACAO_INCREMENTAL = 0.25   # acima disso de itens alterados, recalcula tudo
+
+# Pesos relativos (inteiros: o texto do campo entra repetido; o cosseno não muda com a escala)
+PESOS = {
+    "competencia": 6,   # a competência inteira, como um termo só
+    "competencias": 3,  # palavras das competências
+    "titulo": 4,
+    "categoria": 3,
+    "descricao": 2,
+    "descricaoCompleta": 1,
+}
+
+STOPWORDS = {
+    "com", "como", "das", "dos", "para", "pela", "pelo", "por", "que", "uma", "the", "and",
+    "for", "with", "sobre", "entre", "mais", "seu", "sua", "seus", "suas", "nos", "nas",
+    "aos", "sao", "ser", "esta", "este", "essa", "esse", "foco", "longo", "diferentes",
+    "certificado", "certificados", "certificacao", "formacao", "curso", "cursos", "alura",
+}
+
+
+# =========================
+# TERMOS E VETORES
+# =========================
+CAMPOS = ("competencias", "titulo", "categoria", "descricao", "descricaoCompleta")
+
+# Tudo que não é [a-z0-9] vira espaço (bytes.translate: bem mais rápido que regex)
+_SEPARADORES = bytes(c if 48 <= c <= 57 or 97 <= c <= 122 else 32 for c in range(256))
+
+
+def assinatura(item: dict) -> str:
+    """Hash dos campos que entram no vetor (não precisa tokenizar)."""
+    dados = json.dumps([item.get(c) for c in CAMPOS], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(dados.encode("utf-8")).hexdigest()
+
+
+def palavras(texto: str) -> list:
+    """Palavras de 3+ caracteres [a-z0-9] do texto normalizado."""
+    ascii_ = normalizar(texto).encode("ascii").translate(_SEPARADORES).decode("ascii")
+    return [p for p in ascii_.split() if len(p) >= 3]
+
+
+@lru_cache(maxsize=None)
+def termo_inteiro(texto: str) -> str:
+    """Competência/categoria como um termo só (repetem muito entre itens)."""
+    return " ".join(tokenizar(texto))
+
+
+def termos(item: dict) -> dict:
+    """{termo: peso} do item (pesos dos campos somados)."""
+    comps = item.get("competencias") or []
+    campos = [(" ".join(comps), PESOS["competencias"])]
+    campos += [(item.get(c), PESOS[c]) for c in ("titulo", "descricao", "descricaoCompleta")]
+    lista = []
+    for texto, peso in campos:
+        lista += palavras(texto or "") * peso
+
+    pesos = Counter(lista)
+    for p in STOPWORDS.intersection(pesos):
+        del pesos[p]
+    for comp in comps:
+        chave = termo_inteiro(comp)
+        if chave:
+            pesos["c:" + chave] += PESOS["competencia"]
+    if item.get("categoria"):
+        pesos["cat:" + termo_inteiro(item["categoria"])] += PESOS["categoria"]
+    return pesos
+
+
+def montar_vocabulario(docs: list) -> dict:
+    """
+    Vocabulário = termos presentes em 2+ itens (um termo de um item só nunca
+    contribui para a similaridade, só para a norma). Retorna o estado do IDF.
+    """
+    df = Counter(chain.from_iterable(docs))
+    n = len(docs)
+    vocab = sorted(t for t, c in df.items() if c > 1)
+    return {
+        "n": n,
+        "vocab": vocab,
+        "idf": [math.log((1 + n) / (1 + df[t])) + 1 for t in vocab],
+        "idf_raro": math.log((1 + n) / 2) + 1,
+    }
+
+
+def vetorizar(docs: list, idf_estado: dict) -> dict:
+    """Matriz CSR {indptr, cols, vals} TF-IDF dos docs, linhas com norma 1."""
+    indice = {t: i for i, t in enumerate(idf_estado["vocab"])}
+    idf = np.asarray(idf_estado["idf"], dtype=np.float64)
+    idf_raro = idf_estado["idf_raro"]
+
+    tam = np.fromiter((len(p) for p in docs), dtype=np.int64, count=len(docs))
+    todos = list(chain.from_iterable(docs))
+    cols = np.fromiter(map(indice.get, todos, repeat(-1)), dtype=np.int64, count=len(todos))
+    vals = np.fromiter(chain.from_iterable(p.values() for p in docs), dtype=np.float64, count=len(todos))
+    linha = np.repeat(np.arange(len(docs)), tam)
+
+    # Termos fora do vocabulário só entram na norma
+    fora = cols < 0
+    resto = np.bincount(linha[fora], weights=(vals[fora] * idf_raro) ** 2, minlength=len(docs))
+    cols, vals, linha = cols[~fora], vals[~fora], linha[~fora]
+    indptr = np.r_[0, np.cumsum(np.bincount(linha, minlength=len(docs)))]
+    vals = vals * idf[cols]
+    norma = np.sqrt(np.bincount(linha, weights=vals ** 2, minlength=len(docs)) + resto)
+    norma[norma == 0] = 1
+    return {"indptr": indptr, "cols": cols, "vals": vals / norma[linha]}
+
+
+def linhas_de(M: dict, linhas) -> dict:
+    """Submatriz CSR só com as linhas pedidas (na ordem dada)."""
+    linhas = np.asarray(linhas, dtype=np.int64)
+    ini, fim = M["indptr"][linhas], M["indptr"][linhas + 1]
+    tam = fim - ini
+    idx = np.repeat(ini - np.cumsum(np.r_[0, tam[:-1]]), tam) + np.arange(tam.sum())
+    return {"indptr": np.r_[0, np.cumsum(tam)], "cols": M["cols"][idx], "vals": M["vals"][idx]}
+
+
+def empilhar(blocos: list) -> dict:
+    """Concatena matrizes CSR (uma embaixo da outra)."""
+    indptr, desloc = [np.zeros(1, dtype=np.int64)], 0
+    for B in blocos:
+        indptr.append(B["indptr"][1:] + desloc)
+        desloc += len(B["cols"])
+    return {
+        "indptr": np.concatenate(indptr),
+        "cols": np.concatenate([B["cols"] for B in blocos]),
+        "vals": np.concatenate([B["vals"] for B in blocos]),
+    }
+
+
+def preparar(M: dict, n_termos: int) -> dict:
+    """
+    Separa as colunas da matriz para o produto X @ X.T:
+    - termos comuns (df >= FRACAO_DENSA * n) numa matriz densa, que vai para o BLAS;
+    - os demais em listas invertidas (CSC), para o bincount (custo ~ soma de df²).
+    """
+    n = len(M["indptr"]) - 1
+    linha = np.repeat(np.arange(n), np.diff(M["indptr"]))
+    df = np.bincount(M["cols"], minlength=n_termos)
+    densas = np.flatnonzero(df >= max(2, FRACAO_DENSA * n))
+    col_densa = np.full(n_termos, -1, dtype=np.int64)
+    col_densa[densas] = np.arange(len(densas))
+
+    eh_densa = col_densa[M["cols"]] >= 0
+    X = np.zeros((n, len(densas)), dtype=np.float32)
+    X[linha[eh_densa], col_densa[M["cols"][eh_densa]]] = M["vals"][eh_densa]
+
+    rara = ~eh_densa
+    esparsa = {
+        "indptr": np.r_[0, np.cumsum(np.bincount(linha[rara], minlength=n))],
+        "cols": M["cols"][rara],
+        "vals": M["vals"][rara],
+    }
+    ordem = np.argsort(esparsa["cols"], kind="stable")
+    df_rara = np.where(col_densa >= 0, 0, df)
+    return {
+        "n": n,
+        "densa": X,
+        "esparsa": esparsa,
+        "df": df_rara,
+        "ptr": np.r_[0, np.cumsum(df_rara)],
+        "itens": linha[rara][ordem],
+        "vals": esparsa["vals"][ordem],
+    }
+
+
+def similaridades(idx: dict, linhas: np.ndarray):
+    """
+    Gera (lote, S) com S = X[lote] @ X.T denso (len(lote) x n, float32): parte
+    densa no BLAS + parte esparsa num único bincount sobre as listas invertidas,
+    com os lotes cortados para caber em TRABALHO_LOTE produtos esparsos e em
+    CELULAS_LOTE células de S.
+    """
+    n, E = idx["n"], idx["esparsa"]
+    if not len(linhas):
+        return
+    trabalho = np.bincount(
+        np.repeat(np.arange(n), np.diff(E["indptr"])), weights=idx["df"][E["cols"]], minlength=n
+    )[linhas]
+    acumulado = np.cumsum(trabalho)
+    max_linhas = max(1, CELULAS_LOTE // n)
+
+    a = 0
+    while a < len(linhas):
+        base = acumulado[a - 1] if a else 0
+        b = max(a + 1, int(np.searchsorted(acumulado, base + TRABALHO_LOTE, side="right")))
+        b = min(b, a + max_linhas)
+        lote = linhas[a:b]
+        sub = linhas_de(E, lote)
+        local = np.repeat(np.arange(len(lote)), np.diff(sub["indptr"]))
+        tam = idx["df"][sub["cols"]]
+        pos = np.repeat(idx["ptr"][sub["cols"]] - np.cumsum(np.r_[0, tam[:-1]]), tam) + np.arange(tam.sum())
+        chave = np.repeat(local * n, tam) + idx["itens"][pos]
+        peso = np.repeat(sub["vals"], tam) * idx["vals"][pos]
+        S = idx["densa"][lote] @ idx["densa"].T
+        S += np.bincount(chave, weights=peso, minlength=len(lote) * n).reshape(len(lote), n)
+        S[np.arange(len(lote)), lote] = -1  # o próprio item
+        yield lote, S
+        a = b
+
+
+def top_k(idx: dict, linhas, k: int) -> dict:
+    """{linha: [(coluna, nota)]} dos k mais similares (nota >= NOTA_MINIMA)."""
+    linhas = np.asarray(linhas, dtype=np.int64)
+    kk = min(k, idx["n"] - 1)
+    if kk <= 0:
+        return {int(r): [] for r in linhas}
+    out = {}
+    for lote, S in similaridades(idx, linhas):
+        cand = np.argpartition(S, -kk, axis=1)[:, -kk:]  # sem copiar -S
+        notas = np.take_along_axis(S, cand, axis=1)
+        ordem = np.argsort(-notas, axis=1, kind="stable")
+        cand = np.take_along_axis(cand, ordem, axis=1).tolist()
+        notas = np.take_along_axis(notas, ordem, axis=1).astype(np.float64).tolist()
+        for r, cs, ns in zip(lote.tolist(), cand, notas):
+            out[r] = [(c, s) for c, s in zip(cs, ns) if s >= NOTA_MINIMA]
+    return out
+
+
+# =========================
+# CÁLCULO (COMPLETO / INCREMENTAL)
+# =========================
+def calcular(itens: list, estado: dict | None = None, matriz: dict | None = None,
+             k: int = TOP_K, completo: bool = False) -> tuple:
+    """
+    Retorna (estado, matriz, linhas recalculadas). O top-k fica em
+    estado["top"] = {id: [[id, nota], ...]}; a matriz segue a ordem estado["ids"].
+    """
+    ids = [it["id"] for it in itens]
+    assin = {it["id"]: assinatura(it) for it in itens}
+    pos = {i: r for r, i in enumerate(ids)}
+
+    valido = (
+        not completo and estado and matriz is not None
+        and estado.get("versao") == VERSAO and estado.get("k") == k
+        and len(estado.get("ids", [])) == len(matriz["indptr"]) - 1
+    )
+    if valido:
+        antigas = estado["assinaturas"]
+        mudados = {i for i in ids if antigas.get(i) != assin[i]}
+        removidos = set(antigas) - set(pos)
+        valido = len(mudados) + len(removidos) <= FRACAO_INCREMENTAL * max(len(ids), 1)
+
+    if not valido:
+        docs = [termos(it) for it in itens]
+        idf_estado = montar_vocabulario(docs)
+        M = vetorizar(docs, idf_estado)
+        res = top_k(preparar(M, len(idf_estado["vocab"])), np.arange(len(ids)), k)
+        top = {ids[r]: [[ids[c], s] for c, s in lst] for r, lst in res.items()}
+        novo = {"versao": VERSAO, "k": k, "idf": idf_estado, "ids": ids, "assinaturas": assin, "top": top}
+        return novo, M, len(ids)
+
+    top = {i: lst for i, lst in estado["top"].items() if i in pos}
+    novo = {**estado, "ids": ids, "assinaturas": assin, "top": top}
+    if not mudados and not removidos and ids == estado["ids"]:
+        return novo, matriz, 0
+
+    # Matriz na ordem atual: linhas antigas reaproveitadas, só os alterados vetorizados
+    idf_estado = estado["idf"]
+    pos_antiga = {i: r for r, i in enumerate(estado["ids"])}
+    alterados = [it for it in itens if it["id"] in mudados]
+    A = vetorizar([termos(it) for it in alterados], idf_estado)
+    pos_alterado = {it["id"]: r for r, it in enumerate(alterados)}
+    origem = np.asarray([pos_antiga[i] if i not in mudados else -1 for i in ids], dtype=np.int64)
+    blocos, r = [], 0
+    while r < len(ids):  # trechos contíguos da mesma origem viram um bloco só
+        s = r
+        if origem[r] >= 0:
+            while s + 1 < len(ids) and origem[s + 1] >= 0:
+                s += 1
+            blocos.append(linhas_de(matriz, origem[r:s + 1]))
+        else:
+            while s + 1 < len(ids) and origem[s + 1] < 0:
+                s += 1
+            blocos.append(linhas_de(A, [pos_alterado[i] for i in ids[r:s + 1]]))
+        r = s + 1
+    M = empilhar(blocos)
+    idx = preparar(M, len(idf_estado["vocab"]))
+
+    afetados = set(mudados)
+    tocados = mudados | removidos
+    for i, lst in top.items():
+        if any(j in tocados for j, _ in lst):
+            afetados.add(i)
+
+    # Demais linhas: os itens alterados entram como candidatos se passarem do k-ésimo
+    C = np.asarray(sorted(pos[i] for i in mudados), dtype=np.int64)
+    for lote, S in similaridades(idx, C):  # (alterados x todos) == colunas, por simetria
+        for r in np.flatnonzero(S.max(axis=0) >= NOTA_MINIMA):
+            i = ids[r]
+            if i in afetados:
+                continue
+            atual = top.get(i, [])
+            corte = atual[-1][1] if len(atual) >= k else NOTA_MINIMA
+            novos = [[ids[lote[j]], float(S[j, r])] for j in np.flatnonzero(S[:, r] >= corte)]
+            if novos:
+                top[i] = sorted(atual + novos, key=lambda x: -x[1])[:k]
+
+    linhas = np.asarray(sorted(pos[i] for i in afetados), dtype=np.int64)
+    for r, lst in top_k(idx, linhas, k).items():
+        top[ids[r]] = [[ids[c], s] for c, s in lst]
+
+    return novo, M, len(linhas)
+
+
+# =========================
+# ARQUIVOS
+# =========================
+def carregar_estado(path: str = ESTADO_FILE) -> tuple:
+    """(estado, matriz) salvos, ou (None, None)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            estado = json.load(f)
+        with np.load(os.path.splitext(path)[0] + ".npz") as npz:
+            matriz = {c: npz[c] for c in ("indptr", "cols", "vals")}
+        return estado, matriz
+    except (FileNotFoundError, ValueError, KeyError):
+        return None, None
+
+
+def salvar_estado(path: str, estado: dict, matriz: dict):
+    npz = os.path.splitext(path)[0] + ".npz"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(npz + ".tmp", "wb") as f:
+        np.savez(f, **matriz)
+    os.replace(npz + ".tmp", npz)
+    salvar_json(path, estado)
+
+
+def atualizar(catalogo: str = CATALOG_FILE, saida: str = OUTPUT_FILE, estado_path: str = ESTADO_FILE,
+              k: int = TOP_K, completo: bool = False) -> int:
+    """Atualiza o arquivo de relacionados de um catálogo. Retorna as linhas recalculadas."""
+    inicio = time.perf_counter()
+    with open(catalogo, "r", encoding="utf-8") as f:
+        itens = [it for it in json.load(f) if it.get("id")]
+
+    estado, matriz = carregar_estado(estado_path)
+    estado, matriz, recalculadas = calcular(itens, estado, matriz, k, completo)
+    if recalculadas or estado["ids"] != [it["id"] for it in itens]:
+        salvar_estado(estado_path, estado, matriz)
+
+    relacionados = {i: [j for j, _ in lst] for i, lst in sorted(estado["top"].items()) if lst}
+    try:
+        with open(saida, "r", encoding="utf-8") as f:
+            mudou = json.load(f) != relacionados
+    except (FileNotFoundError, json.JSONDecodeError):
+        mudou = True
+    if mudou:
+        salvar_json(saida, relacionados, indent=2)
+
+    dt = time.perf_counter() - inicio
+    print(f"🔗 Relacionados: {recalculadas}/{len(itens)} linha(s) recalculada(s) em {dt * 1000:.0f} ms"
+          + ("" if mudou else " (sem mudanças)"))
+    return recalculadas
+
+
+# =========================
+# BENCHMARK
+# =========================
+def benchmark(n: int = 5000, seed: int = 42):
+    """Itens sintéticos com vocabulário em Zipf (como texto de verdade)."""
+    rnd = random.Random(seed)
+    vocab = [f"termo{i}" for i in range(20000)]
+    pesos_zipf = [1 / (i + 1) for i in range(len(vocab))]
+    comps = [f"competencia {i}" for i in range(1500)]
+    pesos_comp = [1 / (i + 1) for i in range(len(comps))]
+    cats = ["Dados", "Gestão", "DevOps", "Front-end", "Back-end", "Cloud", "Design", "Idiomas"]
+
+    def texto(qtd):
+        return " ".join(rnd.choices(vocab, pesos_zipf, k=qtd))
+
+    def item(i):
+        return {
+            "id": f"item-{i}",
+            "titulo": texto(5),
+            "categoria": rnd.choice(cats),
+            "competencias": list(dict.fromkeys(rnd.choices(comps, pesos_comp, k=8))),
+            "descricao": texto(20),
+            "descricaoCompleta": texto(120),
+        }
+
+    itens = [item(i) for i in range(n)]
+    t = time.perf_counter()
+    estado, matriz, _ = calcular(itens)
+    completo = time.perf_counter() - t
+
+    for i in rnd.sample(range(n), 10):
+        itens[i] = {**item(n + i), "id": itens[i]["id"]}
+    t = time.perf_counter()
+    _, _, recalculadas = calcular(itens, estado, matriz)
+    incremental = time.perf_counter() - t
+
+    print(f"⏱️  {n} itens, vocabulário {len(estado['idf']['vocab'])}: completo {completo * 1000:.0f} ms, "
+          f"10 alterados {incremental * 1000:.0f} ms ({recalculadas} linha(s) recalculada(s))")
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pré-calcula os certificados relacionados")
+    parser.add_argument("--catalogo", default=CATALOG_FILE)
+    parser.add_argument("--saida", default=OUTPUT_FILE)
+    parser.add_argument("-k", type=int, default=TOP_K, help=f"relacionados por item (padrão: {TOP_K})")
+    parser.add_argument("--completo", action="store_true", help="ignora o estado e recalcula tudo")
+    parser.add_argument("--bench", type=int, metavar="N", help="benchmark com N itens sintéticos")
+    args = parser.parse_args(argv)
+
+    if args.bench:
+        benchmark(args.bench)
+        return 0
+    atualizar(args.catalogo, args.saida, k=args.k, completo=args.completo)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
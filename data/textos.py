@@ -0,0 +1,140 @@
+"""
+Cache do texto extraído dos PDFs (SQLite)
+=========================================
+
+Guarda o texto de cada página dos PDFs, comprimido (zlib), indexado pelo SHA
+do blob e pela versão do extrator de texto. Com isso as regras de campos
+(ano, duração, instituição...) podem ser reaplicadas só sobre o texto em
+cache, sem baixar nem abrir PDF nenhum (extrator_certificados.py --reextrair).
+
+Trocar a versão do extrator (nova versão do pypdf, outro método de extração)
+invalida as entradas antigas naturalmente; `limpar` remove as que sobraram.
+O OCR dos PDFs sem camada de texto fica aqui também, com versão própria
+(extrator_certificados.OCR_VERSAO): inclua-a no --manter para não refazê-lo.
+
+Uso:
+    python data/textos.py stats
+    python data/textos.py limpar --manter <versão> [--manter ocr-tesseract/1]
+"""
+
+import os
+import sys
+import json
+import zlib
+import sqlite3
+import argparse
+from datetime import datetime
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_FILE = os.path.join(SCRIPT_DIR, ".cache", "textos.sqlite")
+
+NIVEL_COMPRESSAO = 9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS textos (
+    blob_sha    TEXT NOT NULL,
+    versao      TEXT NOT NULL,
+    paginas     BLOB NOT NULL,
+    tamanho     INTEGER NOT NULL,
+    criado      TEXT,
+    PRIMARY KEY (blob_sha, versao)
+);
+"""
+
+
+def conectar(path: str | None = None) -> sqlite3.Connection:
+    path = path or DB_FILE
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def conectar_leitura(path: str | None = None) -> sqlite3.Connection | None:
+    """Abre o cache só para leitura (ex.: dry-run); None se ele ainda não existe."""
+    path = path or DB_FILE
+    if not os.path.exists(path):
+        return None
+    # Sem -wal pendente o arquivo está completo: immutable não cria -wal/-shm
+    imutavel = "" if os.path.exists(path + "-wal") else "&immutable=1"
+    return sqlite3.connect(f"file:{path}?mode=ro{imutavel}", uri=True)
+
+
+def comprimir(paginas: list) -> bytes:
+    return zlib.compress(json.dumps(paginas, ensure_ascii=False).encode("utf-8"), NIVEL_COMPRESSAO)
+
+
+def descomprimir(dados: bytes) -> list:
+    return json.loads(zlib.decompress(dados).decode("utf-8"))
+
+
+def obter(conn, blob_sha: str, versao: str) -> list | None:
+    """Texto por página do PDF, ou None se não estiver em cache para esta versão."""
+    row = conn.execute(
+        "SELECT paginas FROM textos WHERE blob_sha = ? AND versao = ?", (blob_sha, versao)
+    ).fetchone()
+    return descomprimir(row[0]) if row else None
+
+
+def obter_varios(conn, shas, versao: str) -> dict:
+    """{sha: páginas} dos SHAs em cache (uma consulta por lote de 500)."""
+    shas = list(dict.fromkeys(s for s in shas if s))
+    out = {}
+    for i in range(0, len(shas), 500):
+        lote = shas[i:i + 500]
+        marcadores = ",".join("?" * len(lote))
+        for sha, dados in conn.execute(
+            f"SELECT blob_sha, paginas FROM textos WHERE versao = ? AND blob_sha IN ({marcadores})",
+            [versao, *lote],
+        ):
+            out[sha] = descomprimir(dados)
+    return out
+
+
+def gravar(conn, blob_sha: str, versao: str, paginas: list):
+    conn.execute(
+        "INSERT OR REPLACE INTO textos (blob_sha, versao, paginas, tamanho, criado) VALUES (?, ?, ?, ?, ?)",
+        (blob_sha, versao, comprimir(paginas), sum(len(p) for p in paginas), datetime.now().isoformat()),
+    )
+
+
+def limpar(conn, manter) -> int:
+    """Remove entradas de outras versões do extrator (`manter`: uma versão ou uma lista)."""
+    versoes = [manter] if isinstance(manter, str) else list(manter)
+    marcadores = ", ".join("?" * len(versoes))
+    with conn:
+        return conn.execute(f"DELETE FROM textos WHERE versao NOT IN ({marcadores})", versoes).rowcount
+
+
+# =========================
+# MAIN
+# =========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache do texto extraído dos PDFs")
+    parser.add_argument("comando", choices=["stats", "limpar"])
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--manter", action="append",
+                        help="versão do extrator a manter (limpar; pode repetir, ex. a do OCR)")
+    args = parser.parse_args(argv)
+
+    conn = conectar(args.db)
+    if args.comando == "stats":
+        for versao, n, texto, comprimido in conn.execute(
+            "SELECT versao, COUNT(*), SUM(tamanho), SUM(LENGTH(paginas)) FROM textos GROUP BY versao ORDER BY versao"
+        ):
+            print(f"  {n:>5} PDF(s)  {texto / 1024:>9.1f} KB de texto -> {comprimido / 1024:>8.1f} KB  [{versao}]")
+        total = conn.execute("SELECT COUNT(*) FROM textos").fetchone()[0]
+        print(f"📊 {total} entrada(s) em {args.db}")
+    elif args.comando == "limpar":
+        if not args.manter:
+            print("❌ Informe --manter <versão>")
+            return 1
+        print(f"🧹 {limpar(conn, args.manter)} entrada(s) removida(s)")
+    conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""
+Verificador de integridade (offline) dos catálogos
+==================================================
+
+Cruza certificados.json, diplomas.json e projetos.json, numa passada só, com:
+
+- a árvore local de assets: todo caminho "assets/..." citado precisa existir
+- a listagem em cache dos repositórios de origem: todo link do GitHub
+  (blob/tree/raw) precisa apontar para um arquivo/pasta que existe lá
+- arquivos órfãos: imagens nas pastas de preview que nada referencia
+
+Nenhum link é testado por HTTP. A listagem de cada repositório vem de uma
+única chamada à Git Trees API (--atualizar-arvores) ou de um clone local
+(--local-repo), e fica em data/.cache/arvores/. Tudo vira conjunto em memória,
+então a verificação é O(referências) com lookups O(1).
+
+Uso:
+    python data/verificar.py
+    python data/verificar.py --atualizar-arvores
+    python data/verificar.py --local-repo guicorrea93/certificados=../certificados
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+from urllib.parse import quote, unquote
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_ROOT = os.path.dirname(SCRIPT_DIR)
+TREES_DIR = os.path.join(SCRIPT_DIR, ".cache", "arvores")
+
+CATALOGOS = {
+    "certificados": os.path.join(SCRIPT_DIR, "certificados.json"),
+    "diplomas": os.path.join(SCRIPT_DIR, "diplomas.json"),
+    "projetos": os.path.join(SCRIPT_DIR, "projetos.json"),
+}
+
+# Pastas geridas pelos catálogos: o que estiver aqui sem referência é órfão
+PASTAS_PREVIEW = [
+    "assets/img/certificados",
+    "assets/img/diplomas",
+    "assets/img/projetos",
+]
+EXTENSOES_IMG = {".png", ".jpg", ".jpeg", ".webp", ".avif"}
+
+# Arquivos do site que também citam imagens (placeholders do main.js etc.)
+FONTES_SITE = ["*.html", "assets/js", "assets/css"]
+
+_GITHUB_RE = re.compile(
+    r"^https://(?:github\.com/(?P<o1>[^/]+)/(?P<r1>[^/]+)/(?P<kind>blob|tree)/(?P<ref1>[^/]+)"
+    r"|raw\.githubusercontent\.com/(?P<o2>[^/]+)/(?P<r2>[^/]+)/(?P<ref2>[^/]+))"
+    r"(?:/(?P<path>.*?))?/?$"
+)
+REF_PREFIXES = ("assets/", "https://")
+
+_ASSET_REF_RE = re.compile(r"""assets/img/[^"'`()\s<>]+""")
+
+
+# =========================
+# ÁRVORES DOS REPOSITÓRIOS
+# =========================
+def tree_file(owner: str, repo: str) -> str:
+    return os.path.join(TREES_DIR, f"{owner}__{repo}.json")
+
+
+def save_tree(owner: str, repo: str, data: dict):
+    os.makedirs(TREES_DIR, exist_ok=True)
+    path = tree_file(owner, repo)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(path + ".tmp", path)
+
+
+def fetch_tree(owner: str, repo: str, ref: str) -> dict:
+    """Uma chamada à Git Trees API (recursiva) para o repositório inteiro."""
+    import requests
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    api = os.getenv("GITHUB_API_BASE", "https://api.github.com")
+    headers = {"Accept": "application/vnd.github+json"}
+    if os.getenv("GITHUB_TOKEN"):
+        headers["Authorization"] = f"Bearer {os.getenv('GITHUB_TOKEN')}"
+    r = requests.get(f"{api}/repos/{owner}/{repo}/git/trees/{ref}", params={"recursive": "1"},
+                     headers=headers, timeout=60)
+    r.raise_for_status()
+    data = r.json()
+    if data.get("truncated"):
+        print(f"⚠️  Listagem de {owner}/{repo} veio truncada pela API; use --local-repo")
+    return {
+        "ref": ref,
+        "sha": data.get("sha"),
+        "blobs": sorted(e["path"] for e in data.get("tree", []) if e.get("type") == "blob"),
+        "trees": sorted(e["path"] for e in data.get("tree", []) if e.get("type") == "tree"),
+    }
+
+
+def local_tree(repo_dir: str, ref: str) -> dict:
+    """Mesma listagem a partir de um clone local (git ls-tree)."""
+    out = subprocess.run(
+        ["git", "-C", repo_dir, "ls-tree", "-r", "-t", "-z", "--full-tree", ref],
+        check=True, capture_output=True,
+    ).stdout.decode("utf-8")
+    blobs, trees = [], []
+    for entry in filter(None, out.split("\0")):
+        meta, path = entry.split("\t", 1)
+        (trees if meta.split()[1] == "tree" else blobs).append(path)
+    sha = subprocess.run(["git", "-C", repo_dir, "rev-parse", ref],
+                         check=True, capture_output=True, text=True).stdout.strip()
+    return {"ref": ref, "sha": sha, "blobs": sorted(blobs), "trees": sorted(trees)}
+
+
+def load_trees() -> dict:
+    """{(owner, repo): {"blobs": set, "trees": set, "ref": ...}} das listagens em cache."""
+    trees = {}
+    if not os.path.isdir(TREES_DIR):
+        return trees
+    for name in os.listdir(TREES_DIR):
+        if not name.endswith(".json") or "__" not in name:
+            continue
+        owner, repo = name[:-5].split("__", 1)
+        with open(os.path.join(TREES_DIR, name), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        trees[(owner.lower(), repo.lower())] = index_tree(data)
+    return trees
+
+
+def index_tree(data: dict) -> dict:
+    """
+    Conjuntos para lookup O(1). Os links do extrator usam quote(path), então
+    as formas "quotadas" casam direto, sem unquote por link.
+    """
+    blobs, trees = set(data.get("blobs", [])), set(data.get("trees", []))
+    return {
+        "ref": data.get("ref"),
+        "blobs": blobs,
+        "trees": trees,
+        "blobs_q": {quote(p) for p in blobs},
+        "trees_q": {quote(p) for p in trees},
+    }
+
+
+# =========================
+# REFERÊNCIAS
+# =========================
+def iter_refs(obj, path=None):
+    """
+    (caminho, valor) das strings que são referências ("assets/..." ou
+    "https://..."). O caminho é uma lista encadeada (pai, chave), só formatada
+    quando há algo a reportar.
+    """
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, list):
+        items = enumerate(obj)
+    else:
+        return
+    for k, v in items:
+        if isinstance(v, str):
+            if v.startswith(REF_PREFIXES):
+                yield (path, k), v
+        elif isinstance(v, (dict, list)):
+            yield from iter_refs(v, (path, k))
+
+
+def format_path(path) -> str:
+    parts = []
+    while path:
+        path, k = path
+        parts.append(f"[{k}]" if isinstance(k, int) else f".{k}")
+    return "".join(reversed(parts)).lstrip(".")
+
+
+def parse_github_url(url: str):
+    """(owner, repo, ref, path, kind) de um link do GitHub, ou None."""
+    m = _GITHUB_RE.match(url)
+    if not m:
+        return None
+    owner = m.group("o1") or m.group("o2")
+    repo = m.group("r1") or m.group("r2")
+    ref = m.group("ref1") or m.group("ref2")
+    kind = m.group("kind") or "blob"
+    return owner, repo, unquote(ref), unquote(m.group("path") or ""), kind
+
+
+def list_local_files(site_root: str = SITE_ROOT) -> set:
+    """Todos os arquivos sob assets/ (caminhos relativos, com '/')."""
+    files = set()
+    base = os.path.join(site_root, "assets")
+    for dirpath, _, filenames in os.walk(base):
+        rel_dir = os.path.relpath(dirpath, site_root).replace(os.sep, "/")
+        for fn in filenames:
+            files.add(f"{rel_dir}/{fn}")
+    return files
+
+
+def site_references(site_root: str = SITE_ROOT) -> set:
+    """Imagens citadas direto no HTML/JS/CSS do site (placeholders, ícones...)."""
+    refs = set()
+    paths = []
+    for fonte in FONTES_SITE:
+        if fonte.startswith("*"):
+            paths += [os.path.join(site_root, f) for f in os.listdir(site_root) if f.endswith(fonte[1:])]
+        else:
+            for dirpath, _, filenames in os.walk(os.path.join(site_root, fonte)):
+                paths += [os.path.join(dirpath, f) for f in filenames]
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                refs.update(_ASSET_REF_RE.findall(f.read()))
+        except (OSError, UnicodeDecodeError):
+            continue
+    return refs
+
+
+def stem(path: str) -> str:
+    return path.rsplit(".", 1)[0]
+
+
+# =========================
+# VERIFICAÇÃO
+# =========================
+def verify(catalogs: dict = CATALOGOS, site_root: str = SITE_ROOT, trees: dict | None = None) -> dict:
+    """
+    Verifica todos os catálogos numa passada.
+    Retorna {"erros": [...], "avisos": [...], "orfaos": [...], "stats": {...}}.
+    """
+    trees = load_trees() if trees is None else trees
+    local_files = list_local_files(site_root)
+
+    erros, avisos = [], []
+    referenced = set()
+    sem_arvore = {}
+    prefixes = {}
+    stats = {"itens": 0, "assets": 0, "links": 0, "externos": 0}
+
+    for nome, path in catalogs.items():
+        if not os.path.exists(path):
+            avisos.append((nome, "-", "-", "catálogo não encontrado"))
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            itens = json.load(f)
+
+        for item in itens:
+            stats["itens"] += 1
+            item_id = item.get("id", "?")
+            for campo, valor in iter_refs(item):
+                if valor[0] == "a":
+                    stats["assets"] += 1
+                    referenced.add(valor)
+                    if valor not in local_files:
+                        erros.append((nome, item_id, format_path(campo), f"asset ausente: {valor}"))
+                    continue
+
+                # Prefixo até o ref (https://github.com/o/r/blob/main) resolvido uma vez só
+                parts = valor.split("/", 7)
+                host = parts[2]
+                if host == "raw.githubusercontent.com":
+                    parts = valor.split("/", 6)
+                    n_prefix = 6
+                elif host == "github.com":
+                    n_prefix = 7
+                else:
+                    stats["externos"] += 1
+                    continue
+                prefix = "/".join(parts[:n_prefix])
+                alvo = prefixes.get(prefix)
+                if alvo is None:
+                    gh = parse_github_url(prefix)
+                    alvo = prefixes[prefix] = gh and (gh, trees.get((gh[0].lower(), gh[1].lower())))
+                if not alvo:
+                    stats["externos"] += 1
+                    continue
+
+                stats["links"] += 1
+                (owner, repo, ref, _, kind), tree = alvo
+                if tree is None:
+                    sem_arvore[f"{owner}/{repo}"] = sem_arvore.get(f"{owner}/{repo}", 0) + 1
+                    continue
+                if tree["ref"] and ref != tree["ref"]:
+                    avisos.append((nome, item_id, format_path(campo),
+                                   f"link para ref '{ref}', listagem é de '{tree['ref']}'"))
+                rel = parts[n_prefix].rstrip("/") if len(parts) > n_prefix else ""
+                if kind == "tree":
+                    existe = rel == "" or rel in tree["trees_q"] or unquote(rel) in tree["trees"]
+                else:
+                    existe = rel in tree["blobs_q"] or unquote(rel) in tree["blobs"]
+                if not existe:
+                    erros.append((nome, item_id, format_path(campo),
+                                  f"não existe em {owner}/{repo}: {unquote(rel) or '/'}"))
+
+    for repo, n in sorted(sem_arvore.items()):
+        avisos.append(("-", "-", "-", f"{n} link(s) para {repo} sem listagem em cache (--atualizar-arvores)"))
+
+    # Órfãos: referenciado pelos catálogos ou pelo site (irmãos foo.png.webp/.avif contam)
+    referenced |= site_references(site_root)
+    referenced_stems = {stem(r) for r in referenced}
+    orfaos = sorted(
+        f for f in local_files
+        if any(f.startswith(p + "/") for p in PASTAS_PREVIEW)
+        and os.path.splitext(f)[1].lower() in EXTENSOES_IMG
+        and f not in referenced and stem(f) not in referenced and stem(f) not in referenced_stems
+    )
+
+    return {"erros": erros, "avisos": avisos, "orfaos": orfaos, "stats": stats}
+
+
+# =========================
+# MAIN
+# =========================
+def repos_citados(catalogs: dict = CATALOGOS) -> dict:
+    """{(owner, repo): ref} de todos os links do GitHub dos catálogos."""
+    repos = {}
+    for path in catalogs.values():
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                for _, valor in iter_refs(item):
+                    gh = parse_github_url(valor) if valor.startswith("https://") else None
+                    if gh:
+                        repos.setdefault((gh[0], gh[1]), gh[2])
+    return repos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica catálogos x assets x repositórios de origem (offline)")
+    parser.add_argument("--atualizar-arvores", action="store_true",
+                        help="baixa a listagem dos repositórios citados (1 chamada por repositório)")
+    parser.add_argument("--local-repo", action="append", default=[], metavar="OWNER/REPO=DIR",
+                        help="usa um clone local como listagem do repositório")
+    parser.add_argument("--orfaos-erro", action="store_true", help="trata arquivos órfãos como erro")
+    args = parser.parse_args(argv)
+
+    print(f"\n{'='*70}")
+    print(f"🔎 VERIFICADOR DE INTEGRIDADE")
+    print(f"{'='*70}\n")
+
+    locais = dict(spec.split("=", 1) for spec in args.local_repo)
+    if args.atualizar_arvores or locais:
+        for (owner, repo), ref in sorted(repos_citados().items()):
+            try:
+                if f"{owner}/{repo}" in locais:
+                    data = local_tree(locais[f"{owner}/{repo}"], ref)
+                elif args.atualizar_arvores:
+                    data = fetch_tree(owner, repo, ref)
+                else:
+                    continue
+            except Exception as e:
+                print(f"⚠️  Não foi possível listar {owner}/{repo}: {e}")
+                continue
+            save_tree(owner, repo, data)
+            print(f"🌳 {owner}/{repo}@{ref}: {len(data['blobs'])} arquivo(s), {len(data['trees'])} pasta(s)")
+        print()
+
+    inicio = time.perf_counter()
+    result = verify()
+    dt = (time.perf_counter() - inicio) * 1000
+
+    for catalogo, item_id, campo, msg in result["erros"]:
+        print(f"  ❌ [{catalogo}] {item_id} {campo}: {msg}")
+    for catalogo, item_id, campo, msg in result["avisos"]:
+        print(f"  ⚠️  [{catalogo}] {item_id} {campo}: {msg}" if item_id != "-" else f"  ⚠️  {msg}")
+    for path in result["orfaos"]:
+        print(f"  🗑️  órfão: {path}")
+
+    s = result["stats"]
+    print(f"\n📊 {s['itens']} item(ns), {s['assets']} asset(s), {s['links']} link(s) do GitHub, "
+          f"{s['externos']} link(s) externo(s) ignorado(s) — {dt:.1f} ms")
+    print(f"{'❌' if result['erros'] else '✅'} {len(result['erros'])} erro(s), "
+          f"{len(result['avisos'])} aviso(s), {len(result['orfaos'])} órfão(s)")
+
+    falhou = result["erros"] or (args.orfaos_erro and result["orfaos"])
+    return 1 if falhou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
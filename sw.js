@@ -0,0 +1,143 @@
+// ===============================
+// SERVICE WORKER - CACHE POR HASH DE CONTEÚDO
+// ===============================
+// Consome data/manifesto.json (gerado por data/manifesto.py):
+// - "arquivos": caminho -> URL versionada (?v=<hash do conteúdo>)
+// - "precache": URLs baixadas na instalação
+// Cada URL versionada é imutável: fica no cache até sair do manifesto.
+// Pedidos pelo caminho "cru" (ex.: assets/img/foo.png) são servidos pela
+// versão atual do manifesto, então só o que mudou é baixado de novo.
+// Os catálogos (data/*.json) vêm primeiro da rede: um manifesto atrasado não
+// pode servir um catálogo velho. A cópia versionada só vale offline.
+
+const CACHE_ASSETS = 'portfolio-assets';
+const MANIFESTO_URL = 'data/manifesto.json';
+
+let manifesto = null;       // { versao, arquivos, precache }
+let atualizacao = null;     // promise da última busca do manifesto
+
+// ===============================
+// MANIFESTO
+// ===============================
+
+async function buscarManifesto() {
+  const response = await fetch(MANIFESTO_URL, { cache: 'no-store' });
+  if (!response.ok) throw new Error(`HTTP ${response.status}`);
+  const novo = await response.json();
+
+  const cache = await caches.open(CACHE_ASSETS);
+  await cache.put(MANIFESTO_URL, new Response(JSON.stringify(novo)));
+  manifesto = novo;
+  await limparCache(cache, novo);
+  return novo;
+}
+
+async function manifestoAtual() {
+  if (manifesto) return manifesto;
+  const cache = await caches.open(CACHE_ASSETS);
+  const salvo = await cache.match(MANIFESTO_URL);
+  if (salvo) {
+    manifesto = await salvo.json();
+    return manifesto;
+  }
+  return buscarManifesto();
+}
+
+function atualizarManifesto() {
+  atualizacao = buscarManifesto().catch(error => {
+    console.warn('[sw] Manifesto indisponível:', error.message);
+    return manifesto;
+  });
+  return atualizacao;
+}
+
+// Remove do cache as versões que saíram do manifesto
+async function limparCache(cache, atual) {
+  const validas = new Set(Object.values(atual.arquivos).map(url => new URL(url, self.registration.scope).href));
+  validas.add(new URL(MANIFESTO_URL, self.registration.scope).href);
+  const chaves = await cache.keys();
+  await Promise.all(chaves.filter(req => !validas.has(req.url)).map(req => cache.delete(req)));
+}
+
+// ===============================
+// CICLO DE VIDA
+// ===============================
+
+self.addEventListener('install', event => {
+  event.waitUntil((async () => {
+    const atual = await buscarManifesto();
+    const cache = await caches.open(CACHE_ASSETS);
+    const faltando = [];
+    for (const url of atual.precache) {
+      if (!(await cache.match(url))) faltando.push(url);
+    }
+    // Um por um: uma URL que falhe não derruba a instalação (entra no cache depois)
+    const resultados = await Promise.allSettled(faltando.map(url => cache.add(url)));
+    const falhas = resultados.filter(r => r.status === 'rejected').length;
+    if (falhas) console.warn(`[sw] ${falhas} URL(s) do precache indisponível(is)`);
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil(self.clients.claim());
+});
+
+// ===============================
+// FETCH
+// ===============================
+
+function caminhoLogico(request) {
+  const url = new URL(request.url);
+  const scope = new URL(self.registration.scope);
+  if (url.origin !== scope.origin || !url.pathname.startsWith(scope.pathname)) return null;
+  return decodeURIComponent(url.pathname.slice(scope.pathname.length));
+}
+
+async function servirVersionado(request) {
+  // Se uma navegação acabou de pedir o manifesto novo, espera por ele
+  const atual = await (atualizacao || manifestoAtual());
+  const caminho = caminhoLogico(request);
+  const versionada = atual && caminho !== null ? atual.arquivos[caminho] : null;
+  if (!versionada) return fetch(request);
+
+  const cache = await caches.open(CACHE_ASSETS);
+  const salvo = await cache.match(versionada);
+  if (salvo) return salvo;
+
+  const response = await fetch(versionada);
+  if (response.ok) await cache.put(versionada, response.clone());
+  return response;
+}
+
+// Catálogos: rede primeiro (revalidando o cache HTTP), versão do manifesto se offline
+async function servirDados(request) {
+  try {
+    const response = await fetch(request, { cache: 'no-cache' });
+    if (response.ok) return response;
+  } catch (error) {
+    // offline: cai para a cópia versionada abaixo
+  }
+  return servirVersionado(request);
+}
+
+function ehDados(caminho) {
+  return caminho.startsWith('data/') && caminho.endsWith('.json');
+}
+
+self.addEventListener('fetch', event => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+
+  // Página nova: confere se o manifesto mudou (o HTML continua vindo da rede)
+  if (request.mode === 'navigate') {
+    event.waitUntil(atualizarManifesto());
+    return;
+  }
+
+  const caminho = caminhoLogico(request);
+  if (caminho === null || caminho === MANIFESTO_URL) return;
+
+  const servir = ehDados(caminho) ? servirDados : servirVersionado;
+  event.respondWith(servir(request).catch(() => fetch(request)));
+});